@@ -0,0 +1,40 @@
+"""The stdlib-only helper modules demo/ shares with test/.
+
+``test/_scenario_actions.py`` (the duration and scenario action grammar) and
+``test/_bench_util.py`` (the percentile every latency report uses) are
+single copies that fake-service (test/) and scenario-runner (demo/) both
+need.
+Each module is loaded from its file and registered in ``sys.modules``
+under its own name, so nothing is added to ``sys.path`` and the rest of
+test/ stays out of demo's import namespace.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).resolve().parent.parent / "test"
+
+
+def _load(name: str):
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, TEST_DIR / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+_bench_util = _load("_bench_util")
+_scenario_actions = _load("_scenario_actions")
+
+percentile = _bench_util.percentile
+
+DEFAULT_RAMP_SECONDS = _scenario_actions.DEFAULT_RAMP_SECONDS
+expand_actions = _scenario_actions.expand_actions
+parse_control = _scenario_actions.parse_control
+parse_duration = _scenario_actions.parse_duration
+parse_offset = _scenario_actions.parse_offset
+phase_duration = _scenario_actions.phase_duration
+plan_phases = _scenario_actions.plan_phases
@@ -527,6 +527,9 @@ cmd_scenario() {
 
     # Pacing between steps (seconds); override with DEMO_PAUSE=0 for fast runs
     local PAUSE="${DEMO_PAUSE:-3}"
+    # Scenario time compression (scenario-runner --speed); the pipeline's own
+    # intervals do not compress, see the stage report in scenario-runner.log
+    local SPEED="${DEMO_SPEED:-1}"
 
     # Colored output prefixes
     local C_MEASURE=$'\033[35m'   # purple
@@ -607,24 +610,58 @@ cmd_scenario() {
     clog "$C_GENERATE" "generate" "scenario-runner driving fake-services through cascading-failure scenario"
     python3 "$SCENARIO_RUNNER" \
         --scenario "$SCENARIO_FILE" \
-        --base-url "http://localhost" >> "$OUTPUT_DIR/scenario-runner.log" 2>&1 &
+        --base-url "http://localhost" \
+        --speed "$SPEED" \
+        --prometheus-url "$PROMETHEUS_URL" \
+        --stage "worker cycle=10s" >> "$OUTPUT_DIR/scenario-runner.log" 2>&1 &
     local SCENARIO_PID=$!
 
     info "Waiting for degradation to ramp..."
-    sleep 35
+    sleep "$(awk -v speed="$SPEED" 'BEGIN { printf "%.1f", 35 / speed }')"
 
     # ── Step 3: Detect Breach ──────────────────────────────
     header "Step 3: Detect Breach"
     clog "$C_MEASURE" "measure" "waiting for measure worker to emit quality_breach for fraud-detect..."
-    local breach_out
-    breach_out=$($RUN_BENCH python "$ASSERTIONS" wait-verdict-type quality_breach \
-        --service fraud-detect --core-url "$CORE_URL" \
-        --timeout 180 --interval 2) \
+    # Steps 3, 5 and 6 wait on one chained batch (breach → snapshot →
+    # triage → case): one interpreter and one core connection instead of a
+    # `uv run` per wait. Each wait starts when the previous one resolves,
+    # so the per-step timeouts keep their meaning. The batch streams each
+    # entry's KEY=value lines in order on fd 7 as it resolves, and each
+    # step reads up to the key it needs (read_chain) while the later waits
+    # carry on in the background. A dead batch closes fd 7 without a
+    # BATCH_FAILED line, which read_chain reports as a failure.
+    exec 7< <($RUN_BENCH python "$ASSERTIONS" batch --core-url "$CORE_URL" <<EOF
+{"id": "breach", "prefix": "BREACH_", "argv": ["wait-verdict-type", "quality_breach", "--service", "fraud-detect", "--timeout", "180", "--interval", "2"]}
+{"id": "snapshot", "prefix": "SNAP_", "after": ["breach"], "argv": ["wait-assessment-kind", "correlation_snapshot", "--timeout", "60", "--interval", "2"]}
+{"id": "triage", "prefix": "TRIAGE_", "after": ["snapshot"], "argv": ["wait-verdict-type", "triage", "--timeout", "60", "--interval", "1"]}
+{"id": "case", "after": ["triage"], "argv": ["wait-case", "--service", "fraud-detect", "--timeout", "30", "--interval", "1"]}
+EOF
+    )
+
+    # read_chain KEY — eval the chain's lines until KEY (the last key the
+    # entry prints) is set; returns 1 when the batch reports BATCH_FAILED
+    # (or exits) first.
+    read_chain() {
+        local key="$1" line
+        while IFS= read -r -u 7 line; do
+            eval "$line"
+            [[ "$line" == "$key="* ]] && return 0
+            [[ "$line" == BATCH_FAILED=* ]] && return 1
+        done
+        return 1
+    }
+
+    # end_chain — close fd 7 and let scenario-runner finish before returning.
+    end_chain() {
+        exec 7<&-
+        wait $SCENARIO_PID 2>/dev/null || true
+    }
+
+    read_chain BREACH_VERDICT_SERVICE \
         || { clog "$C_MEASURE" "measure" "no quality_breach after 180s — services may have recovered"; \
-             wait $SCENARIO_PID 2>/dev/null || true; return; }
-    eval "$breach_out"
-    local QUALITY_BREACH_ID="$VERDICT_ID"
-    clog "$C_MEASURE" "measure" "BREACH detected — verdict $QUALITY_BREACH_ID at $VERDICT_CREATED_AT"
+             end_chain; return; }
+    local QUALITY_BREACH_ID="$BREACH_VERDICT_ID"
+    clog "$C_MEASURE" "measure" "BREACH detected — verdict $QUALITY_BREACH_ID at $BREACH_VERDICT_CREATED_AT"
 
     # ── Step 4: Budget Explanation ──────────────────────────
     header "Step 4: Budget Explanation"
@@ -662,37 +699,28 @@ cmd_scenario() {
     # ── Step 5: Correlate ────────────────────────────────
     header "Step 5: Correlate"
     clog "$C_CORRELATE" "correlate" "waiting for correlation_snapshot from correlate worker..."
-    local snap_out
-    snap_out=$($RUN_BENCH python "$ASSERTIONS" wait-assessment-kind correlation_snapshot \
-        --core-url "$CORE_URL" --timeout 60 --interval 2) \
+    read_chain SNAP_ASSESSMENT_SERVICE \
         || { clog "$C_CORRELATE" "correlate" "no correlation_snapshot in 60s"; \
-             wait $SCENARIO_PID 2>/dev/null || true; return; }
-    eval "$snap_out"
-    local CORR_SNAPSHOT_ID="$ASSESSMENT_ID"
+             end_chain; return; }
+    local CORR_SNAPSHOT_ID="$SNAP_ASSESSMENT_ID"
     clog "$C_CORRELATE" "correlate" "snapshot: $CORR_SNAPSHOT_ID"
 
     # ── Step 6: Respond + Learn ─────────────────────────
     header "Step 6: Respond + Learn"
     clog "$C_RESPOND" "respond" "waiting for triage verdict from respond worker..."
-    local triage_out
-    triage_out=$($RUN_BENCH python "$ASSERTIONS" wait-verdict-type triage \
-        --core-url "$CORE_URL" --timeout 60 --interval 1) \
+    read_chain TRIAGE_VERDICT_SERVICE \
         || { clog "$C_RESPOND" "respond" "no triage verdict in 60s"; \
-             wait $SCENARIO_PID 2>/dev/null || true; return; }
-    eval "$triage_out"
-    local TRIAGE_ID="$VERDICT_ID"
+             end_chain; return; }
+    local TRIAGE_ID="$TRIAGE_VERDICT_ID"
     clog "$C_RESPOND" "respond" "triage: $TRIAGE_ID"
 
     # Case (operator queue entry) — created eagerly by respond at incident open
-    local case_out
-    case_out=$($RUN_BENCH python "$ASSERTIONS" wait-case \
-        --service fraud-detect --core-url "$CORE_URL" \
-        --timeout 30 --interval 1) \
-        || warn "no case visible in 30s"
-    if [[ -n "$case_out" ]]; then
-        eval "$case_out"
+    if read_chain CASE_UNDERLYING_VERDICT; then
         clog "$C_RESPOND" "respond" "case (bench queue): $CASE_ID  priority=$CASE_PRIORITY"
+    else
+        warn "no case visible in 30s"
     fi
+    exec 7<&-
 
     # Wait for scenario-runner to finish — its Recovery phase resets the
     # fake-services so learn's retrospective lands while the breach has
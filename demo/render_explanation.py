@@ -46,6 +46,53 @@ from nthlayer_workers.observe.store import MemoryAssessmentStore
 _ENGINE_INPUT_KINDS = ("slo_status", "drift_signal")
 
 
+async def _iter_kind(client: CoreAPIClient, service: str, kind: str):
+    """Yield raw ``kind`` assessments for ``service``, streaming when possible.
+
+    Feature-detected: ``CoreAPIClient.iter_assessments`` walks core's
+    keyset-paginated NDJSON stream (``(created_at, id)`` cursor), so the
+    whole history arrives row by row without a page-size guess. A stream
+    that fails before its first row (client or core without it) falls back
+    to the bounded ``get_assessments`` call; one that fails part-way keeps
+    the rows already received.
+    """
+    stream = getattr(client, "iter_assessments", None)
+    if stream is not None:
+        received = 0
+        try:
+            async for raw in stream(service=service, kind=kind):
+                received += 1
+                yield raw
+            return
+        except Exception as exc:
+            if received:
+                print(
+                    f"  ({kind} stream for {service} interrupted after {received} "
+                    f"rows: {exc.__class__.__name__}: {exc})",
+                    file=sys.stderr,
+                )
+                return
+
+    # Explicit high limit. NB: limit=0 on the core API means literal
+    # "return zero rows", NOT "return all" — surfaced as a real
+    # regression during 42y.9's E2E verification (the engine ran
+    # against an empty store and returned no explanations). limit=200
+    # covers ~40 collect cycles per SLO at the 5s demo interval,
+    # plenty of headroom for the demo scenario's 2-minute window
+    # while keeping the per-service fetch bounded.
+    result = await client.get_assessments(
+        service=service, kind=kind, limit=200,
+    )
+    if not result.ok:
+        print(
+            f"  ({kind} fetch failed for {service}: {result.error})",
+            file=sys.stderr,
+        )
+        return
+    for raw in (result.data or []):
+        yield raw
+
+
 async def _populate_store(
     client: CoreAPIClient, service: str, store: MemoryAssessmentStore,
 ) -> None:
@@ -54,25 +101,18 @@ async def _populate_store(
     Per-kind iteration so a failure on one kind doesn't lose the other.
     Duplicate ids inside the store are silently skipped — the store
     rejects re-puts and we don't care about idempotency here.
+
+    ExplanationEngine explains each SLO from its newest slo_status only,
+    and rows arrive newest first, so an slo_status whose SLO is already
+    staged is dropped as it streams past: the store holds one per SLO, not
+    the service's whole history. SLOs are keyed on ``data.slo_name``, as
+    everywhere else in the tree. drift_signal rows are all staged — the
+    engine's use of them is not ours to second-guess — so the store still
+    grows with drift history.
     """
+    staged_slos: set[str] = set()
     for kind in _ENGINE_INPUT_KINDS:
-        # Explicit high limit. NB: limit=0 on the core API means literal
-        # "return zero rows", NOT "return all" — surfaced as a real
-        # regression during 42y.9's E2E verification (the engine ran
-        # against an empty store and returned no explanations). limit=200
-        # covers ~40 collect cycles per SLO at the 5s demo interval,
-        # plenty of headroom for the demo scenario's 2-minute window
-        # while keeping the per-service fetch bounded.
-        result = await client.get_assessments(
-            service=service, kind=kind, limit=200,
-        )
-        if not result.ok:
-            print(
-                f"  ({kind} fetch failed for {service}: {result.error})",
-                file=sys.stderr,
-            )
-            continue
-        for raw in (result.data or []):
+        async for raw in _iter_kind(client, service, kind):
             try:
                 assessment = from_dict(raw)
             except Exception as exc:
@@ -84,6 +124,12 @@ async def _populate_store(
                     file=sys.stderr,
                 )
                 continue
+            if kind == "slo_status":
+                name = assessment.data.get("slo_name")
+                if name in staged_slos:
+                    continue
+                if name is not None:
+                    staged_slos.add(name)
             # Duplicate id — same record already staged. Fine.
             with contextlib.suppress(ValueError):
                 store.put(assessment)
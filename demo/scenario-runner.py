@@ -7,15 +7,78 @@ NthLayer detects and responds on its own — this script does NOT invoke NthLaye
 
 Usage:
     python demo/scenario-runner.py --scenario demo/scenario-cascading-failure.yaml [--base-url http://localhost]
+
+Phase boundaries are scheduled on one absolute timeline. All actions of a
+phase are dispatched concurrently at the phase's target instant over pooled
+keep-alive connections (one unreachable service cannot hold up the rest),
+and each dispatch records its skew against that instant. --dispatch-log
+writes one JSON line per dispatch for detection-latency attribution.
+Services that share a port (one multi-tenant fake-service) are addressed
+as /control/<name> and /reset/<name>.
+
+Actions can also fire inside a phase, down to the millisecond: at: offsets,
+repeating every: (with until:/count:), per-firing jitter:, services: lists
+with a stagger: between them, and control: lists cycled on each repeat
+(parsed by test/_scenario_actions.py, shared with fake-service backfill).
+All of them sit on one heap-ordered timeline; see "Scenario execution".
+
+--speed N compresses the whole run N× (fake-service ramps and traffic
+included) and ends with a report of the pipeline stages — generator tick,
+scrape and rule intervals, range windows, --stage extras — whose fixed
+wall-clock interval spans more than a phase at that speed.
+
+--core-url watches nthlayer-core while the scenario runs and reports, per
+phase and service, the seconds from each phase's first control action to
+the first assessment, quality_breach, correlation_snapshot, triage verdict
+and case (created_at). With --repeat N the report gives p50/p95/max across
+runs as JSON (stdout, or --report PATH):
+
+    uv run --directory nthlayer-bench python demo/scenario-runner.py \
+        --scenario demo/scenario-cascading-failure.yaml \
+        --core-url http://localhost:8000 --repeat 5 --report detect.json
+
+--soak 4h loops the scenario for hours instead: each cycle shuffles the
+phase order, scales phase durations 0.5-1.5× and moves actions onto random
+services of the same type. Meanwhile it samples RSS and open FDs of the
+core/worker process trees, the SQLite store and its WAL, and API latency,
+fits a growth slope per metric and exits 1 when one beats --max-slope:
+
+    python demo/scenario-runner.py --scenario demo/scenario-cascading-failure.yaml \
+        --soak 4h --soak-process core=demo-output/core.pid \
+        --soak-process workers=demo-output/workers.pid \
+        --soak-db demo-output/three-tier.db \
+        --soak-endpoint core=http://localhost:8000/health \
+        --max-slope '*.rss_mb=20/h' --max-slope '*.fds=2/h' --max-slope 'db.wal_mb=50/h'
+
+--simulate contacts nothing: it replays the same action timeline against
+the fake-service traffic model (demo/scenario_sim.py, needs numpy) and
+predicts, to the millisecond, when each SLO in --specs breaches and
+recovers. Comparing it with a live run separates pipeline latency from
+the time the scenario itself takes to push an SLI over its target.
 """
 
 import argparse
+import asyncio
+import bisect
+import contextlib
+import datetime as dt
+import fnmatch
+import functools
+import heapq
+import http.client
+import itertools
 import json
+import os
+import queue
+import random
+import re
 import signal
 import sys
+import threading
 import time
-import urllib.error
-import urllib.request
+import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
 
 try:
     import yaml
@@ -23,6 +86,20 @@ except ImportError:
     print("pyyaml is required: pip install pyyaml")
     sys.exit(1)
 
+from _shared import (
+    expand_actions,
+    parse_duration,
+    parse_offset,
+    percentile,
+    phase_duration,
+    plan_phases,
+)
+
+try:
+    from nthlayer_common.api_client import CoreAPIClient
+except ImportError:  # only needed for --core-url
+    CoreAPIClient = None
+
 # ---------------------------------------------------------------------------
 # ANSI colour helpers
 # ---------------------------------------------------------------------------
@@ -59,11 +136,12 @@ def header(text: str) -> str:
     )
 
 
-def phase_banner(name: str, duration: int, index: int) -> str:
+def phase_banner(name: str, duration: float, index: int, speed: float = 1.0) -> str:
     c = PHASE_COLOURS[index % len(PHASE_COLOURS)]
     tag = colour(f" PHASE {index + 1} ", BOLD, BG_BLACK, c)
     label = colour(f" {name} ", BOLD, c)
-    dur = colour(f"[{duration}s]", DIM)
+    compressed = f" at {speed:g}× = {duration / speed:.3g}s" if speed != 1 else ""
+    dur = colour(f"[{duration:g}s{compressed}]", DIM)
     return f"\n{tag}{label}{dur}"
 
 
@@ -71,79 +149,337 @@ def phase_banner(name: str, duration: int, index: int) -> str:
 # HTTP helpers
 # ---------------------------------------------------------------------------
 
-def post_json(url: str, payload: dict | None = None, timeout: int = 5) -> dict | None:
-    body = json.dumps(payload or {}).encode("utf-8")
-    req = urllib.request.Request(
-        url,
-        data=body,
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
-    try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            raw = resp.read()
-            return json.loads(raw) if raw else {}
-    except urllib.error.HTTPError as exc:
-        print(colour(f"  HTTP {exc.code} from {url}", RED))
-        return None
-    except urllib.error.URLError as exc:
-        print(colour(f"  Connection error for {url}: {exc.reason}", RED))
-        return None
+class ConnectionPool:
+    """Idle keep-alive connections per host:port, reused across dispatches.
+
+    At most ``per_host`` connections are open to one host:port, so a burst
+    of concurrent dispatches queues here instead of opening a connection
+    per action against fake-service's bounded worker pool.
+    """
+
+    def __init__(self, timeout: float, per_host: int = 4):
+        self.timeout = timeout
+        self.per_host = max(per_host, 1)
+        self._idle: dict[tuple[str, int], list[http.client.HTTPConnection]] = {}
+        self._slots: dict[tuple[str, int], threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, host: str, port: int) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get((host, port))
+            if slot is None:
+                slot = self._slots[(host, port)] = threading.BoundedSemaphore(self.per_host)
+            return slot
+
+    def _checkout(self, host: str, port: int) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get((host, port))
+            if idle:
+                return idle.pop(), True
+        return http.client.HTTPConnection(host, port, timeout=self.timeout), False
+
+    def _checkin(self, host: str, port: int, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault((host, port), []).append(conn)
+
+    def request(self, method: str, url: str,
+                payload: dict | None = None) -> tuple[int, bytes, float]:
+        """Send one request, returning (status, body, monotonic send time).
+
+        The send time is taken once a connection slot is held, so waiting on
+        the per-host limit counts as dispatch skew. Raises OSError /
+        http.client.HTTPException on failure.
+        """
+        parts = urllib.parse.urlsplit(url)
+        host, port = parts.hostname or "localhost", parts.port or 80
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        with self._slot(host, port):
+            path = f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path or "/"
+            return self._request(host, port, method, path, body, headers)
+
+    def _request(self, host: str, port: int, method: str, path: str, body: bytes | None,
+                 headers: dict) -> tuple[int, bytes, float]:
+        sent = time.monotonic()
+        conn, reused = self._checkout(host, port)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+        except (ConnectionError, http.client.RemoteDisconnected):
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped an idle keep-alive connection; retry fresh.
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                resp = conn.getresponse()
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+        data = resp.read()
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin(host, port, conn)
+        return resp.status, data, sent
+
+    def close(self) -> None:
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+class Dispatcher:
+    """Fires a phase's actions concurrently at one target instant and records skew."""
+
+    def __init__(self, timeout: float, concurrency: int, per_host: int,
+                 log_path: str | None = None):
+        self.pool = ConnectionPool(timeout, per_host)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency,
+                                            thread_name_prefix="dispatch")
+        self._log_path = log_path
+        self._log_lock = threading.Lock()
+        self._pending: set[Future] = set()
+
+    def warm_up(self, urls: list[str]) -> None:
+        """Open a keep-alive connection per endpoint so phase 1 pays no connect."""
+        list(self._executor.map(self._probe, urls))
+
+    def _probe(self, url: str) -> None:
+        parts = urllib.parse.urlsplit(url)
+        with contextlib.suppress(OSError, http.client.HTTPException):
+            self.pool.request("GET", f"{parts.scheme}://{parts.netloc}/health")
+
+    def submit(self, phase: str, jobs: list[dict], target: float,
+               on_record=None) -> list[Future]:
+        """Queue every job for monotonic instant ``target`` without waiting.
 
+        Each job is {"service", "kind", "url", "payload"}. Workers sleep until
+        the target themselves. Jobs are submitted round-robin across ports,
+        so a port with many services queues behind its own connection limit
+        rather than delaying every other port. Each future resolves to the
+        job's record; ``on_record(job, record)`` runs on the worker thread.
+        """
+        by_port: dict[str, list[int]] = {}
+        for i, job in enumerate(jobs):
+            by_port.setdefault(urllib.parse.urlsplit(job["url"]).netloc, []).append(i)
+        order = [i for batch in itertools.zip_longest(*by_port.values()) for i in batch
+                 if i is not None]
+        futures = {i: self._executor.submit(self._run, phase, jobs[i], target, on_record)
+                   for i in order}
+        with self._log_lock:
+            self._pending.update(futures.values())
+        return [futures[i] for i in range(len(jobs))]
 
-def control_service(base_url: str, port: int, control: str | dict) -> None:
-    """Send a control or reset action to a fake service."""
+    def dispatch(self, phase: str, jobs: list[dict], target: float) -> list[dict]:
+        """POST every job at monotonic instant ``target``; returns one record per job."""
+        return [future.result() for future in self.submit(phase, jobs, target)]
+
+    def wait_idle(self) -> None:
+        """Block until every submitted job has completed."""
+        with self._log_lock:
+            pending, self._pending = self._pending, set()
+        wait(pending)
+
+    def _run(self, phase: str, job: dict, target: float, on_record) -> dict:
+        delay = target - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            status, _, sent = self.pool.request("POST", job["url"], job["payload"])
+            error = None if 200 <= status < 300 else f"HTTP {status}"
+        except (OSError, http.client.HTTPException) as exc:
+            status, error, sent = 0, f"{type(exc).__name__}: {exc}", time.monotonic()
+        done = time.monotonic()
+        wall_offset = time.time() - done
+        record = {
+            "phase": phase,
+            "service": job["service"],
+            "kind": job["kind"],
+            "url": job["url"],
+            "target_unix": round(target + wall_offset, 6),
+            "sent_unix": round(sent + wall_offset, 6),
+            "skew_ms": round((sent - target) * 1000, 3),
+            "ack_ms": round((done - target) * 1000, 3),
+            "ok": error is None,
+            "status": status,
+            "error": error,
+        }
+        if self._log_path:
+            with self._log_lock, open(self._log_path, "a") as fh:
+                fh.write(json.dumps(record) + "\n")
+        if on_record is not None:
+            on_record(job, record)
+        return record
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.pool.close()
+
+
+def control_url(base_url: str, services: dict, svc_name: str, route: str) -> str:
+    """/control or /reset URL for a service; shared ports get the per-service route."""
+    port = services[svc_name]["port"]
+    shared = sum(1 for svc in services.values() if svc.get("port") == port) > 1
+    return f"{base_url}:{port}/{route}/{svc_name}" if shared else f"{base_url}:{port}/{route}"
+
+
+def build_job(base_url: str, services: dict, svc_name: str, control: str | dict) -> dict | None:
+    """Turn one phase action into a dispatch job (None for an unknown control value)."""
     if control == "reset":
-        url = f"{base_url}:{port}/reset"
-        result = post_json(url)
-        status = colour("reset", GREEN) if result is not None else colour("reset (failed)", RED)
-        print(f"  {colour('→', DIM)} :{port}/reset  {status}")
-    elif isinstance(control, dict):
-        url = f"{base_url}:{port}/control"
-        result = post_json(url, control)
-        params = "  ".join(f"{k}={v}" for k, v in control.items())
-        status = colour("ok", GREEN) if result is not None else colour("failed", RED)
-        print(f"  {colour('→', DIM)} :{port}/control  {colour(params, YELLOW)}  {status}")
+        return {"service": svc_name, "kind": "reset", "payload": {},
+                "url": control_url(base_url, services, svc_name, "reset")}
+    if isinstance(control, dict):
+        return {"service": svc_name, "kind": "control", "payload": control,
+                "url": control_url(base_url, services, svc_name, "control")}
+    return None
+
+
+def format_dispatch(job: dict, record: dict) -> str:
+    path = urllib.parse.urlsplit(job["url"])
+    where = f":{path.port}{path.path}"
+    if record["ok"]:
+        status = colour("reset" if job["kind"] == "reset" else "ok", GREEN)
     else:
-        print(colour(f"  Unknown control value: {control!r}", RED))
+        status = colour(f"failed ({record['error']})", RED)
+    params = ""
+    if job["kind"] == "control":
+        params = "  " + colour("  ".join(f"{k}={v}" for k, v in job["payload"].items()), YELLOW)
+    timing = colour(f"skew {record['skew_ms']:.1f} ms, ack {record['ack_ms']:.1f} ms", DIM)
+    return f"  {colour('→', DIM)} {colour(job['service'], BOLD)} {where}{params}  {status}  {timing}"
+
+
+def format_phase_skew(records: list[dict]) -> str | None:
+    if len(records) < 2:
+        return None
+    skews = [r["skew_ms"] for r in records]
+    failed = sum(1 for r in records if not r["ok"])
+    summary = (f"  {len(records)} actions: skew p50 {percentile(skews, 50):.1f} ms, "
+               f"max {max(skews):.1f} ms, all acked within "
+               f"{max(r['ack_ms'] for r in records):.1f} ms")
+    if failed:
+        summary += f", {failed} failed"
+    return colour(summary, DIM)
 
 
 # ---------------------------------------------------------------------------
-# Countdown timer
+# Progress display
 # ---------------------------------------------------------------------------
 
-def countdown(phase_name: str, duration: int) -> None:
-    """Display an inline countdown that overwrites itself each second."""
-    start = time.monotonic()
-    try:
-        for elapsed in range(duration):
-            bar_width = 30
-            filled = int(bar_width * elapsed / duration)
-            bar = colour("█" * filled, GREEN) + colour("░" * (bar_width - filled), DIM)
-            line = (
-                f"  {colour('▶', CYAN)} "
-                f"{colour(phase_name, BOLD)} "
-                f"[{bar}] "
-                f"{colour(f'{elapsed + 1}s', YELLOW)}/{colour(f'{duration}s', DIM)}"
-            )
-            print(f"\r{line}", end="", flush=True)
-            # Sleep until the next whole second relative to start
-            target = start + elapsed + 1
+class Progress:
+    """Phase banners, dispatch lines and the countdown bar, drawn on their own thread.
+
+    The scheduler and dispatch workers only post lines; redrawing happens
+    here, so a slow terminal never delays an action. On a terminal the bar
+    is redrawn when the displayed second changes or new lines arrive;
+    piped output only gets the final bar of each phase.
+    """
+
+    BAR_WIDTH = 30
+
+    def __init__(self, timeline: list[tuple[float, float, dict]], speed: float = 1.0):
+        self.timeline = timeline          # (monotonic start, wall duration, phase)
+        self.speed = speed
+        self._lines: queue.SimpleQueue = queue.SimpleQueue()
+        self._records: dict[int, list[dict]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="progress", daemon=True)
+        self._live = sys.stdout.isatty()
+        self._current = -1                # phase whose banner is on screen
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def post(self, index: int, line: str) -> None:
+        """Print ``line`` under phase ``index`` (its banner is drawn first if due)."""
+        self._lines.put((index, line))
+
+    def record(self, index: int, job: dict, record: dict) -> None:
+        with self._lock:
+            self._records.setdefault(index, []).append(record)
+        self.post(index, format_dispatch(job, record))
+
+    def _phase_at(self, now: float) -> int:
+        index = 0
+        for i, (start, _, _) in enumerate(self.timeline):
+            if start <= now:
+                index = i
+        return index
+
+    def _bar(self, index: int, now: float, final: bool = False) -> str:
+        start, duration, phase = self.timeline[index]
+        name = colour(phase["name"], BOLD)
+        total = colour(f"{duration:g}s", DIM)
+        if final:
+            bar = colour("█" * self.BAR_WIDTH, GREEN)
+            return f"  {colour('✓', GREEN)} {name} [{bar}] {colour(f'{duration:g}s', GREEN)}/{total}"
+        elapsed = min(max(now - start, 0.0), duration)
+        filled = int(self.BAR_WIDTH * elapsed / duration) if duration else self.BAR_WIDTH
+        bar = colour("█" * filled, GREEN) + colour("░" * (self.BAR_WIDTH - filled), DIM)
+        shown = min(int(elapsed) + 1, duration)
+        return f"  {colour('▶', CYAN)} {name} [{bar}] {colour(f'{shown:g}s', YELLOW)}/{total}"
+
+    def _banner(self, index: int) -> None:
+        _, duration, phase = self.timeline[index]
+        print(phase_banner(phase["name"], duration * self.speed, index, self.speed))
+        description = phase.get("description", "").strip()
+        if description:
+            print(colour(f"  {description}", DIM))
+
+    def _finish(self, index: int) -> None:
+        print(f"\r\033[K{self._bar(index, 0.0, final=True)}")
+        with self._lock:
+            summary = format_phase_skew(self._records.get(index, []))
+        if summary:
+            print(summary)
+
+    def _advance(self, index: int) -> None:
+        while self._current < index:
+            if self._current >= 0:
+                self._finish(self._current)
+            self._current += 1
+            self._banner(self._current)
+
+    def _drain(self) -> bool:
+        printed = False
+        while not self._lines.empty():
+            index, line = self._lines.get()
+            self._advance(index)
+            print(f"\r\033[K{line}")
+            printed = True
+        return printed
+
+    def _run(self) -> None:
+        drawn = None
+        while True:
+            stopping = self._stop.wait(0.05)
             now = time.monotonic()
-            if target > now:
-                time.sleep(target - now)
-        # Final tick
-        bar = colour("█" * bar_width, GREEN)
-        line = (
-            f"  {colour('✓', GREEN)} "
-            f"{colour(phase_name, BOLD)} "
-            f"[{bar}] "
-            f"{colour(f'{duration}s', GREEN)}/{colour(f'{duration}s', DIM)}"
-        )
-        print(f"\r{line}", flush=True)
-    except KeyboardInterrupt:
-        print()  # newline before re-raising
-        raise
+            current = self._current
+            printed = self._drain()
+            self._advance(self._phase_at(now))
+            if printed or self._current != current:
+                drawn = None
+            if stopping:
+                self._drain()
+                self._finish(self._current)
+                sys.stdout.flush()
+                return
+            current = self._current
+            key = (current, int(now - self.timeline[current][0]))
+            if self._live and key != drawn:
+                print(f"\r{self._bar(current, now)}", end="", flush=True)
+                drawn = key
 
 
 # ---------------------------------------------------------------------------
@@ -156,57 +492,739 @@ def load_scenario(path: str) -> dict:
     return data["scenario"]
 
 
-def run_scenario(scenario: dict, base_url: str) -> None:
+class Scheduler:
+    """Min-heap of timed entries on the monotonic clock, run from one thread.
+
+    Entries are popped ``lead`` seconds early along with their exact due
+    time; dispatch workers sleep out the remainder, so the hand-off to the
+    thread pool adds no skew. Entries due at the same instant are passed
+    to the callback together.
+    """
+
+    def __init__(self, lead: float = 0.02):
+        self.lead = lead
+        self._heap: list[tuple[float, int, tuple]] = []
+        self._seq = itertools.count()
+
+    def at(self, when: float, entry: tuple) -> None:
+        heapq.heappush(self._heap, (when, next(self._seq), entry))
+
+    def run(self, fire) -> None:
+        """Call ``fire(when, entries)`` for each due instant until the heap is empty."""
+        while self._heap:
+            when = self._heap[0][0]
+            delay = when - self.lead - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+                continue
+            entries = []
+            while self._heap and self._heap[0][0] == when:
+                entries.append(heapq.heappop(self._heap)[2])
+            fire(when, entries)
+
+
+def plan_scenario(scenario: dict, speed: float = 1.0) -> list[tuple[float, list]]:
+    """(wall duration, action specs) per phase.
+
+    Every action is validated up front so a typo surfaces before phase 1;
+    invalid ones are reported and dropped.
+    """
+    def skip(i: int, phase: dict, exc: Exception) -> None:
+        print(colour(f"  Phase {i + 1} ({phase['name']}): skipping action: {exc}", RED))
+
+    return plan_phases(scenario, speed=speed, on_error=skip)
+
+
+def run_scenario(scenario: dict, base_url: str, dispatcher: Dispatcher,
+                 seed: int | None = None, speed: float = 1.0,
+                 stages: list[tuple[str, float, int]] | None = None,
+                 on_dispatch=None) -> None:
     services = scenario.get("services", {})
     phases = scenario.get("phases", [])
+    rng = random.Random(seed)
 
     print(header(scenario["name"]))
     if "description" in scenario:
         print(colour(scenario["description"].strip(), DIM))
 
-    for i, phase in enumerate(phases):
-        name = phase["name"]
-        duration = int(phase.get("duration", 10))
-        description = phase.get("description", "").strip()
-        actions = phase.get("actions", [])
+    plans = plan_scenario(scenario, speed)
+    dispatcher.warm_up(sorted({f"{base_url}:{svc['port']}" for svc in services.values()}))
+    if speed != 1:
+        set_service_speed(scenario, base_url, dispatcher, speed)
 
-        print(phase_banner(name, duration, i))
-        if description:
-            print(colour(f"  {description}", DIM))
+    # Absolute timeline: phase i starts at t0 + the sum of earlier durations.
+    scheduler = Scheduler()
+    timeline = []
+    t0 = phase_start = time.monotonic() + scheduler.lead
+    for phase, (duration, _) in zip(phases, plans, strict=True):
+        timeline.append((phase_start, duration, phase))
+        phase_start += duration
+    end = phase_start
+    for offset, i, name, control in expand_actions(plans, rng):
+        scheduler.at(t0 + offset, (i, name, control))
 
-        for action in actions:
-            svc_name = action["service"]
-            control = action["control"]
+    progress = Progress(timeline, speed)
 
-            if svc_name not in services:
-                print(colour(f"  Unknown service: {svc_name}", RED))
-                continue
+    def recorded(index: int, job: dict, record: dict) -> None:
+        progress.record(index, job, record)
+        if on_dispatch is not None:
+            start, duration, phase = timeline[index]
+            phase_end_unix = time.time() + start + duration - time.monotonic()
+            on_dispatch(phase["name"], phase_end_unix, job, record)
 
-            port = services[svc_name]["port"]
-            svc_label = colour(svc_name, BOLD)
-            print(f"  {colour('service:', DIM)} {svc_label}")
-            control_service(base_url, port, control)
+    def fire(when: float, entries: list[tuple]) -> None:
+        for i, name, control in entries:
+            job = build_job(base_url, services, name, control)
+            dispatcher.submit(timeline[i][2]["name"], [job], when,
+                              lambda job, record, i=i: recorded(i, job, record))
 
-        countdown(name, duration)
+    progress.start()
+    try:
+        scheduler.run(fire)
+        dispatcher.wait_idle()
+        remaining = end - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+    finally:
+        progress.stop()
 
     print(colour("\nScenario complete.", BOLD, GREEN))
+    for line in stage_report(stages or [], phases, speed):
+        print(line)
+
+
+# ---------------------------------------------------------------------------
+# Time compression (--speed)
+# ---------------------------------------------------------------------------
+
+# --speed N divides phase durations and action offsets by N and sends
+# {"speed": N} to every service, so fake-service ramps and traffic run on the
+# same compressed clock. The pipeline's own intervals do not compress: a 5 s
+# scrape at 8× spans 40 scenario seconds, and once a stage spans more than a
+# phase the run no longer measures what the real-time scenario would.
+
+def set_service_speed(scenario: dict, base_url: str, dispatcher: Dispatcher,
+                      speed: float) -> None:
+    services = scenario.get("services", {})
+    jobs = [build_job(base_url, services, name, {"speed": speed}) for name in services]
+    records = dispatcher.dispatch("speed", jobs, time.monotonic())
+    for job, record in zip(jobs, records, strict=True):
+        if not record["ok"]:
+            print(format_dispatch(job, record))
+    done = sum(1 for record in records if record["ok"])
+    print(colour(f"  Speed {speed:g}× set on {done}/{len(jobs)} services", DIM))
+
+
+def discover_stages(pool: ConnectionPool, scenario: dict, base_url: str,
+                    prometheus_url: str | None) -> list[tuple[str, float, int]]:
+    """(stage, wall-clock interval, intervals needed) for each visible pipeline stage.
+
+    The generator tick comes from the first service's /debug/stats; the
+    scrape interval, rule evaluation interval, longest range window and
+    longest ``for:`` come from Prometheus when --prometheus-url is given.
+    A scrape counts twice because rate() needs two samples.
+    """
+    def get(url: str):
+        status, data, _ = pool.request("GET", url)
+        if status != 200:
+            raise ValueError(f"HTTP {status} from {url}")
+        return json.loads(data)
+
+    stages = []
+    services = scenario.get("services", {})
+    if services:
+        port = next(iter(services.values()))["port"]
+        with contextlib.suppress(OSError, http.client.HTTPException, ValueError, KeyError):
+            stages.append(("generator tick",
+                           float(get(f"{base_url}:{port}/debug/stats")["tick_interval_seconds"]),
+                           1))
+    if not prometheus_url:
+        return stages
+    try:
+        config = yaml.safe_load(get(f"{prometheus_url}/api/v1/status/config")["data"]["yaml"])
+        groups = get(f"{prometheus_url}/api/v1/rules")["data"]["groups"]
+    except (OSError, http.client.HTTPException, ValueError, KeyError, yaml.YAMLError) as exc:
+        print(colour(f"  Could not read pipeline stages from Prometheus: {exc}", YELLOW))
+        return stages
+    defaults = config.get("global") or {}
+    scrape = defaults.get("scrape_interval", "1m")
+    for job in config.get("scrape_configs") or []:
+        if job.get("job_name") == "fake-services":
+            scrape = job.get("scrape_interval", scrape)
+    stages.append(("scrape interval", parse_duration(scrape), 2))
+    evaluation = max((float(g["interval"]) for g in groups),
+                     default=parse_duration(defaults.get("evaluation_interval", "1m")))
+    stages.append(("rule evaluation", evaluation, 1))
+    rules = [rule for group in groups for rule in group.get("rules", [])]
+    windows = []
+    for rule in rules:
+        for window in re.findall(r"\[([0-9a-z.]+)(?::[0-9a-z.]*)?\]", rule.get("query", "")):
+            with contextlib.suppress(ValueError):
+                windows.append(parse_duration(window))
+    if windows:
+        stages.append(("range window", max(windows), 1))
+    holds = [float(rule.get("duration", 0)) for rule in rules if rule.get("type") == "alerting"]
+    if max(holds, default=0) > 0:
+        stages.append(("alert for:", max(holds), 1))
+    return stages
+
+
+def stage_report(stages: list[tuple[str, float, int]], phases: list[dict],
+                 speed: float) -> list[str]:
+    """Lines naming the stages that span more than a phase at ``speed`` but not at 1×.
+
+    A stage that already outlasts a phase in real time (a 2m rate window
+    against a 10s phase) is noted but not blamed on the compression.
+    """
+    durations = [(phase_duration(p), p["name"]) for p in phases]
+    if not stages or not durations:
+        return []
+    lines = [colour(f"\n  Pipeline stages at {speed:g}× (wall interval → scenario seconds):", BOLD)]
+    limiting = None
+    for name, interval, needed in stages:
+        real = interval * needed
+        fits = [(duration, phase) for duration, phase in durations if real <= duration]
+        broken = [phase for duration, phase in fits if real * speed > duration]
+        ceiling = min(duration for duration, _ in fits) / real if fits else None
+        if broken:
+            shown = ", ".join(broken[:3]) + (", ..." if len(broken) > 3 else "")
+            verdict = colour(f"longer than {len(broken)} phase(s): {shown}", RED)
+            if limiting is None or ceiling < limiting[1]:
+                limiting = (name, ceiling, min(fits)[1])
+        elif len(fits) < len(durations):
+            verdict = colour(f"spans {len(durations) - len(fits)} phase(s) even at 1×", DIM)
+        else:
+            verdict = colour("ok", GREEN)
+        wall = f"{needed} × {interval:g}s" if needed > 1 else f"{interval:g}s"
+        limit = f"{ceiling:.1f}×" if ceiling is not None else "—"
+        lines.append(f"    {name:<16} {wall:>10} → {real * speed:>7.1f}s   "
+                     f"max {limit:>7}   {verdict}")
+    if limiting is not None:
+        name, ceiling, phase = limiting
+        lines.append(colour(f"  Limiting stage: {name} — above {ceiling:.1f}× it spans more "
+                            f"than the {phase} phase.", YELLOW))
+    else:
+        lines.append(colour(f"  No stage outlasts a phase at {speed:g}× that fits it in real "
+                            f"time.", DIM))
+    return lines
+
+
+# ---------------------------------------------------------------------------
+# Detection latency (--core-url)
+# ---------------------------------------------------------------------------
+
+# (signal, source, kind): what the watcher looks for after each control
+# action, in pipeline order. "assessment" is the first assessment of any kind.
+SIGNALS = (
+    ("assessment", "assessments", None),
+    ("quality_breach", "verdicts", "quality_breach"),
+    ("correlation_snapshot", "assessments", "correlation_snapshot"),
+    ("triage", "verdicts", "triage"),
+    ("case", "cases", None),
+)
+# Core lists rows newest first. The watcher widens its page from
+# WATCH_PAGE until the oldest row predates every open trigger, so a busy
+# service cannot push the first post-action row past the page boundary.
+WATCH_PAGE = 50
+WATCH_PAGE_MAX = 6400
+
+
+def _parse_iso(ts: str) -> float:
+    """Unix seconds from an ISO 8601 timestamp; tolerates a trailing 'Z'."""
+    return dt.datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+
+
+def _open(watch: dict, name: str) -> bool:
+    """Whether ``watch`` is still looking for signal ``name``."""
+    return name not in watch["signals"] and name not in watch["missed"]
+
+
+class DetectionWatcher:
+    """Polls core for the first of each SIGNALS row after every control action.
+
+    The first successful control action per (run, phase, service) opens a
+    watch; its latency to a signal is ``created_at`` of the first matching
+    row minus the action's send time, paging back until the fetched rows
+    predate the action. A watch only matches rows created before its window
+    end, the next watch's action on that service or its phase's end,
+    whichever comes first; a signal still unseen by the first poll after
+    that is recorded as missed, so runs never wait out the timeout for
+    signals a phase does not produce. Polling runs on its own asyncio loop
+    thread, so the scenario timeline never waits on core.
+    """
+
+    def __init__(self, core_url: str, interval: float, concurrency: int = 8):
+        self.core_url = core_url
+        self.interval = interval
+        self.concurrency = concurrency
+        self.watches: list[dict] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._main, name="core-watch", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def anchor(self, run: int, phase: str, phase_end_unix: float, job: dict,
+               record: dict) -> None:
+        """Open a watch for a dispatched action (first control per run/phase/service)."""
+        if job["kind"] != "control" or not record["ok"]:
+            return
+        service, sent = job["service"], record["sent_unix"]
+        with self._lock:
+            if any(w["run"] == run and w["phase"] == phase and w["service"] == service
+                   for w in self.watches):
+                return
+            for watch in self.watches:
+                if watch["service"] == service and watch["window_end_unix"] > sent:
+                    watch["window_end_unix"] = sent
+            self.watches.append({
+                "run": run, "phase": phase, "service": service, "action_unix": sent,
+                "window_end_unix": phase_end_unix, "signals": {}, "missed": [],
+            })
+
+    def pending(self, run: int | None = None) -> int:
+        """Signals neither seen nor missed yet, over ``run``'s watches (or all)."""
+        with self._lock:
+            return sum(len(SIGNALS) - len(w["signals"]) - len(w["missed"])
+                       for w in self.watches if run is None or w["run"] == run)
+
+    def wait(self, run: int, timeout: float) -> None:
+        """Block until every signal of ``run`` is seen or ``timeout`` seconds pass."""
+        deadline = time.monotonic() + timeout
+        while self.pending(run) and time.monotonic() < deadline:
+            time.sleep(min(self.interval, max(deadline - time.monotonic(), 0)))
+
+    def _main(self) -> None:
+        asyncio.run(self._watch())
+
+    async def _watch(self) -> None:
+        limit = asyncio.Semaphore(self.concurrency)
+        async with CoreAPIClient(base_url=self.core_url) as client:
+            while not self._stop.is_set():
+                with self._lock:
+                    wanted = {(name, w["service"]) for w in self.watches
+                              for name, _, _ in SIGNALS if _open(w, name)}
+                await asyncio.gather(*(self._check(client, limit, name, service)
+                                       for name, service in sorted(wanted)))
+                await asyncio.sleep(self.interval)
+
+    async def _check(self, client, limit: asyncio.Semaphore, name: str, service: str) -> None:
+        _, source, kind = next(signal for signal in SIGNALS if signal[0] == name)
+        # Rows created before this instant are visible to the fetch below,
+        # so windows ending earlier can be closed once it returns.
+        polled = time.time()
+        with self._lock:
+            triggers = [w["action_unix"] for w in self.watches
+                        if w["service"] == service and _open(w, name)]
+        if not triggers:
+            return
+        page = WATCH_PAGE
+        while True:
+            async with limit:
+                if source == "verdicts":
+                    result = await client.get_verdicts(verdict_type=kind, service=service,
+                                                       limit=page)
+                elif source == "assessments":
+                    result = await client.get_assessments(kind=kind, service=service, limit=page)
+                else:
+                    result = await client.get_cases(service=service, limit=page)
+            if not result.ok:
+                return
+            data = result.data or []
+            rows = [(_parse_iso(row["created_at"]), row.get("id", ""))
+                    for row in data if row.get("created_at")]
+            # Done once the page reaches back before the earliest trigger
+            # (or holds every row there is); otherwise an earlier match may
+            # sit just past it.
+            complete = len(data) < page
+            if complete or page >= WATCH_PAGE_MAX or (rows and min(rows)[0] < min(triggers)):
+                break
+            page *= 4
+        oldest = min(rows)[0] if rows else None
+        seen = time.time()
+        with self._lock:
+            for watch in self.watches:
+                if watch["service"] != service or not _open(watch, name):
+                    continue
+                within = [row for row in rows
+                          if watch["action_unix"] <= row[0] < watch["window_end_unix"]]
+                if within:
+                    created, row_id = min(within)
+                    watch["signals"][name] = {
+                        "id": row_id,
+                        "latency_seconds": round(created - watch["action_unix"], 3),
+                        "observed_seconds": round(seen - watch["action_unix"], 3),
+                    }
+                    if not complete and oldest >= watch["action_unix"]:
+                        # WATCH_PAGE_MAX rows all after the action: an upper bound.
+                        watch["signals"][name]["truncated"] = True
+                elif polled >= watch["window_end_unix"]:
+                    watch["missed"].append(name)
+
+
+def detection_report(scenario: dict, watches: list[dict], runs: int, speed: float) -> dict:
+    """Per (phase, service, signal) p50/p95/max of latency_seconds across runs."""
+    groups: dict[tuple[str, str], list[dict]] = {}
+    for watch in watches:
+        groups.setdefault((watch["phase"], watch["service"]), []).append(watch)
+    results = []
+    for (phase, service), group in groups.items():
+        for name, _, _ in SIGNALS:
+            samples = [w["signals"][name]["latency_seconds"] for w in group
+                       if name in w["signals"]]
+            row = {"phase": phase, "service": service, "signal": name,
+                   "runs": len(group), "detected": len(samples),
+                   "p50": None, "p95": None, "max": None, "samples": samples}
+            if samples:
+                row.update(p50=percentile(samples, 50), p95=percentile(samples, 95),
+                           max=max(samples))
+            results.append(row)
+    return {"scenario": scenario["name"], "runs": runs, "speed": speed,
+            "signals": [name for name, _, _ in SIGNALS], "results": results,
+            "watches": watches}
+
+
+def print_detection_report(report: dict) -> None:
+    print(colour(f"\n  Detection latency over {report['runs']} run(s) "
+                 f"(seconds from control action to created_at):", BOLD))
+    for row in report["results"]:
+        label = f"    {row['phase'][:22]:<22} {row['service'][:18]:<18} {row['signal']:<21}"
+        if not row["detected"]:
+            print(f"{label} {colour('not seen', RED)}")
+            continue
+        missed = row["runs"] - row["detected"]
+        tail = colour(f"  ({missed} missed)", YELLOW) if missed else ""
+        print(f"{label} p50 {row['p50']:>7.1f}  p95 {row['p95']:>7.1f}  "
+              f"max {row['max']:>7.1f}{tail}")
+
+
+# ---------------------------------------------------------------------------
+# Soak (--soak)
+# ---------------------------------------------------------------------------
+
+SLOPE_UNITS = {"s": 3600.0, "m": 60.0, "h": 1.0, "d": 1 / 24}
+
+
+def soak_cycle(scenario: dict, rng: random.Random) -> dict:
+    """A shuffled copy of the scenario for one soak cycle.
+
+    Phases run in random order with durations scaled 0.5-1.5×, and each
+    action is moved to a random service of the same type, so hours of
+    cycles spread load and fault patterns across every service.
+    """
+    services = scenario.get("services", {})
+    by_type: dict[str, list[str]] = {}
+    for name, svc in services.items():
+        by_type.setdefault(svc.get("type", "api"), []).append(name)
+
+    def swap(name: str) -> str:
+        peers = by_type.get(services.get(name, {}).get("type", "api"), [])
+        return rng.choice(peers) if name in services and peers else name
+
+    phases = []
+    for phase in rng.sample(scenario.get("phases", []), len(scenario.get("phases", []))):
+        actions = []
+        for action in phase.get("actions", []):
+            action = dict(action)
+            if "service" in action:
+                action["service"] = swap(action["service"])
+            if isinstance(action.get("services"), list):   # leave "*" alone
+                action["services"] = [swap(name) for name in action["services"]]
+            actions.append(action)
+        duration = phase_duration(phase) * rng.uniform(0.5, 1.5)
+        phases.append({**phase, "duration": round(duration, 3), "actions": actions})
+    return {**scenario, "phases": phases}
+
+
+def _process_tree(pid: int) -> list[int]:
+    """pid and all its descendants (uv run wraps the real interpreter)."""
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as fh:
+                ppid = int(fh.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    tree, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, []))
+    return tree
+
+
+def sample_process(pid: int) -> dict:
+    """Summed RSS (MB) and open FDs over a process tree; None once it is gone."""
+    rss_kb, fds, alive = 0, 0, False
+    for member in _process_tree(pid):
+        try:
+            with open(f"/proc/{member}/status") as fh:
+                for line in fh:
+                    if line.startswith("VmRSS:"):
+                        rss_kb += int(line.split()[1])
+                        break
+            alive = True
+            fds += len(os.listdir(f"/proc/{member}/fd"))
+        except (OSError, ValueError):
+            continue
+    if not alive:
+        return {"rss_mb": None, "fds": None}
+    return {"rss_mb": round(rss_kb / 1024, 2), "fds": fds}
+
+
+def _read_pid(spec: str) -> int | None:
+    """A literal PID or a PID file (re-read every sample, so restarts are followed)."""
+    if spec.isdigit():
+        return int(spec)
+    try:
+        with open(spec) as fh:
+            return int(fh.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def slope_per_hour(points: list[tuple[float, float]]) -> float | None:
+    """Least-squares slope of (seconds, value) points, in units per hour."""
+    if len(points) < 3:
+        return None
+    n = len(points)
+    mean_t = sum(t for t, _ in points) / n
+    mean_v = sum(v for _, v in points) / n
+    var = sum((t - mean_t) ** 2 for t, _ in points)
+    if var == 0:
+        return None
+    cov = sum((t - mean_t) * (v - mean_v) for t, v in points)
+    return cov / var * 3600
+
+
+def parse_slope(item: str) -> tuple[str, float]:
+    """'core.rss_mb=20/h' -> ('core.rss_mb', 20.0 per hour); the unit defaults to /h."""
+    pattern, _, limit = item.partition("=")
+    value, _, unit = limit.strip().partition("/")
+    if not pattern.strip() or unit.strip() not in ("", *SLOPE_UNITS):
+        raise ValueError(f"--max-slope: expected METRIC=VALUE[/s|m|h|d], got {item!r}")
+    return pattern.strip(), float(value) * SLOPE_UNITS[unit.strip() or "h"]
+
+
+class ResourceSampler:
+    """Samples core/worker resources on a fixed interval during a soak.
+
+    Metrics are ``<name>.rss_mb`` / ``<name>.fds`` per --soak-process,
+    ``db.size_mb`` / ``db.wal_mb`` for --soak-db, and ``<name>.latency_ms``
+    (median of a few keep-alive GETs) per --soak-endpoint. The report is
+    rewritten after every sample, so a killed soak still leaves its series;
+    set ``interrupted`` before ``stop()`` to mark a Ctrl-C'd soak as partial.
+    """
+
+    def __init__(self, processes: dict[str, str], db: str | None, endpoints: dict[str, str],
+                 interval: float, probes: int, warmup: float, limits: list[tuple[str, float]],
+                 report_path: str):
+        self.processes = processes
+        self.db = db
+        self.endpoints = endpoints
+        self.interval = interval
+        self.probes = max(probes, 1)
+        self.warmup = warmup
+        self.limits = limits
+        self.report_path = report_path
+        self.samples: list[dict] = []
+        self.gone: list[dict] = []
+        self.interrupted = False
+        self._seen: set[str] = set()
+        self._pool = ConnectionPool(timeout=10.0, per_host=1)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="soak-sampler", daemon=True)
+        self._t0 = time.monotonic()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampler thread, then take the final sample while the pool is open."""
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+        self._pool.close()
+
+    def _run(self) -> None:
+        while True:
+            self.sample()
+            if self._stop.wait(self.interval):
+                return
+
+    def _latency(self, url: str) -> float | None:
+        timings = []
+        for _ in range(self.probes):
+            start = time.perf_counter()
+            try:
+                status, _, _ = self._pool.request("GET", url)
+            except (OSError, http.client.HTTPException):
+                return None
+            if status >= 400:
+                return None
+            timings.append((time.perf_counter() - start) * 1000)
+        return round(percentile(timings, 50), 2)
+
+    def sample(self) -> dict:
+        elapsed = time.monotonic() - self._t0
+        row: dict = {"t": round(elapsed, 1),
+                     "time": dt.datetime.now(dt.UTC).isoformat(timespec="seconds")}
+        for name, spec in self.processes.items():
+            pid = _read_pid(spec)
+            stats = sample_process(pid) if pid else {"rss_mb": None, "fds": None}
+            if stats["rss_mb"] is None and name in self._seen:
+                self.gone.append({"process": name, "t": row["t"], "pid": pid})
+                self._seen.discard(name)
+            elif stats["rss_mb"] is not None:
+                self._seen.add(name)
+            row.update({f"{name}.{key}": value for key, value in stats.items()})
+        if self.db:
+            for key, path in (("size_mb", self.db), ("wal_mb", f"{self.db}-wal")):
+                with contextlib.suppress(OSError):
+                    row[f"db.{key}"] = round(os.path.getsize(path) / 1e6, 3)
+        for name, url in self.endpoints.items():
+            row[f"{name}.latency_ms"] = self._latency(url)
+        self.samples.append(row)
+        self.write()
+        return row
+
+    def report(self) -> dict:
+        metrics = sorted({key for row in self.samples for key in row} - {"t", "time"})
+        growth, failures = {}, []
+        for metric in metrics:
+            points = [(row["t"], row[metric]) for row in self.samples
+                      if row["t"] >= self.warmup and row.get(metric) is not None]
+            slope = slope_per_hour(points)
+            limit = next((value for pattern, value in self.limits
+                          if fnmatch.fnmatchcase(metric, pattern)), None)
+            exceeded = slope is not None and limit is not None and slope > limit
+            growth[metric] = {"slope_per_hour": None if slope is None else round(slope, 4),
+                              "limit_per_hour": limit, "exceeded": exceeded,
+                              "first": points[0][1] if points else None,
+                              "last": points[-1][1] if points else None}
+            if exceeded:
+                failures.append(f"{metric} grew {slope:.3g}/h (limit {limit:g}/h)")
+        failures += [f"{g['process']} exited at {format_clock(g['t'])}" for g in self.gone]
+        return {"interval_seconds": self.interval, "warmup_seconds": self.warmup,
+                "duration_seconds": self.samples[-1]["t"] if self.samples else 0,
+                "growth": growth, "failures": failures, "passed": not failures,
+                "interrupted": self.interrupted, "samples": self.samples}
+
+    def write(self) -> None:
+        tmp = f"{self.report_path}.tmp"
+        with open(tmp, "w") as fh:
+            json.dump(self.report(), fh, indent=2)
+        os.replace(tmp, self.report_path)
+
+
+def format_sample(row: dict) -> str:
+    values = "  ".join(f"{key} {value}" for key, value in row.items() if key not in ("t", "time"))
+    return colour(f"  soak {format_clock(row['t'])}  {values}", DIM)
+
+
+def format_clock(seconds: float) -> str:
+    hours, rest = divmod(int(seconds), 3600)
+    return f"{hours}h{rest // 60:02d}m{rest % 60:02d}s"
+
+
+def print_soak_report(report: dict, path: str) -> None:
+    span = "interrupted after" if report["interrupted"] else "over"
+    print(colour(f"\n  Soak {span} {format_clock(report['duration_seconds'])} "
+                 f"({len(report['samples'])} samples, growth after "
+                 f"{report['warmup_seconds']:g}s warm-up):", BOLD))
+    for metric, row in report["growth"].items():
+        slope = "n/a" if row["slope_per_hour"] is None else f"{row['slope_per_hour']:+.3f}/h"
+        limit = "" if row["limit_per_hour"] is None else f"  limit {row['limit_per_hour']:g}/h"
+        tone = RED if row["exceeded"] else DIM
+        print(f"    {metric[:32]:<32} {row['first']!s:>10} → {row['last']!s:<10} "
+              f"{colour(slope, tone)}{limit}")
+    for failure in report["failures"]:
+        print(colour(f"  ✗ {failure}", RED))
+    if not report["passed"]:
+        verdict = colour("  Soak FAILED.", RED)
+    elif report["interrupted"]:
+        verdict = colour("  Soak interrupted; no failures so far (partial report).", YELLOW)
+    else:
+        verdict = colour("  Soak passed.", GREEN)
+    print(f"{verdict} {colour(f'Report: {path}', DIM)}")
+
+
+# ---------------------------------------------------------------------------
+# Offline simulation (--simulate)
+# ---------------------------------------------------------------------------
+
+def simulate_scenario(scenario: dict, specs: str, step: float,
+                      scrape_interval: float, burn_threshold: float,
+                      seed: int | None = None) -> dict:
+    """Predicted SLO breach / recovery timeline; no service is contacted.
+
+    Raises ImportError when scenario_sim's dependencies (numpy) are missing.
+    """
+    import scenario_sim
+
+    print(header(f"{scenario['name']} (simulated)"))
+    plans = plan_scenario(scenario)
+    events = [(offset, name, control)
+              for offset, _, name, control in expand_actions(plans, random.Random(seed))]
+    starts = list(itertools.accumulate((duration for duration, _ in plans), initial=0.0))
+    result = scenario_sim.simulate(scenario.get("services", {}), events, starts[-1],
+                                   scenario_sim.load_slos(specs), step, scrape_interval,
+                                   burn_threshold)
+    result["scenario"] = scenario["name"]
+    names = [phase["name"] for phase in scenario.get("phases", [])]
+    for event in result["timeline"]:
+        index = min(max(bisect.bisect_right(starts, event["t_ms"] / 1000) - 1, 0),
+                    len(names) - 1)
+        event["phase"] = names[index] if names else None
+    return result
+
+
+def print_simulation(result: dict) -> None:
+    print(colour(f"\n  Predicted SLO timeline (ms from scenario start, "
+                 f"{result['step_ms']}ms resolution):", BOLD))
+    for event in result["timeline"]:
+        tone = RED if event["event"] == "breach" else GREEN
+        kind = colour(f"{event['event'].upper():<8}", tone)
+        print(f"    {event['t_ms']:>9}  {kind} "
+              f"{event['service'][:18]:<18} {event['slo'][:22]:<22} "
+              f"SLI {event['sli']:.5f}  burn {event['burn_rate']:>7.2f}  "
+              f"{colour(event['phase'] or '', DIM)}")
+    if not result["timeline"]:
+        print(colour("    No SLO is expected to breach.", GREEN))
+    print(colour("\n  Per SLO:", BOLD))
+    for row in result["slos"]:
+        label = f"    {row['service'][:18]:<18} {row['slo'][:22]:<22} {row['target']:>7}%"
+        if row["error"]:
+            print(f"{label}  {colour(row['error'], YELLOW)}")
+            continue
+        spans = ", ".join(
+            f"{b['breach_ms']}→{'…' if b['recover_ms'] is None else b['recover_ms']}"
+            for b in row["breaches"]) or "no breach"
+        print(f"{label}  min SLI {row['min_sli']:.5f}  peak burn {row['peak_burn_rate']:>7.2f}"
+              f"  {spans}")
 
 
 # ---------------------------------------------------------------------------
 # Cleanup / signal handling
 # ---------------------------------------------------------------------------
 
-def reset_all_services(scenario: dict, base_url: str) -> None:
+def reset_all_services(scenario: dict, base_url: str, dispatcher: Dispatcher) -> None:
     services = scenario.get("services", {})
     if not services:
         return
     print(colour("\n  Resetting all services...", YELLOW))
-    for svc_name, svc in services.items():
-        port = svc["port"]
-        url = f"{base_url}:{port}/reset"
-        result = post_json(url)
-        status = colour("reset", GREEN) if result is not None else colour("failed", RED)
-        print(f"  {colour('→', DIM)} {svc_name} :{port}/reset  {status}")
+    jobs = [build_job(base_url, services, svc_name, "reset") for svc_name in services]
+    for job, record in zip(jobs, dispatcher.dispatch("reset-all", jobs, time.monotonic()),
+                           strict=True):
+        print(format_dispatch(job, record))
 
 
 # ---------------------------------------------------------------------------
@@ -229,7 +1247,217 @@ def main() -> None:
         metavar="URL",
         help="Base URL for fake services (default: http://localhost).",
     )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=5.0,
+        help="Per-request timeout in seconds (default: 5).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=64,
+        help="Maximum simultaneous control requests (default: 64).",
+    )
+    parser.add_argument(
+        "--connections-per-host",
+        type=int,
+        default=4,
+        help="Keep-alive connections per service port (default: 4).",
+    )
+    parser.add_argument(
+        "--dispatch-log",
+        metavar="PATH",
+        help="Append one JSON line per dispatch (target, sent, skew, ack, outcome).",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for action jitter, to replay the same timings (default: random).",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Time-compression factor: run phases and fake-service ramps N× faster "
+             "(default: 1).",
+    )
+    parser.add_argument(
+        "--prometheus-url",
+        metavar="URL",
+        help="Read scrape/evaluation intervals and rule windows from Prometheus for the "
+             "limiting-stage report.",
+    )
+    parser.add_argument(
+        "--stage",
+        action="append",
+        default=[],
+        metavar="NAME=DURATION",
+        help="Extra pipeline stage for the limiting-stage report, e.g. 'worker cycle=10s' "
+             "(repeatable).",
+    )
+    parser.add_argument(
+        "--core-url",
+        metavar="URL",
+        help="Watch nthlayer-core and report detection latency per phase and service "
+             "(needs nthlayer-common).",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=1.0,
+        help="Core poll interval in seconds (default: 1).",
+    )
+    parser.add_argument(
+        "--watch-timeout",
+        type=float,
+        default=180.0,
+        help="Longest wait after a run for signals whose windows are still open "
+        "(default: 180).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Run the scenario N times, resetting services in between (default: 1).",
+    )
+    parser.add_argument(
+        "--repeat-gap",
+        type=float,
+        default=60.0,
+        help="Seconds to settle after the reset between repeated runs (default: 60).",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="PATH",
+        help="Write the detection-latency (or --simulate) JSON report here instead of to "
+             "stdout.",
+    )
+    parser.add_argument(
+        "--soak",
+        metavar="DURATION",
+        help="Loop randomized phases across services for this long (e.g. 4h), sampling "
+             "resources and failing on growth over --max-slope.",
+    )
+    parser.add_argument(
+        "--soak-interval",
+        default="30s",
+        metavar="DURATION",
+        help="Resource sampling interval during --soak (default: 30s).",
+    )
+    parser.add_argument(
+        "--soak-process",
+        action="append",
+        default=[],
+        metavar="NAME=PID|PIDFILE",
+        help="Process tree to sample RSS and open FDs of, e.g. core=.demo/core.pid "
+             "(repeatable).",
+    )
+    parser.add_argument(
+        "--soak-db",
+        metavar="PATH",
+        help="SQLite store whose file and -wal sizes are sampled during --soak.",
+    )
+    parser.add_argument(
+        "--soak-endpoint",
+        action="append",
+        default=[],
+        metavar="NAME=URL",
+        help="GET latency to sample during --soak, e.g. core=http://localhost:8000/health "
+             "(repeatable).",
+    )
+    parser.add_argument(
+        "--soak-probes",
+        type=int,
+        default=5,
+        help="GETs per endpoint per sample; the median is recorded (default: 5).",
+    )
+    parser.add_argument(
+        "--soak-warmup",
+        default="10m",
+        metavar="DURATION",
+        help="Samples before this are left out of the growth slopes (default: 10m).",
+    )
+    parser.add_argument(
+        "--max-slope",
+        action="append",
+        default=[],
+        metavar="METRIC=VALUE[/UNIT]",
+        help="Fail the soak when a metric grows faster, e.g. 'core.rss_mb=20/h' or "
+             "'*.fds=5/h' (glob, per hour by default; repeatable).",
+    )
+    parser.add_argument(
+        "--soak-report",
+        default="soak-report.json",
+        metavar="PATH",
+        help="Time-series report, rewritten after every sample (default: soak-report.json).",
+    )
+    parser.add_argument(
+        "--simulate",
+        action="store_true",
+        help="Predict SLO breach/recovery times offline from the service manifests instead "
+             "of driving services (needs numpy).",
+    )
+    parser.add_argument(
+        "--specs",
+        default=str(Path(__file__).resolve().parent / "specs"),
+        metavar="DIR",
+        help="Service manifests with the SLO queries for --simulate (default: demo/specs).",
+    )
+    parser.add_argument(
+        "--resolution",
+        default="100ms",
+        metavar="DURATION",
+        help="--simulate time step (default: 100ms).",
+    )
+    parser.add_argument(
+        "--scrape-interval",
+        default="0s",
+        metavar="DURATION",
+        help="--simulate: hold counters between scrapes of this interval (default: 0s, "
+             "continuous).",
+    )
+    parser.add_argument(
+        "--burn-threshold",
+        type=float,
+        default=1.0,
+        help="--simulate: burn rate counted as a breach (default: 1, SLI below target).",
+    )
     args = parser.parse_args()
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.core_url and CoreAPIClient is None:
+        parser.error("--core-url needs nthlayer-common; run under "
+                     "`uv run --directory nthlayer-bench`")
+    soak = None
+    if args.soak:
+        try:
+            soak = parse_offset(args.soak, "--soak")
+            soak_interval = parse_offset(args.soak_interval, "--soak-interval")
+            soak_warmup = parse_offset(args.soak_warmup, "--soak-warmup")
+            limits = [parse_slope(item) for item in args.max_slope]
+        except ValueError as exc:
+            parser.error(str(exc))
+        if soak_interval <= 0:
+            parser.error("--soak-interval must be positive")
+        if args.soak_process and not os.path.isdir("/proc"):
+            parser.error("--soak-process reads /proc; it needs Linux")
+        pairs = {}
+        for flag, items in (("--soak-process", args.soak_process),
+                            ("--soak-endpoint", args.soak_endpoint)):
+            name_value = [item.partition("=") for item in items]
+            if any(not name or not value for name, _, value in name_value):
+                parser.error(f"{flag} expects NAME=VALUE")
+            pairs[flag] = {name.strip(): value.strip() for name, _, value in name_value}
+    extra_stages = []
+    for item in args.stage:
+        name, _, value = item.partition("=")
+        try:
+            extra_stages.append((name.strip(), parse_offset(value, "--stage"), 1))
+        except ValueError as exc:
+            parser.error(str(exc))
 
     try:
         scenario = load_scenario(args.scenario)
@@ -240,16 +1468,110 @@ def main() -> None:
         print(colour(f"Failed to parse scenario: {exc}", RED))
         sys.exit(1)
 
+    if args.simulate:
+        try:
+            step = parse_offset(args.resolution, "--resolution")
+            scrape_interval = parse_offset(args.scrape_interval, "--scrape-interval")
+        except ValueError as exc:
+            parser.error(str(exc))
+        if step <= 0:
+            parser.error("--resolution must be positive")
+        try:
+            result = simulate_scenario(scenario, args.specs, step, scrape_interval,
+                                       args.burn_threshold, args.seed)
+        except ImportError as exc:
+            parser.error(f"--simulate needs numpy ({exc})")
+        print_simulation(result)
+        if args.report:
+            with open(args.report, "w") as fh:
+                json.dump(result, fh, indent=2)
+            print(colour(f"  Report written to {args.report}", DIM))
+        else:
+            print(json.dumps(result))
+        return
+
+    dispatcher = Dispatcher(args.timeout, args.concurrency, args.connections_per_host,
+                            args.dispatch_log)
+
     # Register Ctrl+C handler after scenario is loaded
+    interrupted = False
+
     def handle_interrupt(sig, frame):  # noqa: ANN001
+        # SystemExit unwinds through the run loop's finally, which stops the
+        # watcher and soak sampler and prints their (partial) reports.
+        nonlocal interrupted
+        interrupted = True
         print(colour("\n\nInterrupted — resetting services before exit.", YELLOW))
-        reset_all_services(scenario, args.base_url)
+        reset_all_services(scenario, args.base_url, dispatcher)
         print(colour("Done.", GREEN))
-        sys.exit(0)
+        sys.exit(130)
 
     signal.signal(signal.SIGINT, handle_interrupt)
 
-    run_scenario(scenario, args.base_url)
+    stages = []
+    if args.speed != 1 or args.prometheus_url or extra_stages:
+        stages = discover_stages(dispatcher.pool, scenario, args.base_url,
+                                 args.prometheus_url) + extra_stages
+    watcher = None
+    if args.core_url:
+        watcher = DetectionWatcher(args.core_url, args.watch_interval)
+        watcher.start()
+    sampler = None
+    if soak is not None:
+        sampler = ResourceSampler(pairs["--soak-process"], args.soak_db,
+                                  pairs["--soak-endpoint"], soak_interval, args.soak_probes,
+                                  soak_warmup, limits, args.soak_report)
+        sampler.start()
+        soak_rng = random.Random(args.seed)
+        soak_end = time.monotonic() + soak
+    runs = 0
+    try:
+        while True:
+            run = runs
+            if soak is not None:
+                print(colour(f"\n  Soak cycle {run + 1} "
+                             f"({format_clock(max(soak_end - time.monotonic(), 0))} left)", BOLD))
+            elif args.repeat > 1:
+                print(colour(f"\n  Run {run + 1}/{args.repeat}", BOLD))
+            on_dispatch = None
+            if watcher is not None:
+                on_dispatch = functools.partial(watcher.anchor, run)
+            current = soak_cycle(scenario, soak_rng) if soak is not None else scenario
+            run_scenario(current, args.base_url, dispatcher, args.seed, args.speed, stages,
+                         on_dispatch)
+            runs += 1
+            if sampler is not None and sampler.samples:
+                print(format_sample(sampler.samples[-1]))
+            if watcher is not None and watcher.pending(run):
+                print(colour(f"  Waiting up to {args.watch_timeout:g}s for core to report "
+                             f"{watcher.pending(run)} signal(s) in their windows...", DIM))
+                watcher.wait(run, args.watch_timeout)
+            done = time.monotonic() >= soak_end if soak is not None else runs >= args.repeat
+            if done:
+                break
+            reset_all_services(scenario, args.base_url, dispatcher)
+            time.sleep(args.repeat_gap)
+    finally:
+        # Leave the services on the real-time clock for whatever runs next.
+        if args.speed != 1:
+            set_service_speed(scenario, args.base_url, dispatcher, 1.0)
+        dispatcher.close()
+        if watcher is not None:
+            watcher.stop()
+            report = detection_report(scenario, watcher.watches, runs, args.speed)
+            print_detection_report(report)
+            if args.report:
+                with open(args.report, "w") as fh:
+                    json.dump(report, fh, indent=2)
+                print(colour(f"  Report written to {args.report}", DIM))
+            else:
+                print(json.dumps(report))
+        if sampler is not None:
+            sampler.interrupted = interrupted
+            sampler.stop()
+            print_soak_report(sampler.report(), args.soak_report)
+    if sampler is not None and not sampler.report()["passed"]:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
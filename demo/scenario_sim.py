@@ -0,0 +1,554 @@
+"""Offline scenario simulator: expected SLO breach and recovery timeline.
+
+Used by ``demo/scenario-runner.py --simulate``. Instead of driving live
+fake-services, the scenario's control actions are replayed against an
+in-memory copy of the fake-service traffic model, and each SLO indicator
+query declared in the service manifests (``demo/specs``) is evaluated over
+the resulting counters. The output is the breach / recovery timeline in
+milliseconds from scenario start — what a live run *should* show, computed
+in well under a second.
+
+The model mirrors ``test/fake-service.py`` in synthetic mode: every
+``/control`` key moves along the same curves (a bare number ramps linearly
+over 15 s, ``reset`` ramps back to baseline), requests split 70/30 into
+5xx/4xx at the error rate, latency is log-normal with p50 = p99 / 5, and
+AI gates count overrides at the reversal rate. It uses expected values
+rather than random draws, so the timeline is deterministic; ``jitter``
+curves contribute their (zero) mean. Every series is a NumPy array over
+the whole time grid, so each query operator runs once per series, not
+once per step.
+
+PromQL subset: selectors with ``=``/``!=``/``=~``/``!~`` matchers, range
+selectors under ``rate`` / ``increase``, ``sum``/``avg``/``min``/``max``/
+``count`` with ``by``/``without``, ``clamp_min``, ``clamp_max``,
+``histogram_quantile``, scalar and one-to-one vector arithmetic, and
+filtering comparisons. Anything else raises ``ValueError`` naming the
+construct. ``rate`` is the ideal (non-extrapolated) increase over the
+window; pass a scrape interval to hold counters between scrapes instead.
+
+A breach is an interval where the SLO's burn rate
+``(1 - SLI) / (1 - target)`` is at or above the threshold (default 1,
+i.e. the SLI is below target). Breaches are found on the simulation grid,
+not on Prometheus' evaluation ticks, so a live rule can fire up to one
+evaluation interval later.
+"""
+from __future__ import annotations
+
+import math
+import re
+from pathlib import Path
+
+import numpy as np
+import yaml
+from _shared import DEFAULT_RAMP_SECONDS, parse_control, parse_duration
+
+# --- traffic model (mirrors test/fake-service.py) ----------------------------
+
+DEFAULT_RPS = 10.0
+BASELINE = {"error_rate": 0.0, "latency_p99": 0.2, "reversal_rate": 0.0}
+DIURNAL_PERIOD = 86400.0
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75,
+                   1.0, 2.5, 5.0, 7.5, 10.0, math.inf)
+SERVER_ERROR_SHARE = 0.7          # of errors; the rest are 4xx
+AI_ACTIONS = ("approve", "reject", "escalate")
+AI_ACTION_WEIGHTS = (0.80, 0.15, 0.05)
+HCF_FRACTION = 0.20
+
+
+def _with_defaults(spec: dict) -> dict:
+    """A parse_control spec with the amplitude / period defaults Curve applies."""
+    shape = spec["shape"]
+    amplitude = spec.get("amplitude")
+    period = spec.get("period")
+    return {**spec,
+            "amplitude": (0.1 if shape == "jitter" else 0.2) if amplitude is None else amplitude,
+            "period": max({"diurnal": DIURNAL_PERIOD, "jitter": 1.0}.get(shape, 60.0)
+                          if period is None else period, 0.001)}
+
+
+def _curve(start: float, spec: dict, t0: float, t: np.ndarray) -> np.ndarray:
+    """Vectorised Curve.value_at from test/fake-service.py over times ``t``."""
+    target, duration, shape = spec["target"], max(spec["duration"], 0.0), spec["shape"]
+    elapsed = t - t0
+    frac = np.ones_like(t) if duration == 0 else np.clip(elapsed / duration, 0.0, 1.0)
+    if shape == "step":
+        return np.where(frac >= 1.0, target, start)
+    if shape == "exponential":
+        if start > 0 and target > 0:
+            return start * (target / start) ** frac
+        return start + (target - start) * np.expm1(5 * frac) / math.expm1(5)
+    value = start + (target - start) * frac
+    if shape in ("sine", "diurnal"):
+        value = value + target * spec["amplitude"] * np.sin(2 * math.pi * elapsed / spec["period"])
+    return value
+
+
+def _key_values(baseline: float, changes: list[tuple[float, dict]],
+                t: np.ndarray) -> np.ndarray:
+    """One control key over ``t``: each change starts a curve from the current value."""
+    values = np.full_like(t, baseline)
+    previous = None
+    for t0, spec in changes:
+        # Start from the previous curve's exact value at t0, as set_curves does.
+        start = baseline if previous is None else float(_curve(*previous, np.array([t0]))[0])
+        mask = t >= t0
+        values[mask] = _curve(start, spec, t0, t[mask])
+        previous = (start, spec, t0)
+    return values
+
+
+def _service_series(name: str, svc_type: str, values: dict[str, np.ndarray],
+                    step: float) -> dict[str, list[tuple[tuple, np.ndarray]]]:
+    """Expected counter values for one service, as fake-service would expose them."""
+    requests = np.maximum(values["rps"], 0.0) * step
+    errors = np.clip(values["error_rate"], 0.0, 1.0)
+    base = (("service", name),)
+    series: dict[str, list[tuple[tuple, np.ndarray]]] = {}
+
+    def add(metric: str, labels: tuple, increments: np.ndarray) -> None:
+        series.setdefault(metric, []).append((tuple(sorted(base + labels)),
+                                              np.cumsum(increments)))
+
+    add("http_requests_total", (("status", "200"),), requests * (1 - errors))
+    add("http_requests_total", (("status", "400"),),
+        requests * errors * (1 - SERVER_ERROR_SHARE))
+    add("http_requests_total", (("status", "500"),), requests * errors * SERVER_ERROR_SHARE)
+
+    p99 = np.maximum(values["latency_p99"], 0.001)
+    mu = np.log(np.maximum(p99 / 5.0, 0.001))
+    sigma = np.log(p99 / np.exp(mu)) / 2.326
+    erf = np.frompyfunc(math.erf, 1, 1)
+    for le in LATENCY_BUCKETS:
+        if math.isinf(le):
+            share, label = np.ones_like(p99), "+Inf"
+        else:
+            z = (math.log(le) - mu) / np.where(sigma > 0, sigma * math.sqrt(2), 1e-12)
+            share, label = 0.5 * (1 + erf(z).astype(float)), repr(float(le))
+        add("http_request_duration_seconds_bucket", (("le", label),), requests * share)
+    add("http_request_duration_seconds_count", (), requests)
+    add("http_request_duration_seconds_sum", (), requests * np.exp(mu + sigma ** 2 / 2))
+
+    if svc_type == "ai-gate":
+        for action, weight in zip(AI_ACTIONS, AI_ACTION_WEIGHTS, strict=True):
+            add("gen_ai_decisions_total", (("action", action),), requests * weight)
+        overrides = requests * np.clip(values["reversal_rate"], 0.0, 1.0)
+        add("gen_ai_overrides_total", (), overrides)
+        add("gen_ai_overrides_hcf_total", (), overrides * HCF_FRACTION)
+    return series
+
+
+# --- PromQL subset -------------------------------------------------------------
+
+_TOKEN = re.compile(r"""\s*(?:
+    (?P<range>\[[^\]]*\])
+   |(?P<number>(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)
+   |(?P<string>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')
+   |(?P<ident>[a-zA-Z_:][a-zA-Z0-9_:]*)
+   |(?P<op>=~|!~|!=|==|>=|<=|[-+*/(){},=<>])
+)""", re.X)
+_AGGREGATIONS = ("sum", "avg", "min", "max", "count")
+_FUNCTIONS = ("rate", "increase", "clamp_min", "clamp_max", "histogram_quantile")
+_COMPARISONS = ("==", "!=", ">", "<", ">=", "<=")
+
+
+def _tokens(query: str) -> list[tuple[str, str]]:
+    out, pos = [], 0
+    query = query.strip()
+    while pos < len(query):
+        match = _TOKEN.match(query, pos)
+        if not match or match.end() == pos:
+            raise ValueError(f"unsupported PromQL near {query[pos:pos + 20]!r}")
+        out.append((match.lastgroup, match.group(match.lastgroup)))
+        pos = match.end()
+    return out
+
+
+class _Parser:
+    """Recursive-descent parser for the subset; produces nested tuples."""
+
+    def __init__(self, query: str):
+        self.query = query
+        self.tokens = _tokens(query)
+        self.pos = 0
+
+    def parse(self):
+        node = self._comparison()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"unsupported PromQL: trailing {self.tokens[self.pos][1]!r}")
+        return node
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.pos][1] if self.pos < len(self.tokens) else None
+
+    def _take(self, expected: str | None = None) -> tuple[str, str]:
+        if self.pos >= len(self.tokens):
+            raise ValueError(f"unexpected end of query: {self.query!r}")
+        token = self.tokens[self.pos]
+        if expected is not None and token[1] != expected:
+            raise ValueError(f"expected {expected!r}, got {token[1]!r}")
+        self.pos += 1
+        return token
+
+    def _comparison(self):
+        node = self._additive()
+        if self._peek() in _COMPARISONS:
+            op = self._take()[1]
+            if self._peek() == "bool":
+                raise ValueError("unsupported PromQL: bool modifier")
+            node = ("bin", op, node, self._additive())
+        return node
+
+    def _additive(self):
+        node = self._term()
+        while self._peek() in ("+", "-"):
+            op = self._take()[1]
+            node = ("bin", op, node, self._term())
+        return node
+
+    def _term(self):
+        node = self._unary()
+        while self._peek() in ("*", "/"):
+            op = self._take()[1]
+            node = ("bin", op, node, self._unary())
+        return node
+
+    def _unary(self):
+        if self._peek() == "-":
+            self._take()
+            return ("bin", "*", ("num", -1.0), self._unary())
+        return self._primary()
+
+    def _labels(self) -> list[str]:
+        self._take("(")
+        names = []
+        while self._peek() != ")":
+            names.append(self._take()[1])
+            if self._peek() == ",":
+                self._take()
+        self._take(")")
+        return names
+
+    def _primary(self):
+        kind, value = self._take()
+        if kind == "number":
+            return ("num", float(value))
+        if value == "(":
+            node = self._comparison()
+            self._take(")")
+            return node
+        if kind != "ident":
+            raise ValueError(f"unsupported PromQL token {value!r}")
+        if value in _AGGREGATIONS:
+            grouping = None
+            if self._peek() in ("by", "without"):
+                grouping = (self._take()[1], self._labels())
+            self._take("(")
+            inner = self._comparison()
+            self._take(")")
+            if self._peek() in ("by", "without"):
+                grouping = (self._take()[1], self._labels())
+            return ("agg", value, grouping, inner)
+        if self._peek() == "(":
+            if value not in _FUNCTIONS:
+                raise ValueError(f"unsupported PromQL function {value}()")
+            self._take("(")
+            args = [self._comparison()]
+            while self._peek() == ",":
+                self._take()
+                args.append(self._comparison())
+            self._take(")")
+            return ("call", value, args)
+        matchers = []
+        if self._peek() == "{":
+            self._take("{")
+            while self._peek() != "}":
+                name = self._take()[1]
+                op = self._take()[1]
+                if op not in ("=", "!=", "=~", "!~"):
+                    raise ValueError(f"unsupported label matcher {op!r}")
+                text = self._take()[1]
+                matchers.append((name, op, text[1:-1].encode().decode("unicode_escape")))
+                if self._peek() == ",":
+                    self._take()
+            self._take("}")
+        window = None
+        if self.pos < len(self.tokens) and self.tokens[self.pos][0] == "range":
+            text = self._take()[1][1:-1]
+            if ":" in text:
+                raise ValueError("unsupported PromQL: subquery")
+            window = parse_duration(text)
+        if self._peek() == "offset":
+            raise ValueError("unsupported PromQL: offset")
+        return ("sel", value, matchers, window)
+
+
+def range_windows(query: str) -> list[float]:
+    """Every range-selector window in ``query``, in seconds."""
+    return [parse_duration(text[1:-1]) for kind, text in _tokens(query) if kind == "range"]
+
+
+class Evaluator:
+    """Evaluates parsed queries over series sampled on a shared time grid.
+
+    An instant vector is ``{labels: values}`` with ``labels`` a sorted tuple
+    of (name, value) pairs (no ``__name__``) and ``values`` an array over
+    the grid; NaN marks "no sample" the way an absent series would.
+    """
+
+    def __init__(self, series: dict[str, list[tuple[tuple, np.ndarray]]], step: float):
+        self.series = series
+        self.step = step
+
+    def evaluate(self, query: str):
+        return self._eval(_Parser(query).parse())
+
+    def _eval(self, node):
+        kind = node[0]
+        if kind == "num":
+            return node[1]
+        if kind == "sel":
+            if node[3] is not None:
+                raise ValueError("range selector outside rate()/increase()")
+            return self._select(node[1], node[2])
+        if kind == "call":
+            return self._call(node[1], node[2])
+        if kind == "agg":
+            return self._aggregate(node[1], node[2], self._eval(node[3]))
+        return self._binary(node[1], self._eval(node[2]), self._eval(node[3]))
+
+    def _select(self, metric: str, matchers) -> dict:
+        out = {}
+        for labels, values in self.series.get(metric, []):
+            have = dict(labels)
+            if all(_matches(have.get(name, ""), op, want) for name, op, want in matchers):
+                out[labels] = values
+        return out
+
+    def _call(self, name: str, args: list):
+        if name in ("rate", "increase"):
+            if len(args) != 1 or args[0][0] != "sel" or args[0][3] is None:
+                raise ValueError(f"{name}() needs a range selector")
+            _, metric, matchers, window = args[0]
+            shift = max(round(window / self.step), 1)
+            out = {}
+            for labels, values in self._select(metric, matchers).items():
+                delta = np.full_like(values, np.nan)
+                delta[shift:] = values[shift:] - values[:-shift]
+                out[labels] = delta / window if name == "rate" else delta
+            return out
+        if name in ("clamp_min", "clamp_max"):
+            vector, bound = self._eval(args[0]), self._eval(args[1])
+            clamp = np.fmax if name == "clamp_min" else np.fmin
+            return {labels: np.where(np.isnan(v), np.nan, clamp(v, bound))
+                    for labels, v in vector.items()}
+        quantile, vector = self._eval(args[0]), self._eval(args[1])
+        return _histogram_quantile(quantile, vector)
+
+    def _aggregate(self, op: str, grouping, vector: dict) -> dict:
+        groups: dict[tuple, list[np.ndarray]] = {}
+        for labels, values in vector.items():
+            if grouping is None:
+                key = ()
+            elif grouping[0] == "by":
+                key = tuple(pair for pair in labels if pair[0] in grouping[1])
+            else:
+                key = tuple(pair for pair in labels if pair[0] not in grouping[1])
+            groups.setdefault(key, []).append(values)
+        out = {}
+        for key, members in groups.items():
+            stack = np.vstack(members)
+            present = ~np.isnan(stack)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                if op == "sum":
+                    result = np.nansum(stack, axis=0)
+                elif op == "avg":
+                    result = np.nansum(stack, axis=0) / present.sum(axis=0)
+                elif op == "count":
+                    result = present.sum(axis=0).astype(float)
+                else:
+                    filled = np.where(present, stack, np.inf if op == "min" else -np.inf)
+                    result = filled.min(axis=0) if op == "min" else filled.max(axis=0)
+            out[key] = np.where(present.any(axis=0), result, np.nan)
+        return out
+
+    def _binary(self, op: str, lhs, rhs):
+        scalar_l, scalar_r = not isinstance(lhs, dict), not isinstance(rhs, dict)
+        if scalar_l and scalar_r:
+            if op in _COMPARISONS:
+                raise ValueError("unsupported PromQL: scalar comparison needs bool")
+            return _apply(op, lhs, rhs)
+        if scalar_l or scalar_r:
+            vector = rhs if scalar_l else lhs
+            return {labels: _apply(op, lhs if scalar_l else v, v if scalar_l else rhs,
+                                   keep=v)
+                    for labels, v in vector.items()}
+        return {labels: _apply(op, v, rhs[labels], keep=v)
+                for labels, v in lhs.items() if labels in rhs}
+
+
+def _matches(value: str, op: str, want: str) -> bool:
+    if op == "=":
+        return value == want
+    if op == "!=":
+        return value != want
+    hit = re.fullmatch(want, value) is not None
+    return hit if op == "=~" else not hit
+
+
+def _apply(op: str, a, b, keep=None):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if op == "+":
+            return a + b
+        if op == "-":
+            return a - b
+        if op == "*":
+            return a * b
+        if op == "/":
+            return np.divide(a, b, dtype=float)   # x/0 is ±Inf or NaN, as in PromQL
+        # Comparisons filter: keep the vector-side sample where true.
+        passed = {"==": np.equal, "!=": np.not_equal, ">": np.greater, "<": np.less,
+                  ">=": np.greater_equal, "<=": np.less_equal}[op](a, b)
+        return np.where(passed, keep, np.nan)
+
+
+def _histogram_quantile(q: float, vector: dict) -> dict:
+    """Prometheus' bucketQuantile (linear interpolation inside the bucket) per group."""
+    groups: dict[tuple, list[tuple[float, np.ndarray]]] = {}
+    for labels, values in vector.items():
+        le = dict(labels).get("le")
+        if le is None:
+            continue
+        key = tuple(pair for pair in labels if pair[0] != "le")
+        groups.setdefault(key, []).append((math.inf if le == "+Inf" else float(le), values))
+    out = {}
+    for key, buckets in groups.items():
+        buckets.sort(key=lambda b: b[0])
+        if not math.isinf(buckets[-1][0]) or len(buckets) < 2:
+            out[key] = np.full_like(buckets[0][1], np.nan)
+            continue
+        bounds = np.array([b for b, _ in buckets])
+        counts = np.maximum.accumulate(np.vstack([v for _, v in buckets]), axis=0)
+        total = counts[-1]
+        rank = q * total
+        index = np.argmax(counts >= rank, axis=0)
+        cols = np.arange(counts.shape[1])
+        upper = bounds[index]
+        lower = np.where(index > 0, bounds[np.maximum(index - 1, 0)], 0.0)
+        below = np.where(index > 0, counts[np.maximum(index - 1, 0), cols], 0.0)
+        in_bucket = counts[index, cols] - below
+        with np.errstate(invalid="ignore", divide="ignore"):
+            value = lower + (upper - lower) * (rank - below) / in_bucket
+        value = np.where(index == len(bounds) - 1, bounds[-2], value)
+        out[key] = np.where((total > 0) & ~np.isnan(total), value, np.nan)
+    return out
+
+
+# --- simulation ----------------------------------------------------------------
+
+def load_slos(path: str | Path) -> dict[str, list[dict]]:
+    """{service: [{"slo", "target", "query"}]} from manifests in a file or directory."""
+    root = Path(path)
+    files = sorted(root.glob("*.yaml")) + sorted(root.glob("*.yml")) if root.is_dir() else [root]
+    slos: dict[str, list[dict]] = {}
+    for file in files:
+        with open(file) as fh:
+            for doc in yaml.safe_load_all(fh):
+                if not isinstance(doc, dict) or doc.get("kind") != "ServiceReliabilityManifest":
+                    continue
+                name = doc["metadata"]["name"]
+                for slo_name, slo in ((doc.get("spec") or {}).get("slos") or {}).items():
+                    query = ((slo or {}).get("indicator") or {}).get("query")
+                    if query and slo.get("target") is not None:
+                        slos.setdefault(name, []).append({
+                            "slo": slo_name, "target": float(slo["target"]), "query": query,
+                        })
+    return slos
+
+
+def simulate(services: dict[str, dict], events: list[tuple[float, str, object]], end: float,
+             slos: dict[str, list[dict]], step: float = 0.1, scrape_interval: float = 0.0,
+             burn_threshold: float = 1.0) -> dict:
+    """Expected breach / recovery timeline for ``events`` over ``[0, end]`` seconds.
+
+    ``services`` maps name to its scenario entry (``type``, optional ``rps``);
+    ``events`` are (offset seconds, service, control) with control a
+    /control body or "reset". The grid starts one longest range window
+    before 0 so every rate() is defined from the first scenario instant.
+    """
+    queries = [slo for name in services for slo in slos.get(name, [])]
+    windows = [w for slo in queries for w in range_windows(slo["query"])]
+    preroll = max(windows, default=0.0) + max(scrape_interval, step)
+    t = np.arange(-math.ceil(preroll / step), math.floor(end / step) + 1) * step
+
+    changes: dict[tuple[str, str], list] = {}
+    for offset, name, control in sorted(events, key=lambda e: e[0]):
+        if name not in services:
+            continue
+        baseline = {**BASELINE, "rps": float(services[name].get("rps") or DEFAULT_RPS)}
+        specs = ({key: {"target": value, "shape": "linear", "duration": DEFAULT_RAMP_SECONDS}
+                  for key, value in baseline.items()}
+                 if control == "reset" else parse_control(control))
+        for key, spec in specs.items():
+            changes.setdefault((name, key), []).append((offset, _with_defaults(spec)))
+
+    series: dict[str, list[tuple[tuple, np.ndarray]]] = {}
+    for name, svc in services.items():
+        baseline = {**BASELINE, "rps": float(svc.get("rps") or DEFAULT_RPS)}
+        values = {key: _key_values(base, changes.get((name, key), []), t)
+                  for key, base in baseline.items()}
+        svc_type = "ai-gate" if svc.get("type") == "ai-gate" else "api"
+        for metric, rows in _service_series(name, svc_type, values, step).items():
+            series.setdefault(metric, []).extend(rows)
+
+    if scrape_interval > 0:
+        # Hold each counter at its last scrape, as Prometheus would see it.
+        held = (np.floor((t - t[0]) / scrape_interval + 1e-9) * scrape_interval / step)
+        index = np.minimum(np.round(held).astype(int), len(t) - 1)
+        series = {metric: [(labels, values[index]) for labels, values in rows]
+                  for metric, rows in series.items()}
+
+    evaluator = Evaluator(series, step)
+    scenario = t >= -1e-9
+    results, timeline = [], []
+    for name in services:
+        for slo in slos.get(name, []):
+            row = {"service": name, "slo": slo["slo"], "target": slo["target"],
+                   "query": " ".join(slo["query"].split()), "breaches": [],
+                   "min_sli": None, "peak_burn_rate": None, "peak_ms": None, "error": None}
+            results.append(row)
+            try:
+                value = evaluator.evaluate(slo["query"])
+            except ValueError as exc:
+                row["error"] = str(exc)
+                continue
+            if isinstance(value, dict):
+                value = next(iter(value.values()), np.full_like(t, np.nan))
+            sli = np.broadcast_to(np.asarray(value, dtype=float), t.shape)[scenario]
+            times = t[scenario]
+            budget = 1 - slo["target"] / 100
+            with np.errstate(invalid="ignore", divide="ignore"):
+                burn = (1 - sli) / budget if budget > 0 else np.where(sli < 1, np.inf, 0.0)
+            if np.isnan(sli).all():
+                row["error"] = "query returned no data"
+                continue
+            row["min_sli"] = round(float(np.nanmin(sli)), 6)
+            peak = int(np.nanargmax(burn))
+            row["peak_burn_rate"] = round(float(burn[peak]), 3)
+            row["peak_ms"] = round(times[peak] * 1000)
+            breached = np.nan_to_num(burn, nan=0.0) >= burn_threshold
+            flips = np.flatnonzero(np.diff(breached.astype(np.int8))) + 1
+            edges = ([0] if breached[0] else []) + flips.tolist()
+            for edge in edges:
+                ms = round(times[edge] * 1000)
+                kind = "breach" if breached[edge] else "recover"
+                if kind == "breach":
+                    row["breaches"].append({"breach_ms": ms, "recover_ms": None})
+                elif row["breaches"]:
+                    row["breaches"][-1]["recover_ms"] = ms
+                timeline.append({"t_ms": ms, "service": name, "slo": slo["slo"],
+                                 "event": kind, "sli": round(float(sli[edge]), 6),
+                                 "burn_rate": round(float(burn[edge]), 3)})
+    timeline.sort(key=lambda e: (e["t_ms"], e["service"], e["slo"]))
+    return {"step_ms": round(step * 1000), "end_ms": round(end * 1000),
+            "scrape_interval_ms": round(scrape_interval * 1000),
+            "burn_threshold": burn_threshold, "slos": results, "timeline": timeline}
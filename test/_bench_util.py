@@ -0,0 +1,39 @@
+"""Latency bookkeeping shared by the test/ benchmarks and demo/ scenario runner.
+
+Used by ``test/fake-service-loadbench.py``, ``test/lineage-bench.py``,
+``test/store-bench.py``, ``test/three_tier_assertions.py`` (latency-report,
+render-portfolio --timings), ``test/fake-service.py`` (/debug/stats tick
+lag) and ``demo/scenario-runner.py`` (via ``demo/_shared.py``), so every
+report ranks samples the same way.
+"""
+
+import math
+import threading
+from collections.abc import Iterable
+
+
+def percentile(values: Iterable[float], pct: float,
+               default: float | None = None) -> float | None:
+    """Nearest-rank percentile of ``values`` in any order; ``default`` when empty."""
+    ordered = sorted(values)
+    if not ordered:
+        return default
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class Recorder:
+    """Thread-safe latency samples (seconds) and error counts per operation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+
+    def record(self, op: str, seconds: float | None) -> None:
+        """Add one sample; ``None`` counts an error instead."""
+        with self._lock:
+            if seconds is None:
+                self.errors[op] = self.errors.get(op, 0) + 1
+            else:
+                self.latencies.setdefault(op, []).append(seconds)
@@ -0,0 +1,149 @@
+"""Bounded-pool HTTP/1.1 keep-alive server shared by the test/ helpers.
+
+Used by ``test/fake-service.py`` and ``test/webhook-receiver.py``. Workers
+only ever hold a connection while a request is being read, handled and
+answered: between requests, idle keep-alive sockets are parked in a
+selector and handed back to the pool when the next request arrives. Idle
+scrapers therefore never starve /control of a worker, however many of them
+keep connections open.
+"""
+
+import contextlib
+import selectors
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+IDLE_TIMEOUT = 15.0     # parked keep-alive connections are closed after this
+REQUEST_TIMEOUT = 5.0   # a worker gives up on a request that stalls mid-read
+LINGER = 0.002          # how long a worker waits for a back-to-back request before parking
+SLICE = 0.05            # most time one connection keeps a worker before going to the back
+
+
+class PooledRequestHandler(BaseHTTPRequestHandler):
+    """BaseHTTPRequestHandler that serves one request per dispatch.
+
+    Under PooledHTTPServer the connection goes back to the server's selector
+    after each response instead of blocking the worker on the next request
+    line. A request that arrives within LINGER of the last response (a busy
+    client, or one already pipelined into this handler's read buffer) is
+    served in place, which spares the selector round trip, for up to SLICE
+    seconds; then the connection queues behind everyone else. Bytes already
+    read into this handler's buffer are always served here, since they
+    would be lost with it. Under any other server the stock keep-alive loop
+    runs.
+    """
+
+    protocol_version = "HTTP/1.1"   # keep-alive; every response sets Content-Length
+    timeout = REQUEST_TIMEOUT
+    # Headers and body go out as separate writes; without TCP_NODELAY a
+    # keep-alive client hits the Nagle / delayed-ACK 40 ms stall.
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        if not isinstance(self.server, PooledHTTPServer):
+            super().handle()
+            return
+        self.close_connection = True
+        until = time.monotonic() + SLICE
+        self.handle_one_request()
+        while not self.close_connection and self._next_request_ready(
+                LINGER if time.monotonic() < until else 0):
+            self.handle_one_request()
+
+    def _next_request_ready(self, wait: float) -> bool:
+        """True when the next request is buffered or arrives within ``wait``."""
+        self.connection.settimeout(wait)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:   # includes the timeout
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that hands ready requests to a bounded thread pool.
+
+    Unlike ThreadingHTTPServer the thread count is capped, so a scrape storm
+    cannot spawn unbounded threads that compete with the traffic tick. The
+    handler class must derive from PooledRequestHandler.
+    """
+
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, workers: int,
+                 idle_timeout: float = IDLE_TIMEOUT):
+        super().__init__(server_address, handler_class)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http")
+        self._idle_timeout = idle_timeout
+        self._selector = selectors.DefaultSelector()
+        self._parking: list[tuple[socket.socket, object]] = []
+        self._parking_lock = threading.Lock()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._closed = threading.Event()
+        threading.Thread(target=self._watch_idle, name="http-idle", daemon=True).start()
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._serve, request, client_address)
+
+    def _serve(self, request, client_address):
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+        except Exception:
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+            return
+        if handler.close_connection or self._closed.is_set():
+            self.shutdown_request(request)
+        else:
+            self._park(request, client_address)
+
+    def _park(self, request, client_address):
+        with self._parking_lock:
+            self._parking.append((request, client_address))
+        self._wake()
+
+    def _wake(self):
+        with contextlib.suppress(OSError):
+            self._wake_w.send(b"\0")
+
+    def _watch_idle(self):
+        """Park idle connections; dispatch them when readable, reap them when stale."""
+        parked_at: dict[socket.socket, float] = {}
+        while not self._closed.is_set():
+            with self._parking_lock:
+                parking, self._parking = self._parking, []
+            now = time.monotonic()
+            for request, client_address in parking:
+                self._selector.register(request, selectors.EVENT_READ, client_address)
+                parked_at[request] = now
+            for key, _ in self._selector.select(timeout=1.0):
+                if key.fileobj is self._wake_r:
+                    with contextlib.suppress(BlockingIOError):
+                        while self._wake_r.recv(4096):
+                            pass
+                    continue
+                self._selector.unregister(key.fileobj)
+                parked_at.pop(key.fileobj, None)
+                try:
+                    self._pool.submit(self._serve, key.fileobj, key.data)
+                except RuntimeError:   # pool shut down by server_close
+                    self.shutdown_request(key.fileobj)
+            deadline = time.monotonic() - self._idle_timeout
+            for request in [r for r, t in parked_at.items() if t < deadline]:
+                self._selector.unregister(request)
+                del parked_at[request]
+                self.shutdown_request(request)
+        for request in parked_at:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._closed.set()
+        self._wake()
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,229 @@
+"""Scenario durations and phase actions: validation and expansion into timed firings.
+
+Shared by ``test/fake-service.py backfill --scenario`` and
+``demo/scenario-runner.py`` (live dispatch, ``--simulate``; loaded through
+``demo/_shared.py``), so one scenario file fires the same controls at the
+same offsets everywhere. An action is::
+
+    - service: fraud-detect          # or services: [a, b] / services: "*"
+      control: {error_rate: 0.1}     # a /control body, "reset", or a list
+      at: 250ms                      # optional: offset into the phase
+      every: 5s                      # optional: repeat ...
+      until: 30s                     #   ... until this offset (default: phase end)
+      count: 3                       #   ... or this many times (at least 1)
+      jitter: 100ms                  # optional: uniform random delay per firing
+      stagger: 1s                    # optional: spacing between listed services
+
+A list ``control`` cycles one entry per firing. Unknown keys, services and
+control values raise ``ValueError`` naming the problem; controls are
+checked with ``parse_control``, the same validation fake-service's /control
+applies. Stdlib only.
+
+``parse_duration`` is the one duration grammar for phase durations, action
+offsets, /control ramps (fake-service), backfill and simulator options, and
+PromQL range windows in ``--simulate``: a number or bare numeric string is seconds,
+otherwise one or more ``<number><unit>`` parts (ms, s, m, h, d, w, y) such
+as 250ms, 1.5s or 1h30m; whitespace is ignored.
+"""
+from __future__ import annotations
+
+import random
+import re
+from collections.abc import Callable
+
+ACTION_KEYS = frozenset({"service", "services", "control", "at", "every", "until", "count",
+                         "jitter", "stagger"})
+DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800,
+                  "y": 31536000}
+CONTROL_KEYS = ("error_rate", "latency_p99", "reversal_rate", "rps")
+CURVE_SHAPES = ("linear", "exponential", "step", "sine", "diurnal", "jitter")
+DEFAULT_RAMP_SECONDS = 15.0   # a bare number in /control ramps linearly over this
+_NUMBER = r"[0-9]*\.?[0-9]+"
+_DURATION_PART = re.compile(rf"({_NUMBER})(ms|s|m|h|d|w|y)")
+
+
+def parse_duration(value) -> float:
+    """Seconds from a number or a duration string such as 30, 250ms, 15s, 1h30m, 30d."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = re.sub(r"\s+", "", str(value))
+    if re.fullmatch(_NUMBER, text):
+        return float(text)
+    parts = _DURATION_PART.findall(text)
+    if not parts or "".join(number + unit for number, unit in parts) != text:
+        raise ValueError(f"invalid duration: {value!r}")
+    return sum(float(number) * DURATION_UNITS[unit] for number, unit in parts)
+
+
+def parse_offset(value, field: str) -> float:
+    """``parse_duration`` with ``field`` named in the error."""
+    try:
+        return parse_duration(value)
+    except ValueError:
+        raise ValueError(f"invalid {field}: {value!r}") from None
+
+
+def phase_duration(phase: dict) -> float:
+    """A phase's ``duration`` in scenario seconds (default 10); accepts "15s", "2m", ...
+
+    Raises ValueError naming the phase.
+    """
+    try:
+        return parse_duration(phase.get("duration", 10))
+    except ValueError:
+        raise ValueError(f"phase {phase.get('name', '?')!r}: invalid duration: "
+                         f"{phase.get('duration')!r}") from None
+
+
+def parse_control(body: dict) -> dict[str, dict]:
+    """Validate a /control body into {key: curve spec}; raises ValueError.
+
+    Used by fake-service's /control handler and backfill, by ``parse_action``
+    for scenario controls, and by scenario_sim (``--simulate``).
+
+    Each key takes a bare number (ramped with the body-level ``shape`` /
+    ``duration``, default linear over DEFAULT_RAMP_SECONDS) or an object
+    ``{"target", "shape", "duration", "amplitude", "period"}``. Durations
+    accept seconds or strings such as "30s" / "2m"; they are scenario
+    seconds, compressed by the service's ``speed``.
+    """
+    if not isinstance(body, dict):
+        raise ValueError("control body must be a JSON object")
+    specs = {}
+    for key in CONTROL_KEYS:
+        if key not in body:
+            continue
+        raw = body[key]
+        fields = dict(raw) if isinstance(raw, dict) else {"target": raw}
+        fields.setdefault("shape", body.get("shape", "linear"))
+        fields.setdefault("duration", body.get("duration", DEFAULT_RAMP_SECONDS))
+        unknown = set(fields) - {"target", "shape", "duration", "amplitude", "period"}
+        if unknown:
+            raise ValueError(f"unknown field(s) for {key}: {sorted(unknown)}")
+        if fields["shape"] not in CURVE_SHAPES:
+            raise ValueError(f"invalid shape for {key}: {fields['shape']!r} "
+                             f"(one of {', '.join(CURVE_SHAPES)})")
+        try:
+            spec = {
+                "target": float(fields["target"]),
+                "shape": fields["shape"],
+                "duration": parse_duration(fields["duration"]),
+            }
+            if fields.get("amplitude") is not None:
+                spec["amplitude"] = float(fields["amplitude"])
+            if fields.get("period") is not None:
+                spec["period"] = parse_duration(fields["period"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"invalid value for {key}") from None
+        specs[key] = spec
+    return specs
+
+
+def parse_action(action: dict, services, duration: float, speed: float = 1.0) -> dict:
+    """Validate one phase action into a timing spec in wall seconds; raises ValueError.
+
+    ``services`` is the collection of known service names (a mapping works).
+    """
+    if not isinstance(action, dict):
+        raise ValueError(f"action must be a mapping, got {action!r}")
+    unknown_keys = sorted(set(action) - ACTION_KEYS)
+    if unknown_keys:
+        raise ValueError(f"unsupported action key(s): {', '.join(unknown_keys)}")
+    if ("service" in action) == ("services" in action):
+        raise ValueError("action needs exactly one of service / services")
+    if "control" not in action:
+        raise ValueError("action has no control")
+    if "services" in action:
+        listed = action["services"]
+        if listed == "*":
+            names = list(services)
+        elif isinstance(listed, str):
+            names = [listed]
+        elif isinstance(listed, list):
+            names = list(listed)
+        else:
+            raise ValueError(f"services must be a name, a list or \"*\", got {listed!r}")
+    else:
+        names = [action["service"]]
+    unknown = [name for name in names if name not in services]
+    if unknown:
+        raise ValueError(f"Unknown service: {', '.join(unknown)}")
+    controls = action["control"]
+    controls = controls if isinstance(controls, list) else [controls]
+    for control in controls:
+        if control != "reset" and not isinstance(control, dict):
+            raise ValueError(f"Unknown control value: {control!r}")
+        if control != "reset":
+            parse_control(control)
+    spec = {
+        "services": names,
+        "controls": controls,
+        "at": parse_offset(action.get("at", 0), "at"),
+        "every": parse_offset(action["every"], "every") if "every" in action else None,
+        "until": parse_offset(action.get("until", duration), "until"),
+        "count": int(action["count"]) if "count" in action else None,
+        "jitter": parse_offset(action.get("jitter", 0), "jitter"),
+        "stagger": parse_offset(action.get("stagger", 0), "stagger"),
+    }
+    if spec["every"] is not None and spec["every"] <= 0:
+        raise ValueError("every must be positive")
+    if spec["count"] is not None and spec["count"] < 1:
+        raise ValueError("count must be at least 1")
+    for key in ("at", "every", "until", "jitter", "stagger"):
+        if spec[key] is not None:
+            spec[key] /= speed
+    return spec
+
+
+def plan_phases(scenario: dict, services=None, speed: float = 1.0,
+                on_error: Callable[[int, dict, Exception], None] | None = None,
+                ) -> list[tuple[float, list]]:
+    """(wall duration, action specs) per phase.
+
+    ``services`` defaults to the scenario's own ``services:`` block. An
+    invalid action raises ``ValueError`` naming its phase, unless
+    ``on_error(phase_index, phase, exc)`` is given, in which case it is
+    reported there and dropped.
+    """
+    if services is None:
+        services = scenario.get("services", {})
+    plans = []
+    for i, phase in enumerate(scenario.get("phases", [])):
+        duration = phase_duration(phase)
+        specs = []
+        for action in phase.get("actions", []):
+            try:
+                specs.append(parse_action(action, services, duration, speed))
+            except (KeyError, TypeError, ValueError) as exc:
+                if on_error is None:
+                    raise ValueError(f"phase {i + 1} ({phase.get('name', '?')}): {exc}") from None
+                on_error(i, phase, exc)
+        plans.append((duration / speed, specs))
+    return plans
+
+
+def expand_actions(plans: list[tuple[float, list]],
+                   rng: random.Random) -> list[tuple[float, int, str, object]]:
+    """Every firing as (seconds from scenario start, phase index, service, control).
+
+    Repeats are laid out from the nominal time, so jitter never accumulates.
+    """
+    events = []
+    phase_start = 0.0
+    for i, (duration, specs) in enumerate(plans):
+        for spec in specs:
+            for j, name in enumerate(spec["services"]):
+                nominal = phase_start + spec["at"] + j * spec["stagger"]
+                k = 0
+                while True:
+                    control = spec["controls"][k % len(spec["controls"])]
+                    events.append((nominal + rng.uniform(0, spec["jitter"]), i, name, control))
+                    k += 1
+                    if spec["every"] is None:
+                        break
+                    nominal += spec["every"]
+                    if nominal >= phase_start + spec["until"] or (spec["count"] is not None
+                                                                  and k >= spec["count"]):
+                        break
+        phase_start += duration
+    return events
@@ -196,6 +196,57 @@ boot_three_tier_stack() {
     tt_pass "workers ready (pid ${WORKERS_PID})"
 }
 
+# ---------------------------------------------------------------------------
+# Load generator health
+# ---------------------------------------------------------------------------
+
+# check_fake_service_saturation FAKE_PORT [WORK_DIR]
+#
+# Read fake-service's /debug/stats and tt_fail with "generator saturated"
+# (plus the reasons it reports) when the load generator could not keep up
+# with its target rate over the last few seconds. Call it before a latency
+# assertion so a slow generator is not misread as slow workers. When
+# WORK_DIR is given the raw stats are kept as fake-stats.json for the
+# post-mortem. A fake-service without the endpoint (older checkout) or one
+# that is already down is skipped with an info line, not failed.
+check_fake_service_saturation() {
+    local fake_port="$1"
+    local work_dir="${2:-}"
+    local stats
+    if ! stats=$(curl -fsS "http://localhost:${fake_port}/debug/stats" 2>/dev/null); then
+        tt_info "fake-service /debug/stats unavailable; skipping saturation check"
+        return 0
+    fi
+    [[ -n "${work_dir}" ]] && printf '%s\n' "${stats}" >"${work_dir}/fake-stats.json"
+    if [[ "$(jq -r '.saturated' <<<"${stats}")" == "true" ]]; then
+        tt_fail "generator saturated — fake-service fell behind its target rate ($(jq -r '.reasons | join("; ")' <<<"${stats}")); latency results are not meaningful"
+    fi
+    tt_pass "fake-service generator keeping up ($(jq -r '"\(.achieved_rps)/\(.target_rps) rps, busy \(.busy_fraction)"' <<<"${stats}"))"
+}
+
+# ---------------------------------------------------------------------------
+# Assertion batches
+# ---------------------------------------------------------------------------
+
+# run_assertion_batch RUN_BENCH ASSERTIONS CORE_URL < batch.jsonl
+#
+# Run `three_tier_assertions.py batch` over the JSON lines on stdin (one
+# interpreter and one core connection for every entry) and print its
+# KEY=value output for the caller to eval. A failed entry is reported in
+# the trailing BATCH_FAILED=<ids> line, not in the exit status: the
+# status is non-zero only when that line never appeared (the helper
+# crashed, rejected its input, or the venv failed to resolve), so a
+# batch that died early cannot be read as "nothing failed".
+run_assertion_batch() {
+    local run_bench="$1"
+    local assertions="$2"
+    local core_url="$3"
+    local output
+    output=$(${run_bench} python "${assertions}" batch --core-url "${core_url}") || true
+    printf '%s\n' "${output}"
+    [[ $'\n'"${output}" == *$'\n'BATCH_FAILED=* ]]
+}
+
 # ---------------------------------------------------------------------------
 # Teardown
 # ---------------------------------------------------------------------------
@@ -246,6 +297,12 @@ teardown_three_tier_stack() {
 
     tt_log "Teardown"
 
+    # Keep the generator's self-stats alongside fake.log so a failed run
+    # shows whether the load generator was saturated. Best-effort, like
+    # the reset below.
+    curl -sf "http://localhost:${fake_port}/debug/stats" \
+        >"${work_dir}/fake-stats.json" 2>/dev/null || true
+
     # Best-effort fake-service reset before stopping it. Errors (already
     # gone, port refused) are expected during partial-boot teardowns.
     curl -sf -X POST "http://localhost:${fake_port}/reset" >/dev/null 2>&1 || true
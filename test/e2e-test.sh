@@ -284,26 +284,34 @@ TRIAGE_ID=""
 CASE_ID=""
 
 step7() {
-    local output
-    output=$(${RUN_BENCH} python "${ASSERTIONS}" wait-verdict-type triage \
-        --core-url "${CORE_URL}" --timeout 60 --interval 1) \
-        || { fail "no triage verdict in 60s"; return; }
+    # One interpreter and one core connection for all three checks: the
+    # triage and case waits run concurrently (the case budget is the old
+    # 60s + 30s sequential one), and the lineage assertion starts as soon
+    # as the triage verdict resolves.
+    local output BATCH_FAILED=""
+    output=$(run_assertion_batch "${RUN_BENCH}" "${ASSERTIONS}" "${CORE_URL}" <<EOF
+{"id": "triage", "prefix": "TRIAGE_", "argv": ["wait-verdict-type", "triage", "--timeout", "60"]}
+{"id": "case", "argv": ["wait-case", "--service", "fraud-detect", "--timeout", "90"]}
+{"id": "lineage", "argv": ["assert-lineage", "\${triage.VERDICT_ID}", "${QUALITY_BREACH_ID}"]}
+EOF
+    ) || { fail "assertion batch exited without reporting BATCH_FAILED"; return; }
     eval "${output}"
-    TRIAGE_ID="${VERDICT_ID}"
+    case ",${BATCH_FAILED}," in
+        *,triage,*) fail "no triage verdict in 60s"; return ;;
+    esac
+    TRIAGE_ID="${TRIAGE_VERDICT_ID}"
     info "triage verdict: ${TRIAGE_ID}"
 
-    output=$(${RUN_BENCH} python "${ASSERTIONS}" wait-case \
-        --service fraud-detect --core-url "${CORE_URL}" \
-        --timeout 30 --interval 1) \
-        || { fail "no case in 30s"; return; }
-    eval "${output}"
+    case ",${BATCH_FAILED}," in
+        *,case,*) fail "no case in 90s"; return ;;
+    esac
     [[ -n "${CASE_ID}" ]] || { fail "empty case id"; return; }
     info "case: ${CASE_ID} priority=${CASE_PRIORITY}"
 
     info "Lineage check: triage ancestors must reach quality_breach"
-    ${RUN_BENCH} python "${ASSERTIONS}" assert-lineage \
-        "${TRIAGE_ID}" "${QUALITY_BREACH_ID}" --core-url "${CORE_URL}" >/dev/null \
-        || { fail "lineage assertion failed"; return; }
+    case ",${BATCH_FAILED}," in
+        *,lineage,*) fail "lineage assertion failed"; return ;;
+    esac
     pass
 }
 
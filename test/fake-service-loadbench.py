@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+fake-service-loadbench.py — latency of /control and /metrics under concurrent scrapers.
+
+Runs N scraper threads hammering GET /metrics over keep-alive connections
+while one control thread POSTs /control at a fixed rate, then prints
+p50/p95/p99/max per endpoint. The question it answers: does a scenario
+control action still land on time while Prometheus is scraping?
+
+--idle-conns N also parks N keep-alive connections that make one request
+and then sit idle for the whole run, the way a scraper does between
+scrapes. A server that pins a worker per connection stalls /control for
+its whole idle timeout once N reaches its pool size.
+
+Usage:
+    # against an already-running fake-service
+    python test/fake-service-loadbench.py --url http://localhost:8001
+
+    # spawn one (extra args are passed to fake-service.py), e.g. compare pools
+    python test/fake-service-loadbench.py --spawn --port 18001 -- --name bench --workers 1
+    python test/fake-service-loadbench.py --spawn --port 18001 -- --name bench --workers 16
+
+    # 64 idle keep-alive connections against a 16-worker pool
+    python test/fake-service-loadbench.py --spawn --port 18001 --idle-conns 64 -- --name bench
+"""
+
+import argparse
+import http.client
+import json
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+
+from _bench_util import Recorder, percentile
+
+FAKE_SERVICE = Path(__file__).with_name("fake-service.py")
+
+
+def _request(conn: http.client.HTTPConnection, method: str, path: str,
+             body: bytes | None, headers: dict) -> float | None:
+    start = time.perf_counter()
+    try:
+        conn.request(method, path, body=body, headers=headers)
+        resp = conn.getresponse()
+        resp.read()
+    except (OSError, http.client.HTTPException):
+        conn.close()   # reconnects on the next request
+        return None
+    if resp.status >= 400:
+        return None
+    return time.perf_counter() - start
+
+
+def _scraper(host: str, port: int, stop: threading.Event, rec: Recorder, use_gzip: bool) -> None:
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    headers = {"Accept-Encoding": "gzip"} if use_gzip else {}
+    while not stop.is_set():
+        rec.record("/metrics", _request(conn, "GET", "/metrics", None, headers))
+    conn.close()
+
+
+def _open_idle(host: str, port: int, count: int) -> list[http.client.HTTPConnection]:
+    """Open ``count`` keep-alive connections, each served once and then left idle."""
+    conns = []
+    for _ in range(count):
+        conn = http.client.HTTPConnection(host, port, timeout=30)
+        if _request(conn, "GET", "/health", None, {}) is None:
+            print("warning: an idle connection failed its first request", file=sys.stderr)
+        conns.append(conn)
+    return conns
+
+
+def _controller(host: str, port: int, stop: threading.Event, rec: Recorder,
+                rate: float, body: bytes) -> None:
+    conn = http.client.HTTPConnection(host, port, timeout=30)
+    headers = {"Content-Type": "application/json"}
+    interval = 1.0 / rate
+    next_at = time.monotonic()
+    while not stop.is_set():
+        rec.record("/control", _request(conn, "POST", "/control", body, headers))
+        next_at += interval
+        stop.wait(max(0.0, next_at - time.monotonic()))
+    conn.close()
+
+
+def _wait_healthy(host: str, port: int, deadline: float) -> bool:
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=1)
+            conn.request("GET", "/health")
+            if conn.getresponse().status == 200:
+                return True
+        except OSError:
+            pass
+        time.sleep(0.2)
+    return False
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load benchmark for fake-service HTTP serving")
+    parser.add_argument("--url", default="http://localhost:8001", help="fake-service base URL")
+    parser.add_argument("--scrapers", type=int, default=8, help="concurrent /metrics scrapers")
+    parser.add_argument("--idle-conns", type=int, default=0,
+                        help="keep-alive connections opened with one request, then left idle")
+    parser.add_argument("--control-rate", type=float, default=5.0, help="/control POSTs per second")
+    parser.add_argument("--control-body", default='{"error_rate": 0.0}',
+                        help="JSON body sent to /control")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--gzip", action="store_true", help="scrape with Accept-Encoding: gzip")
+    parser.add_argument("--spawn", action="store_true",
+                        help="start fake-service.py on --port with the trailing args")
+    parser.add_argument("--port", type=int, default=None, help="port for --spawn")
+    parser.add_argument("fake_args", nargs="*", help="args for fake-service.py (after --)")
+    args = parser.parse_args()
+
+    url = urllib.parse.urlsplit(args.url)
+    host, port = url.hostname or "localhost", args.port or url.port or 80
+
+    proc = None
+    if args.spawn:
+        cmd = [sys.executable, str(FAKE_SERVICE), "--port", str(port), *args.fake_args]
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+        if not _wait_healthy(host, port, time.monotonic() + 15):
+            proc.terminate()
+            print(f"fake-service did not become healthy on :{port}", file=sys.stderr)
+            return 1
+
+    try:
+        json.loads(args.control_body)
+    except json.JSONDecodeError as exc:
+        parser.error(f"--control-body is not JSON: {exc}")
+
+    rec, stop = Recorder(), threading.Event()
+    idle = _open_idle(host, port, args.idle_conns)
+    threads = [
+        threading.Thread(target=_scraper, args=(host, port, stop, rec, args.gzip), daemon=True)
+        for _ in range(args.scrapers)
+    ]
+    threads.append(threading.Thread(
+        target=_controller,
+        args=(host, port, stop, rec, args.control_rate, args.control_body.encode()),
+        daemon=True,
+    ))
+    try:
+        for t in threads:
+            t.start()
+        time.sleep(args.duration)
+        stop.set()
+        for t in threads:
+            t.join(timeout=35)
+    finally:
+        for conn in idle:
+            conn.close()
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    print(f"{args.scrapers} scrapers, {args.idle_conns} idle, "
+          f"/control at {args.control_rate:g}/s, "
+          f"{args.duration:g}s against {host}:{port}{' (gzip)' if args.gzip else ''}")
+    print(f"  {'endpoint':<10} {'n':>7} {'err':>5} {'req/s':>8} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for endpoint in ("/control", "/metrics"):
+        values = sorted(rec.latencies.get(endpoint, []))
+        ms = [percentile(values, p, default=float("nan")) * 1000 for p in (50, 95, 99, 100)]
+        print(f"  {endpoint:<10} {len(values):>7} {rec.errors.get(endpoint, 0):>5} "
+              f"{len(values) / args.duration:>8.1f} "
+              + " ".join(f"{v:>8.1f}" for v in ms))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
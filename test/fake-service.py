@@ -1,214 +1,1807 @@
 #!/usr/bin/env python3
 """
 fake-service.py — Prometheus metrics exporter that simulates a microservice.
-One instance per service. Controllable at runtime via HTTP.
+One instance per service, or many virtual services in one process with
+--services-file. Controllable at runtime via HTTP; see --help for the
+cardinality, remote-write, --api-port and backfill modes.
 
 Usage:
     python test/fake-service.py --name fraud-detect --type ai-gate --port 8001
     python test/fake-service.py --name payment-api --type api --port 8002
+    python test/fake-service.py --services-file demo/specs --port 8001 --api-port 9001
+    python test/fake-service.py backfill --services-file demo/specs --days 30 \
+        --end 1790000000 --resolution 15s --seed 1 --output backfill.om
 
 Control:
     curl -X POST localhost:8001/control -d '{"error_rate": 0.1, "reversal_rate": 0.08}'
+    curl -X POST localhost:8001/control -d '{"rps": {"target": 500, "shape": "diurnal"}}'
+    curl -X POST localhost:8001/control/fraud-detect -d '{"latency_p99": 2.0, "duration": "1m"}'
     curl -X POST localhost:8001/reset
     curl localhost:8001/metrics | grep http_requests_total
+    curl localhost:8001/debug/stats
 """
 
 import argparse
+import asyncio
+import bisect
+import collections
+import contextlib
+import functools
+import gzip
+import hashlib
+import http.client
+import itertools
 import json
 import math
+import queue
 import random
+import re
+import shutil
+import sys
+import tempfile
 import threading
 import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import urllib.parse
+from array import array
+from http.server import ThreadingHTTPServer
+from pathlib import Path
 
-from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from _bench_util import percentile
+from _pooled_http import IDLE_TIMEOUT, PooledHTTPServer, PooledRequestHandler
+from _scenario_actions import (
+    DEFAULT_RAMP_SECONDS,
+    expand_actions,
+    parse_control,
+    parse_duration,
+    plan_phases,
+)
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.utils import floatToGoString
+
+try:
+    import numpy as np
+except ImportError:  # _draw_batch falls back to the random module
+    np = None
+
+try:
+    import snappy  # python-snappy
+except ImportError:  # remote write falls back to literal-only snappy blocks
+    snappy = None
 
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
-parser = argparse.ArgumentParser(description="Fake microservice Prometheus exporter")
-parser.add_argument("--name", required=True, help="Service name (used as 'service' label)")
-parser.add_argument("--type", dest="svc_type", default="api", choices=["api", "ai-gate"],
+# Options shared by serving and the backfill subcommand.
+common = argparse.ArgumentParser(add_help=False)
+common.add_argument("--name", help="Service name (used as 'service' label)")
+common.add_argument("--type", dest="svc_type", default="api", choices=["api", "ai-gate"],
                     help="Service type (default: api)")
+common.add_argument("--rps", type=int, default=10, help="Baseline requests per second (default: 10)")
+common.add_argument("--services-file", metavar="PATH",
+                    help="Host every service declared in PATH (scenario YAML, services "
+                         "mapping, SRM manifest(s) or a manifest directory) behind one "
+                         "/metrics; /control and /reset hit every service, "
+                         "/control/<name> and /reset/<name> one")
+common.add_argument("--cardinality", metavar="PATH",
+                    help="Cardinality profile YAML (a 'dimensions:' mapping such as "
+                         "endpoint: {values: 50, skew: zipf}) applied to every service "
+                         "without its own 'cardinality:' key")
+common.add_argument("--seed", type=int, default=None,
+                    help="RNG seed for reproducible traffic (backfill default: 0)")
+
+parser = argparse.ArgumentParser(description="Fake microservice Prometheus exporter",
+                                 parents=[common],
+                                 epilog="POST /control takes error_rate, latency_p99, "
+                                        "reversal_rate and rps as numbers or curves "
+                                        "({target, shape, duration}), plus a body-level "
+                                        "speed that compresses scenario time.")
 parser.add_argument("--port", type=int, default=8001, help="HTTP server port (default: 8001)")
-parser.add_argument("--rps", type=int, default=10, help="Baseline requests per second (default: 10)")
+parser.add_argument("--tick", type=float, default=0.1,
+                    help="Traffic generation tick in seconds; each tick draws the whole "
+                         "interval's requests as one batch (default: 0.1)")
+parser.add_argument("--workers", type=int, default=16,
+                    help="HTTP worker threads; idle keep-alive connections wait in a "
+                         "selector and hold no worker (0 = one thread per connection, "
+                         "default: 16)")
+parser.add_argument("--remote-write", metavar="URL",
+                    help="Also push samples to this Prometheus remote-write endpoint, "
+                         "e.g. http://localhost:9090/api/v1/write (Prometheus needs "
+                         "--web.enable-remote-write-receiver; drop its scrape of this "
+                         "port; test/remote-write-receiver.py is a local stand-in)")
+parser.add_argument("--remote-write-interval", type=float, default=0.0,
+                    help="Seconds between pushes; every push carries every series' full "
+                         "label set, so raise it for large cardinality profiles "
+                         "(default: 0 = every tick)")
+parser.add_argument("--remote-write-shards", type=int, default=2,
+                    help="Parallel senders, one keep-alive connection each (default: 2)")
+parser.add_argument("--remote-write-queue", type=int, default=64,
+                    help="Pending batches per shard before the oldest is dropped (default: 64)")
+parser.add_argument("--remote-write-retries", type=int, default=3,
+                    help="Retries per batch on connection errors, 5xx and 429 (default: 3)")
+parser.add_argument("--remote-write-timeout", type=float, default=5.0,
+                    help="Per-request timeout in seconds (default: 5)")
+parser.add_argument("--remote-write-label", action="append", default=[], metavar="NAME=VALUE",
+                    help="Extra label on every pushed series; job=fake-services and "
+                         "instance=<port> are set unless overridden (repeatable)")
+parser.add_argument("--api-port", type=int, default=None, metavar="PORT",
+                    help="Serve a real /api endpoint per service on PORT (asyncio), calling "
+                         "declared dependencies, and record metrics from real request timings "
+                         "instead of synthetic counters")
+parser.add_argument("--upstream", action="append", default=[], metavar="NAME=URL",
+                    help="Where to reach a dependency not hosted in this process, e.g. "
+                         "fraud-detect=http://localhost:9001/api; with --name every "
+                         "upstream is a critical dependency (repeatable)")
+parser.add_argument("--upstream-timeout", type=float, default=1.0,
+                    help="Per-call dependency timeout in seconds (default: 1.0)")
+parser.add_argument("--upstream-pool", type=int, default=32,
+                    help="Keep-alive connections per upstream (default: 32)")
+parser.add_argument("--loadgen", choices=["entry", "all", "none"], default="entry",
+                    help="Open-loop load at each service's rps curve in --api-port mode: "
+                         "entry = services nothing else here depends on (default)")
+parser.add_argument("--loadgen-max-inflight", type=int, default=10000,
+                    help="Outstanding load-generator requests before arrivals are dropped "
+                         "(default: 10000)")
+subcommands = parser.add_subparsers(dest="command")
+backfill_parser = subcommands.add_parser(
+    "backfill", parents=[common],
+    help="Stream N days of historical samples as OpenMetrics text (for promtool)",
+    description="Run the curve model and tick engine on a simulated clock and write "
+                "OpenMetrics text with timestamps, byte-identical for a given --seed and "
+                "--end. "
+                "Load it with: promtool tsdb create-blocks-from openmetrics FILE DIR",
+)
+backfill_parser.add_argument("--days", type=float, default=30.0,
+                             help="Length of the backfilled window in days (default: 30)")
+backfill_parser.add_argument("--resolution", default="15s",
+                             help="Sample spacing, e.g. 5s, 1m (default: 15s)")
+backfill_parser.add_argument("--end", required=True, metavar="UNIX_TS|now",
+                             help="Window end as a Unix timestamp; 'now' uses the wall "
+                                  "clock, so its output is not reproducible")
+backfill_parser.add_argument("--scenario", metavar="PATH",
+                             help="Replay this scenario's phase actions inside the window")
+backfill_parser.add_argument("--scenario-at", default="0s",
+                             help="Offset from window start at which the scenario begins "
+                                  "(e.g. 20d; default: 0s)")
+backfill_parser.add_argument("--output", default="-",
+                             help="Output file (default: stdout)")
 args = parser.parse_args()
 
-SERVICE_NAME = args.name
-SERVICE_TYPE = args.svc_type
+if not args.name and not args.services_file:
+    parser.error("one of --name or --services-file is required")
+
 PORT = args.port
 BASELINE_RPS = args.rps
+TICK_INTERVAL = args.tick
 
 # ---------------------------------------------------------------------------
 # Prometheus metrics
 # ---------------------------------------------------------------------------
 
-http_requests_total = Counter(
-    "http_requests_total",
-    "Total HTTP requests",
-    ["service", "status"],
-)
+# Traffic metrics bypass prometheus_client's Counter / Histogram children:
+# the tick engine applies whole batches (n requests, per-bucket counts) at
+# once, which the child API can only do one observe() at a time, and the
+# exposition is rendered straight from the count arrays (see
+# _render_traffic) because building a MetricFamily object per sample is too
+# slow at 10k+ series.
 
-http_request_duration_seconds = Histogram(
-    "http_request_duration_seconds",
-    "HTTP request duration in seconds",
-    ["service"],
-)
+LATENCY_BUCKETS = Histogram.DEFAULT_BUCKETS   # upper bounds, ends with +Inf
+STATUSES = ("200", "400", "500")
+AI_ACTIONS = ("approve", "reject", "escalate")
+AI_ACTION_WEIGHTS = (0.80, 0.15, 0.05)        # baseline decision mix
+HCF_FRACTION = 0.20                           # share of overrides that are HCF
+
+
+MAX_SERIES = 1_000_000                         # per service, guards typos in profiles
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _load_yaml(path: str, purpose: str):
+    try:
+        import yaml
+    except ImportError:
+        raise SystemExit(f"pyyaml is required for {purpose}: pip install pyyaml") from None
+    with open(path) as fh:
+        return list(yaml.safe_load_all(fh))
+
+
+def _cumulative(weights) -> list[float]:
+    """Normalised CDF whose last entry is exactly 1.0 (bisect-safe)."""
+    total = sum(weights)
+    cdf = [w / total for w in itertools.accumulate(weights)]
+    cdf[-1] = 1.0
+    return cdf
+
+
+class CardinalityProfile:
+    """Label dimensions expanded into pre-bound series with traffic weights.
+
+    Series are the cartesian product of every dimension's values, indexed
+    0..size-1. ``series_labels[i]`` holds series i's label values and
+    ``cdf`` its cumulative traffic share, so per-request label lookup is a
+    single bisect into a flat array.
+    """
+
+    def __init__(self, dimensions: dict):
+        if not isinstance(dimensions, dict) or not dimensions:
+            raise ValueError("cardinality profile needs a non-empty 'dimensions' mapping")
+        self.label_names = tuple(dimensions)
+        reserved = {"service", "status", "le"} & set(self.label_names)
+        if reserved:
+            raise ValueError(f"reserved label name(s) in cardinality profile: {sorted(reserved)}")
+
+        values_per_dim, weights_per_dim = [], []
+        for name, spec in dimensions.items():
+            values, weights = self._dimension(name, spec or {})
+            values_per_dim.append(values)
+            weights_per_dim.append(weights)
+
+        self.size = math.prod(len(v) for v in values_per_dim)
+        if self.size > MAX_SERIES:
+            raise ValueError(f"cardinality profile expands to {self.size} series "
+                             f"(max {MAX_SERIES})")
+        self.series_labels = list(itertools.product(*values_per_dim))
+        self.cdf = _cumulative([math.prod(w) for w in itertools.product(*weights_per_dim)])
+
+    @staticmethod
+    def _dimension(name: str, spec) -> tuple[list[str], list[float]]:
+        if isinstance(spec, (int, list)):
+            spec = {"values": spec}
+        values = spec.get("values", 1)
+        if isinstance(values, int):
+            width = len(str(values - 1))
+            values = [f"{name}-{i:0{width}d}" for i in range(values)]
+        values = [str(v) for v in values]
+        if not values:
+            raise ValueError(f"dimension {name!r} has no values")
+        skew = spec.get("skew", "uniform")
+        if skew == "uniform":
+            weights = [1.0] * len(values)
+        elif skew == "zipf":
+            exponent = float(spec.get("s", 1.0))
+            weights = [1.0 / (rank ** exponent) for rank in range(1, len(values) + 1)]
+        else:
+            raise ValueError(f"dimension {name!r}: unknown skew {skew!r} (uniform | zipf)")
+        return values, weights
+
+    @classmethod
+    def from_config(cls, config) -> "CardinalityProfile":
+        """Build from an inline mapping or a path to a profile YAML."""
+        if isinstance(config, str):
+            docs = _load_yaml(config, "--cardinality")
+            config = docs[0] if docs else {}
+        return cls((config or {}).get("dimensions"))
+
+
+class TrafficTotals:
+    """Cumulative traffic counters for one service's series.
+
+    Per-series counts live in flat float64 arrays indexed
+    ``series * len(STATUSES) + status`` and ``series * len(LATENCY_BUCKETS)
+    + bucket`` — one compact buffer per metric instead of a labelled child
+    object per series.
+    """
+
+    def __init__(self, service: str, svc_type: str, profile: CardinalityProfile | None = None):
+        self.service = service
+        self.svc_type = svc_type
+        self.profile = profile
+        self.size = profile.size if profile else 1
+        # Pre-bound label set per series, already escaped for the exposition.
+        base = f'service="{_escape(service)}"'
+        if profile is None:
+            self.label_text = [base]
+        else:
+            self.label_text = [
+                base + "".join(f',{name}="{_escape(value)}"'
+                               for name, value in zip(profile.label_names, values, strict=True))
+                for values in profile.series_labels
+            ]
+        self._lock = threading.Lock()
+        self.requests = array("d", bytes(8 * self.size * len(STATUSES)))
+        self.bucket_counts = array("d", bytes(8 * self.size * len(LATENCY_BUCKETS)))  # not cumulative
+        self.duration_sums = array("d", bytes(8 * self.size))
+        self.decisions = dict.fromkeys(AI_ACTIONS, 0)
+        self.overrides = 0
+        self.overrides_hcf = 0
+        if np is not None:
+            self._views = {
+                "requests": np.frombuffer(self.requests, dtype=np.float64),
+                "buckets": np.frombuffer(self.bucket_counts, dtype=np.float64),
+                "duration_sums": np.frombuffer(self.duration_sums, dtype=np.float64),
+            }
+        if profile is not None and np is not None:
+            self.cdf = np.asarray(profile.cdf)
+        else:
+            self.cdf = profile.cdf if profile else None
+
+    def apply(self, batch: dict) -> None:
+        """Fold one tick's sparse (indices, counts) batch into the running totals."""
+        with self._lock:
+            if np is not None:
+                for key in ("requests", "buckets", "duration_sums"):
+                    idx, counts = batch[key]
+                    np.add.at(self._views[key], idx, counts)
+            else:
+                for key, target in (("requests", self.requests),
+                                    ("buckets", self.bucket_counts),
+                                    ("duration_sums", self.duration_sums)):
+                    idx, counts = batch[key]
+                    for i, count in zip(idx, counts, strict=True):
+                        target[i] += count
+            if self.svc_type == "ai-gate":
+                for action, count in zip(AI_ACTIONS, batch["actions"], strict=True):
+                    self.decisions[action] += count
+                self.overrides += batch["overrides"]
+                self.overrides_hcf += batch["overrides_hcf"]
+
+    def record(self, series: int, status: int, duration: float, action: int | None = None,
+               override: bool = False, hcf: bool = False) -> None:
+        """Fold one real request (--api-port mode) into the running totals."""
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, duration)
+        with self._lock:
+            self.requests[series * len(STATUSES) + status] += 1
+            self.bucket_counts[series * len(LATENCY_BUCKETS) + bucket] += 1
+            self.duration_sums[series] += duration
+            if action is not None:
+                self.decisions[AI_ACTIONS[action]] += 1
+                self.overrides += override
+                self.overrides_hcf += hcf
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests[:],
+                "bucket_counts": self.bucket_counts[:],
+                "duration_sums": self.duration_sums[:],
+                "decisions": dict(self.decisions),
+                "overrides": self.overrides,
+                "overrides_hcf": self.overrides_hcf,
+            }
+
+
+_BUCKET_LABELS = [floatToGoString(b) for b in LATENCY_BUCKETS]
+
+
+def _render_traffic() -> bytes:
+    """Text exposition of every hosted service's traffic families.
+
+    Each family's HELP/TYPE header is written once, followed by the samples
+    of every service; services with a cardinality profile simply carry more
+    labels within the same family.
+    """
+    n_status, n_buckets = len(STATUSES), len(LATENCY_BUCKETS)
+    snaps = [(svc, svc.traffic.snapshot()) for svc in SERVICES.values()]
+    out = [
+        "# HELP http_requests_total Total HTTP requests\n",
+        "# TYPE http_requests_total counter\n",
+    ]
+    for svc, snap in snaps:
+        counts = snap["requests"]
+        for i, labels in enumerate(svc.traffic.label_text):
+            for j, status in enumerate(STATUSES):
+                out.append(f'http_requests_total{{{labels},status="{status}"}} '
+                           f"{counts[i * n_status + j]}\n")
+
+    out.append("# HELP http_request_duration_seconds HTTP request duration in seconds\n")
+    out.append("# TYPE http_request_duration_seconds histogram\n")
+    for svc, snap in snaps:
+        counts, sums = snap["bucket_counts"], snap["duration_sums"]
+        for i, labels in enumerate(svc.traffic.label_text):
+            cumulative = 0.0
+            for j, le in enumerate(_BUCKET_LABELS):
+                cumulative += counts[i * n_buckets + j]
+                out.append(f'http_request_duration_seconds_bucket{{{labels},le="{le}"}} '
+                           f"{cumulative}\n")
+            out.append(f"http_request_duration_seconds_count{{{labels}}} {cumulative}\n")
+            out.append(f"http_request_duration_seconds_sum{{{labels}}} {sums[i]}\n")
+
+    gates = [(svc, snap) for svc, snap in snaps if svc.svc_type == "ai-gate"]
+    if gates:
+        out.append("# HELP gen_ai_decisions_total Total AI gate decisions\n")
+        out.append("# TYPE gen_ai_decisions_total counter\n")
+        for svc, snap in gates:
+            for action, count in snap["decisions"].items():
+                out.append(f'gen_ai_decisions_total{{service="{_escape(svc.name)}",'
+                           f'action="{action}"}} {float(count)}\n')
+        for name, help_text, key in (
+            ("gen_ai_overrides_total", "Total AI gate overrides", "overrides"),
+            ("gen_ai_overrides_hcf_total", "Total AI gate high-confidence failure overrides",
+             "overrides_hcf"),
+        ):
+            out.append(f"# HELP {name} {help_text}\n# TYPE {name} counter\n")
+            for svc, snap in gates:
+                out.append(f'{name}{{service="{_escape(svc.name)}"}} {float(snap[key])}\n')
+    return "".join(out).encode()
 
-# ai-gate only
-if SERVICE_TYPE == "ai-gate":
-    gen_ai_decisions_total = Counter(
-        "gen_ai_decisions_total",
-        "Total AI gate decisions",
-        ["service", "action"],
-    )
-    gen_ai_overrides_total = Counter(
-        "gen_ai_overrides_total",
-        "Total AI gate overrides",
-        ["service"],
-    )
-    gen_ai_overrides_hcf_total = Counter(
-        "gen_ai_overrides_hcf_total",
-        "Total AI gate high-confidence failure overrides",
-        ["service"],
-    )
 
 # ---------------------------------------------------------------------------
-# Runtime state (module-level, protected by a lock)
+# Runtime state — per-service curves, evaluated lazily at sample time
 # ---------------------------------------------------------------------------
 
+# Each /control key (validated by _scenario_actions.parse_control) moves along
+# a curve evaluated when a tick samples it; there is no ramp thread, so idle
+# curves cost nothing. A body-level "speed" runs a service's curves on a
+# scenario clock (see VirtualService.set_speed) and survives /reset.
+
+# Serialises /control and /reset writers only. Readers never take it: each
+# service's ``curves`` mapping is replaced wholesale (copy-on-write), so the
+# tick reads one consistent snapshot with a single attribute load.
 state_lock = threading.Lock()
 
-# Current operative values
-state = {
-    "rps": BASELINE_RPS,
-    "error_rate": 0.0,
-    "latency_p99": 0.2,   # seconds
-    "reversal_rate": 0.0,
-}
+DIURNAL_PERIOD = 86400.0
+_MASK64 = (1 << 64) - 1
 
-# Baseline values (restored on /reset)
-baseline = {
-    "rps": BASELINE_RPS,
-    "error_rate": 0.0,
-    "latency_p99": 0.2,
-    "reversal_rate": 0.0,
-}
 
-# Target values (we ramp toward these)
-target = dict(state)
+def _noise(seed: int, bucket: int) -> float:
+    """Deterministic pseudo-random value in [-1, 1) for (seed, bucket) — splitmix64."""
+    x = (seed * 0x9E3779B97F4A7C15 + bucket * 0xBF58476D1CE4E5B9) & _MASK64
+    x ^= x >> 31
+    x = (x * 0x94D049BB133111EB) & _MASK64
+    x ^= x >> 29
+    return x / 2.0**63 - 1.0
+
+
+class Curve:
+    """A value moving from ``start`` to ``target`` over ``duration`` seconds.
+
+    linear / exponential / step describe the approach and then hold the
+    target. sine (diurnal: default 24 h period) and jitter approach linearly,
+    then keep oscillating around the target by ``amplitude`` (a fraction of
+    the target) — sine smoothly, jitter as deterministic noise re-drawn every
+    ``period`` seconds.
+    """
+
+    __slots__ = ("start", "target", "t0", "duration", "shape", "amplitude", "period", "seed")
+
+    def __init__(self, start: float, target: float, t0: float, duration: float = 0.0,
+                 shape: str = "linear", amplitude: float | None = None,
+                 period: float | None = None):
+        self.start = start
+        self.target = target
+        self.t0 = t0
+        self.duration = max(duration, 0.0)
+        self.shape = shape
+        if amplitude is None:
+            amplitude = 0.1 if shape == "jitter" else 0.2
+        if period is None:
+            period = {"diurnal": DIURNAL_PERIOD, "jitter": 1.0}.get(shape, 60.0)
+        self.amplitude = amplitude
+        self.period = max(period, 0.001)
+        self.seed = int(t0 * 1000) & _MASK64
+
+    @classmethod
+    def constant(cls, value: float) -> "Curve":
+        return cls(value, value, 0.0)
+
+    def value_at(self, t: float) -> float:
+        elapsed = t - self.t0
+        frac = 1.0 if self.duration == 0 else min(max(elapsed / self.duration, 0.0), 1.0)
+        shape = self.shape
+        if shape == "step":
+            return self.target if frac >= 1.0 else self.start
+        if shape == "exponential":
+            if frac >= 1.0:
+                return self.target
+            if self.start > 0 and self.target > 0:
+                return self.start * (self.target / self.start) ** frac   # geometric
+            return self.start + (self.target - self.start) * math.expm1(5 * frac) / math.expm1(5)
+        value = self.start + (self.target - self.start) * frac
+        if shape in ("sine", "diurnal"):
+            value += self.target * self.amplitude * math.sin(2 * math.pi * elapsed / self.period)
+        elif shape == "jitter":
+            value += self.target * self.amplitude * _noise(self.seed, int(elapsed // self.period))
+        return value
+
+
+class VirtualService:
+    """One simulated service: baseline, per-key curves and traffic totals."""
+
+    def __init__(self, name: str, svc_type: str, rps: int,
+                 profile: CardinalityProfile | None = None):
+        self.name = name
+        self.svc_type = svc_type
+        # Baseline values (restored on /reset)
+        self.baseline = {
+            "rps": float(rps),
+            "error_rate": 0.0,
+            "latency_p99": 0.2,   # seconds
+            "reversal_rate": 0.0,
+        }
+        # key -> Curve; replaced wholesale on every write (see state_lock)
+        self.curves = {key: Curve.constant(val) for key, val in self.baseline.items()}
+        # (wall t, scenario t, speed): curves run on the scenario clock, which
+        # advances ``speed`` times faster than the wall clock (see set_speed).
+        self.clock = (0.0, 0.0, 1.0)
+        self.traffic = TrafficTotals(name, svc_type, profile)
+        self.carry = 0.0   # fractional request carried into the next tick
+        self.dependencies: list[tuple[str, bool]] = []   # (name, critical), --api-port mode
+
+    @property
+    def speed(self) -> float:
+        return self.clock[2]
+
+    def scenario_time(self, t: float) -> float:
+        wall, scenario, speed = self.clock
+        return scenario + (t - wall) * speed
+
+    def values_at(self, t: float) -> dict[str, float]:
+        """Operative values at wall time ``t`` (same clock the curves were set with)."""
+        t = self.scenario_time(t)
+        return {key: curve.value_at(t) for key, curve in self.curves.items()}
+
+    def set_curves(self, specs: dict[str, dict], t: float) -> None:
+        """Start a curve per key from its current value; caller holds state_lock."""
+        t = self.scenario_time(t)
+        curves = dict(self.curves)
+        for key, spec in specs.items():
+            curves[key] = Curve(curves[key].value_at(t), t0=t, **spec)
+        self.curves = curves
+
+    def set_speed(self, speed: float, t: float) -> None:
+        """Re-anchor the scenario clock at ``t``; caller holds state_lock.
+
+        Curves in flight keep their scenario-time shape, so at speed N a
+        15 s ramp takes 15/N s of wall time. Traffic is generated at
+        rps × speed, keeping the request count per scenario second (and
+        so per phase) the same as a real-time run.
+        """
+        self.clock = (t, self.scenario_time(t), speed)
+
+    def reset(self, t: float) -> None:
+        """Ramp every key back to baseline over DEFAULT_RAMP_SECONDS."""
+        self.set_curves({key: {"target": val, "duration": DEFAULT_RAMP_SECONDS}
+                         for key, val in self.baseline.items()}, t)
+
+
+def _parse_speed(body: dict) -> float | None:
+    """The body-level ``speed`` (time-compression factor), if present; raises ValueError."""
+    if body.get("speed") is None:
+        return None
+    try:
+        speed = float(body["speed"])
+    except (TypeError, ValueError):
+        raise ValueError("invalid value for speed") from None
+    if not 0 < speed < math.inf:
+        raise ValueError("speed must be a positive number")
+    return speed
 
-# Ramp tracking: list of (key, steps_remaining, step_delta)
-_ramp_steps: dict = {}   # key -> {"remaining": int, "delta": float}
 
 # ---------------------------------------------------------------------------
-# Smooth transition helpers
+# Service loading (--services-file)
 # ---------------------------------------------------------------------------
 
-RAMP_STEPS = 3
-RAMP_INTERVAL = 5.0  # seconds between steps
+def _service_entries(doc) -> list[tuple[str, dict]]:
+    """Extract (name, spec) pairs from one YAML document of any accepted shape."""
+    if not isinstance(doc, dict):
+        return []
+    if doc.get("kind") == "ServiceReliabilityManifest":
+        spec = doc.get("spec") or {}
+        return [(doc["metadata"]["name"],
+                 {"type": spec.get("type"), "dependencies": spec.get("dependencies")})]
+    if "scenario" in doc:
+        doc = doc["scenario"] or {}
+    services = doc.get("services") or {}
+    return [(name, svc or {}) for name, svc in services.items()]
 
 
-def _schedule_ramp(key: str, new_value: float) -> None:
-    """Set up a ramp from current state[key] toward new_value over ~15 s."""
-    current = state[key]
-    delta = (new_value - current) / RAMP_STEPS
-    _ramp_steps[key] = {"remaining": RAMP_STEPS, "delta": delta, "target": new_value}
-    target[key] = new_value
+def _dependencies(entries) -> list[tuple[str, bool]]:
+    """(name, critical) pairs from a manifest ``dependencies`` list (names or mappings)."""
+    out = []
+    for entry in entries or []:
+        if isinstance(entry, str):
+            out.append((entry, True))
+        else:
+            out.append((entry["name"], bool(entry.get("critical", True))))
+    return out
 
 
-def _apply_ramp_step() -> None:
-    """Called every RAMP_INTERVAL seconds to advance all pending ramps by one step."""
-    with state_lock:
-        done = []
-        for key, ramp in _ramp_steps.items():
-            state[key] = state[key] + ramp["delta"]
-            ramp["remaining"] -= 1
-            if ramp["remaining"] <= 0:
-                state[key] = ramp["target"]   # snap to exact final value
-                done.append(key)
-        for key in done:
-            del _ramp_steps[key]
+def _load_services_file(path: str, default_rps: int,
+                        default_profile: CardinalityProfile | None) -> list[VirtualService]:
+    root = Path(path)
+    files = sorted(root.glob("*.yaml")) + sorted(root.glob("*.yml")) if root.is_dir() else [root]
+    services: dict[str, VirtualService] = {}
+    for file in files:
+        for doc in _load_yaml(file, "--services-file"):
+            for name, spec in _service_entries(doc):
+                # Anything that is not an AI gate emits plain HTTP metrics.
+                svc_type = "ai-gate" if spec.get("type") == "ai-gate" else "api"
+                rps = int(spec.get("rps") or default_rps)
+                profile = default_profile
+                if spec.get("cardinality"):
+                    profile = CardinalityProfile.from_config(spec["cardinality"])
+                services[name] = VirtualService(name, svc_type, rps, profile)
+                services[name].dependencies = _dependencies(spec.get("dependencies"))
+    if not services:
+        raise SystemExit(f"no services found in {path}")
+    return list(services.values())
 
 
-def _ramp_thread() -> None:
-    while True:
-        time.sleep(RAMP_INTERVAL)
-        _apply_ramp_step()
+def _build_services() -> dict[str, VirtualService]:
+    """Fresh VirtualServices (baseline state, zeroed totals) from the CLI args."""
+    try:
+        profile = CardinalityProfile.from_config(args.cardinality) if args.cardinality else None
+        if args.services_file:
+            hosted = _load_services_file(args.services_file, BASELINE_RPS, profile)
+        else:
+            hosted = [VirtualService(args.name, args.svc_type, BASELINE_RPS, profile)]
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+    return {svc.name: svc for svc in hosted}
+
 
+SERVICES: dict[str, VirtualService] = _build_services()
 
 # ---------------------------------------------------------------------------
 # Latency sampling
 # ---------------------------------------------------------------------------
 
-def _sample_latency(p99: float) -> float:
+def _lognormal_params(p99: float) -> tuple[float, float]:
     """
-    Sample a request duration such that ~99% of values are below p99.
-    We model latency as log-normal; derive mu/sigma from p99 and an assumed p50.
+    Derive log-normal mu/sigma such that ~99% of samples are below p99.
     p50 ≈ p99 / 5  (rough heuristic).
     """
+    p99 = max(p99, 0.001)
     p50 = max(p99 / 5.0, 0.001)
     # log-normal: P99 = exp(mu + 2.326*sigma), P50 = exp(mu)
     sigma = math.log(p99 / p50) / 2.326
     mu = math.log(p50)
-    return random.lognormvariate(mu, sigma)
+    return mu, sigma
+
+
+# ---------------------------------------------------------------------------
+# Batch sampling — one call per tick draws every request in the batch
+# ---------------------------------------------------------------------------
+
+def _status_cdf(error_rate: float) -> list[float]:
+    """Cumulative probabilities in STATUSES order — 70% of errors are 5xx, the rest 4xx."""
+    error_rate = min(max(error_rate, 0.0), 1.0)
+    return [1.0 - error_rate, 1.0 - error_rate * 0.7, 1.0]
+
+
+# Each batch is sparse: "requests", "buckets" and "duration_sums" map to
+# (flat indices, counts) into the TrafficTotals arrays, so a tick's cost
+# scales with the requests it draws rather than with the series count.
+
+if np is not None:
+    _rng = np.random.default_rng(args.seed)
+    _bucket_bounds = np.asarray(LATENCY_BUCKETS)
+
+    def _draw_batch(n: int, error_rate: float, latency_p99: float,
+                    reversal_rate: float, ai_gate: bool, series_cdf=None) -> dict:
+        if series_cdf is None:
+            series = np.zeros(n, dtype=np.int64)
+        else:
+            series = np.searchsorted(series_cdf, _rng.random(n), side="right")
+        statuses = np.searchsorted(_status_cdf(error_rate), _rng.random(n), side="right")
+        mu, sigma = _lognormal_params(latency_p99)
+        durations = _rng.lognormal(mu, sigma, n)
+        # Prometheus buckets are "le": bisect-left puts a value equal to a
+        # bound into that bound's bucket. The +Inf bound catches the tail.
+        buckets = np.searchsorted(_bucket_bounds, durations, side="left")
+        sum_idx, inverse = np.unique(series, return_inverse=True)
+        batch = {
+            "requests": np.unique(series * len(STATUSES) + statuses, return_counts=True),
+            "buckets": np.unique(series * len(LATENCY_BUCKETS) + buckets, return_counts=True),
+            "duration_sums": (sum_idx, np.bincount(inverse, weights=durations)),
+        }
+        if ai_gate:
+            overrides = int(_rng.binomial(n, min(max(reversal_rate, 0.0), 1.0)))
+            batch["actions"] = _rng.multinomial(n, AI_ACTION_WEIGHTS).tolist()
+            batch["overrides"] = overrides
+            batch["overrides_hcf"] = int(_rng.binomial(overrides, HCF_FRACTION))
+        return batch
+
+else:
+
+    def _draw_batch(n: int, error_rate: float, latency_p99: float,
+                    reversal_rate: float, ai_gate: bool, series_cdf=None) -> dict:
+        status_cdf = _status_cdf(error_rate)
+        requests: dict[int, int] = {}
+        buckets: dict[int, int] = {}
+        sums: dict[int, float] = {}
+        mu, sigma = _lognormal_params(latency_p99)
+        rand, lognorm = random.random, random.lognormvariate
+        n_status, n_buckets = len(STATUSES), len(LATENCY_BUCKETS)
+        for _ in range(n):
+            series = 0 if series_cdf is None else bisect.bisect_right(series_cdf, rand())
+            key = series * n_status + bisect.bisect_right(status_cdf, rand())
+            requests[key] = requests.get(key, 0) + 1
+            duration = lognorm(mu, sigma)
+            key = series * n_buckets + bisect.bisect_left(LATENCY_BUCKETS, duration)
+            buckets[key] = buckets.get(key, 0) + 1
+            sums[series] = sums.get(series, 0.0) + duration
+        batch = {
+            "requests": (list(requests), list(requests.values())),
+            "buckets": (list(buckets), list(buckets.values())),
+            "duration_sums": (list(sums), list(sums.values())),
+        }
+        if ai_gate:
+            actions = [0, 0, 0]
+            for choice in random.choices(range(3), weights=AI_ACTION_WEIGHTS, k=n):
+                actions[choice] += 1
+            overrides = sum(1 for _ in range(n) if rand() < reversal_rate)
+            batch["actions"] = actions
+            batch["overrides"] = overrides
+            batch["overrides_hcf"] = sum(1 for _ in range(overrides) if rand() < HCF_FRACTION)
+        return batch
+
+
+def _seed_rng(seed: int | None) -> None:
+    """Re-seed whichever sampler backs _draw_batch."""
+    global _rng
+    random.seed(seed)
+    if np is not None:
+        _rng = np.random.default_rng(seed)
+
+
+# ---------------------------------------------------------------------------
+# Self-instrumentation
+# ---------------------------------------------------------------------------
+
+# These describe the generator itself, not the simulated services, so a
+# missed latency budget can be told apart from a load generator that fell
+# behind. Everything is process-wide (no service label) to keep the cost
+# flat in multi-tenant mode; /debug/stats serves the same numbers as JSON.
+
+STATS_WINDOW = 10.0          # seconds of ticks behind /debug/stats
+SATURATION_BUSY = 0.9        # generator busy for >= this share of wall time
+SATURATION_ACHIEVED = 0.95   # achieved / target RPS below this
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+target_rps_gauge = Gauge(
+    "fake_service_target_rps",
+    "Requests per second the generator should emit, summed over hosted services",
+)
+achieved_rps_gauge = Gauge(
+    "fake_service_achieved_rps",
+    f"Requests per second actually emitted over the last {STATS_WINDOW:g}s",
+)
+generated_requests_total = Counter(
+    "fake_service_generated_requests_total",
+    "Simulated requests emitted by the generator",
+)
+tick_lag_seconds = Histogram(
+    "fake_service_tick_lag_seconds",
+    "How late each generation tick started relative to its schedule",
+    buckets=LAG_BUCKETS,
+)
+tick_work_seconds = Histogram(
+    "fake_service_tick_work_seconds",
+    "Wall time spent drawing and applying one tick's batches",
+    buckets=LAG_BUCKETS,
+)
+tick_resyncs_total = Counter(
+    "fake_service_tick_resyncs_total",
+    "Ticks that fell more than one interval behind and were rescheduled",
+)
+lock_wait_seconds = Histogram(
+    "fake_service_lock_wait_seconds",
+    "Time spent waiting to acquire an internal lock",
+    ["lock"],   # state | render
+    buckets=(0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+cpu_seconds_total = Counter(
+    "fake_service_cpu_seconds_total",
+    "Thread CPU time (time.thread_time) spent holding the GIL, by activity",
+    ["activity"],   # generate | render
+)
+saturated_gauge = Gauge(
+    "fake_service_generator_saturated",
+    "1 when the generator cannot keep up with its target rate (see /debug/stats)",
+)
+
+
+class GeneratorStats:
+    """Rolling window of generation ticks, summarised for /debug/stats.
+
+    Written by the traffic thread only; readers take ``_lock`` for a
+    consistent copy of the window.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ticks: collections.deque = collections.deque()
+        self.started = time.monotonic()
+        self.resyncs = 0
+        self.cpu_seconds = 0.0
+        self.lock_waits: dict[str, list[float]] = {}   # lock -> [count, total, max]
+
+    def record(self, now: float, elapsed: float, lag: float, target: float,
+               generated: int, work: float, cpu: float) -> None:
+        tick_lag_seconds.observe(lag)
+        tick_work_seconds.observe(work)
+        generated_requests_total.inc(generated)
+        cpu_seconds_total.labels(activity="generate").inc(cpu)
+        with self._lock:
+            self.cpu_seconds += cpu
+            self._ticks.append((now, elapsed, lag, target, generated, work))
+            while now - self._ticks[0][0] > STATS_WINDOW:
+                self._ticks.popleft()
+        summary = self.summary(now)
+        target_rps_gauge.set(summary["target_rps"])
+        achieved_rps_gauge.set(summary["achieved_rps"])
+        saturated_gauge.set(1 if summary["saturated"] else 0)
+
+    def record_lock_wait(self, lock: str, seconds: float) -> None:
+        lock_wait_seconds.labels(lock=lock).observe(seconds)
+        with self._lock:
+            entry = self.lock_waits.setdefault(lock, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def summary(self, now: float) -> dict:
+        with self._lock:
+            ticks = list(self._ticks)
+        if not ticks:
+            return {"ticks": 0, "target_rps": 0.0, "achieved_rps": 0.0,
+                    "saturated": False, "reasons": []}
+        window_start = ticks[0][0] - ticks[0][1]
+        covered = ticks[-1][0] - window_start
+        # A gap of more than one tick since the last tick counts against the
+        # achieved rate, so a stalled generator shows up before it recovers.
+        stalled = max(now - ticks[-1][0] - TICK_INTERVAL, 0.0)
+        target_rps = sum(t[3] for t in ticks) / covered if covered > 0 else 0.0
+        achieved_rps = sum(t[4] for t in ticks) / max(covered + stalled, 1e-9)
+        busy = min(sum(t[5] for t in ticks) / covered, 1.0) if covered > 0 else 0.0
+        lags = [t[2] for t in ticks]
+        lag_p95 = percentile(lags, 95)
+
+        reasons = []
+        if busy >= SATURATION_BUSY:
+            reasons.append(f"generator busy {busy:.0%} of wall time")
+        if target_rps > 0 and achieved_rps < SATURATION_ACHIEVED * target_rps:
+            reasons.append(f"achieved {achieved_rps:.0f} of {target_rps:.0f} rps")
+        if lag_p95 > TICK_INTERVAL:
+            reasons.append(f"tick lag p95 {lag_p95 * 1000:.0f} ms > tick {TICK_INTERVAL:g}s")
+        return {
+            "ticks": len(ticks),
+            "window_seconds": round(now - window_start, 3),
+            "target_rps": round(target_rps, 1),
+            "achieved_rps": round(achieved_rps, 1),
+            "busy_fraction": round(busy, 3),
+            "tick_lag_p95_seconds": round(lag_p95, 4),
+            "tick_lag_max_seconds": round(max(lags), 4),
+            "saturated": bool(reasons),
+            "reasons": reasons,
+        }
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        payload = self.summary(now)
+        with self._lock:
+            payload.update({
+                "tick_interval_seconds": TICK_INTERVAL,
+                "uptime_seconds": round(now - self.started, 1),
+                "tick_resyncs": self.resyncs,
+                "generator_cpu_seconds": round(self.cpu_seconds, 3),
+                "lock_wait_seconds": {
+                    lock: {"count": int(count), "total": round(total, 6), "max": round(peak, 6)}
+                    for lock, (count, total, peak) in self.lock_waits.items()
+                },
+            })
+        payload["render_seconds_last"] = round(metrics_cache.last_render_seconds, 4)
+        payload["services"] = len(SERVICES)
+        payload["sampler"] = "numpy" if np is not None else "python"
+        if remote_writer is not None:
+            payload["remote_write"] = remote_writer.stats()
+        if api_server is not None:
+            payload["api"] = api_server.stats()
+        return payload
+
+
+generator_stats = GeneratorStats()
+
+
+@contextlib.contextmanager
+def _timed_lock(lock: threading.Lock, name: str):
+    """Acquire ``lock``, recording the wait under ``name``."""
+    start = time.perf_counter()
+    with lock:
+        generator_stats.record_lock_wait(name, time.perf_counter() - start)
+        yield
 
 
 # ---------------------------------------------------------------------------
 # Background traffic generation
 # ---------------------------------------------------------------------------
 
+# One batch per service per tick, drawn with NumPy when installed (pure-Python
+# fallback otherwise), is what lets one process emulate 50k+ RPS.
+
 def _generate_traffic() -> None:
-    """Increment metrics at the configured RPS rate."""
+    """Emit one aggregated batch per service per TICK_INTERVAL at its RPS rate.
+
+    The batch size comes from the *measured* time since the previous tick
+    (plus the fractional carry), so a late tick produces a bigger batch
+    rather than silently lowering the achieved rate. Lateness, work time
+    and CPU per tick feed generator_stats.
+    """
+    # In --api-port mode counters come from real requests; the tick still
+    # drives invalidation, remote write and the self-metrics.
+    synthetic_services = [] if api_server is not None else list(SERVICES.values())
+    last = next_tick = time.monotonic()
     while True:
-        with state_lock:
-            rps = max(state["rps"], 0)
-            error_rate = state["error_rate"]
-            latency_p99 = state["latency_p99"]
-            reversal_rate = state["reversal_rate"]
-
-        sleep_interval = 1.0 / rps if rps > 0 else 1.0
-
-        # Determine HTTP status
-        roll = random.random()
-        if roll < error_rate * 0.7:
-            status = "500"
-        elif roll < error_rate:
-            status = "400"
+        next_tick += TICK_INTERVAL
+        delay = next_tick - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+        now = time.monotonic()
+        lag = max(now - next_tick, 0.0)
+        if lag > TICK_INTERVAL:
+            next_tick = now   # far behind: resync instead of bursting
+            generator_stats.resyncs += 1
+            tick_resyncs_total.inc()
+        elapsed, last = now - last, now
+        cpu_start = time.thread_time()
+
+        target = 0.0
+        generated = 0
+        for svc in synthetic_services:
+            st = svc.values_at(now)
+            rps = max(st["rps"], 0) * svc.speed
+            target += rps * elapsed
+            expected = rps * elapsed + svc.carry
+            n = int(expected)
+            svc.carry = expected - n
+            if n == 0:
+                continue
+            generated += n
+            svc.traffic.apply(_draw_batch(n, st["error_rate"], st["latency_p99"],
+                                          st["reversal_rate"], svc.svc_type == "ai-gate",
+                                          svc.traffic.cdf))
+
+        metrics_cache.invalidate()
+        if remote_writer is not None:
+            remote_writer.tick(now)
+        generator_stats.record(now, elapsed, lag, target, generated,
+                               time.monotonic() - now, time.thread_time() - cpu_start)
+
+
+# ---------------------------------------------------------------------------
+# /metrics exposition cache
+# ---------------------------------------------------------------------------
+
+# Every scraper within one tick shares a single render; gzip
+# (Accept-Encoding) and ETag / If-None-Match are served from that snapshot.
+
+metrics_render_seconds = Histogram(
+    "fake_service_metrics_render_seconds",
+    "Time spent rendering the /metrics exposition",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+metrics_response_bytes = Gauge(
+    "fake_service_metrics_response_bytes",
+    "Size of the last rendered /metrics body",
+    ["encoding"],
+)
+metrics_scrapes_total = Counter(
+    "fake_service_metrics_scrapes_total",
+    "/metrics requests by how they were served",
+    ["result"],   # rendered | cached | not_modified
+)
+
+
+class MetricsCache:
+    """Snapshot of the exposition, re-rendered at most once per generation.
+
+    The traffic tick bumps ``generation``; the first scrape after a bump
+    renders under ``_lock`` while concurrent scrapers wait and then reuse
+    that render. The gzip body is compressed lazily, once per snapshot.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.generation = 0
+        self._rendered = -1
+        self._body = b""
+        self._gzip_body: bytes | None = None
+        self._etag = ""
+        self.last_render_seconds = 0.0
+
+    def invalidate(self) -> None:
+        self.generation += 1
+
+    def get(self, use_gzip: bool) -> tuple[bytes, str, bool]:
+        """Return (body, etag, rendered) for the requested encoding."""
+        with _timed_lock(self._lock, "render"):
+            rendered = self._rendered != self.generation
+            if rendered:
+                generation = self.generation
+                start, cpu_start = time.perf_counter(), time.thread_time()
+                self._body = generate_latest() + _render_traffic()
+                self.last_render_seconds = time.perf_counter() - start
+                metrics_render_seconds.observe(self.last_render_seconds)
+                cpu_seconds_total.labels(activity="render").inc(time.thread_time() - cpu_start)
+                self._gzip_body = None
+                self._etag = hashlib.blake2b(self._body, digest_size=8).hexdigest()
+                self._rendered = generation
+                metrics_response_bytes.labels(encoding="identity").set(len(self._body))
+            if not use_gzip:
+                return self._body, f'"{self._etag}"', rendered
+            if self._gzip_body is None:
+                self._gzip_body = gzip.compress(self._body, compresslevel=6)
+                metrics_response_bytes.labels(encoding="gzip").set(len(self._gzip_body))
+            return self._gzip_body, f'"{self._etag}-gz"', rendered
+
+
+metrics_cache = MetricsCache()
+
+
+def _accepts_gzip(header: str | None) -> bool:
+    """True if Accept-Encoding lists gzip with a non-zero q-value."""
+    for part in (header or "").split(","):
+        coding, *params = part.split(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    for candidate in (header or "").split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+# ---------------------------------------------------------------------------
+# Remote-write push (Prometheus remote-write 1.0)
+# ---------------------------------------------------------------------------
+
+# Pushing removes the scrape interval from the detection-latency budget.
+# The WriteRequest protobuf is hand-encoded: every series' label block is
+# encoded once at startup, so a push only appends the 8-byte value and the
+# timestamp per sample. Services are sharded over --remote-write-shards
+# senders; each shard owns one keep-alive connection and one bounded queue,
+# and sends in order, so a series never arrives out of order. Without
+# python-snappy the body is a valid, uncompressed literal-only snappy block.
+
+REMOTE_WRITE_HEADERS = {
+    "Content-Type": "application/x-protobuf",
+    "Content-Encoding": "snappy",
+    "X-Prometheus-Remote-Write-Version": "0.1.0",
+    "User-Agent": "nthlayer-fake-service",
+}
+REMOTE_WRITE_MAX_BACKOFF = 1.0
+
+remote_write_batches_total = Counter(
+    "fake_service_remote_write_batches_total",
+    "Remote-write batches by outcome",
+    ["result"],   # sent | rejected | failed | dropped
+)
+remote_write_samples_total = Counter(
+    "fake_service_remote_write_samples_total",
+    "Samples delivered over remote write",
+)
+remote_write_retries_total = Counter(
+    "fake_service_remote_write_retries_total",
+    "Remote-write request retries",
+)
+remote_write_send_seconds = Histogram(
+    "fake_service_remote_write_send_seconds",
+    "Encode, compress and send time per remote-write batch (including retries)",
+    buckets=LAG_BUCKETS,
+)
+
+
+def _pb_varint(n: int) -> bytes:
+    out = bytearray()
+    while n > 0x7F:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def _pb_field(field: int, payload: bytes) -> bytes:
+    """Length-delimited protobuf field."""
+    return _pb_varint(field << 3 | 2) + _pb_varint(len(payload)) + payload
+
+
+@functools.cache
+def _pb_label(name: str, value: str) -> bytes:
+    """One encoded TimeSeries.labels entry; label pairs repeat across most series."""
+    return _pb_field(1, _pb_field(1, name.encode()) + _pb_field(2, value.encode()))
+
+
+def _pb_labels(labels: dict[str, str]) -> bytes:
+    """TimeSeries.labels for one series; remote write requires them sorted by name."""
+    return b"".join(_pb_label(name, labels[name]) for name in sorted(labels))
+
+
+def _snappy_literal(data: bytes) -> bytes:
+    """Snappy block made of literals only: valid for any decoder, not compressed."""
+    out = bytearray(_pb_varint(len(data)))   # same varint as protobuf
+    for i in range(0, len(data), 65536):
+        chunk = data[i:i + 65536]
+        n = len(chunk) - 1
+        if n < 60:
+            out.append(n << 2)
+        elif n < 0x100:
+            out += bytes((60 << 2, n))
         else:
-            status = "200"
-
-        http_requests_total.labels(service=SERVICE_NAME, status=status).inc()
-        duration = _sample_latency(latency_p99)
-        http_request_duration_seconds.labels(service=SERVICE_NAME).observe(duration)
-
-        if SERVICE_TYPE == "ai-gate":
-            # Distribute decisions: 80% approve, 15% reject, 5% escalate (baseline)
-            decision_roll = random.random()
-            if decision_roll < 0.80:
-                action = "approve"
-            elif decision_roll < 0.95:
-                action = "reject"
+            out += bytes((61 << 2,)) + n.to_bytes(2, "little")
+        out += chunk
+    return bytes(out)
+
+
+_snappy_compress = snappy.compress if snappy is not None else _snappy_literal
+
+
+def _remote_write_labels(svc: "VirtualService", external: dict[str, str]) -> list[bytes]:
+    """Encoded label blocks for svc, in the order _remote_write_values yields values."""
+    profile = svc.traffic.profile
+    base = {**external, "service": svc.name}
+    if profile is None:
+        series = [base]
+    else:
+        series = [{**base, **dict(zip(profile.label_names, values, strict=True))}
+                  for values in profile.series_labels]
+    out = []
+    for labels in series:
+        for status in STATUSES:
+            out.append(_pb_labels({**labels, "__name__": "http_requests_total",
+                                   "status": status}))
+    for labels in series:
+        for le in _BUCKET_LABELS:
+            out.append(_pb_labels({**labels, "__name__": "http_request_duration_seconds_bucket",
+                                   "le": le}))
+        out.append(_pb_labels({**labels, "__name__": "http_request_duration_seconds_count"}))
+        out.append(_pb_labels({**labels, "__name__": "http_request_duration_seconds_sum"}))
+    if svc.svc_type == "ai-gate":
+        for action in AI_ACTIONS:
+            out.append(_pb_labels({**base, "__name__": "gen_ai_decisions_total",
+                                   "action": action}))
+        out.append(_pb_labels({**base, "__name__": "gen_ai_overrides_total"}))
+        out.append(_pb_labels({**base, "__name__": "gen_ai_overrides_hcf_total"}))
+    return out
+
+
+def _remote_write_values(svc: "VirtualService", snap: dict) -> array:
+    """Sample values of one traffic snapshot, matching _remote_write_labels."""
+    n_buckets = len(LATENCY_BUCKETS)
+    values = array("d", snap["requests"])
+    counts, sums = snap["bucket_counts"], snap["duration_sums"]
+    for i in range(svc.traffic.size):
+        cumulative = itertools.accumulate(counts[i * n_buckets:(i + 1) * n_buckets])
+        values.extend(cumulative)
+        values.append(values[-1])
+        values.append(sums[i])
+    if svc.svc_type == "ai-gate":
+        values.extend(float(snap["decisions"][action]) for action in AI_ACTIONS)
+        values.append(float(snap["overrides"]))
+        values.append(float(snap["overrides_hcf"]))
+    return values
+
+
+class RemoteWriteShard:
+    """One sender: a subset of services, a bounded queue and a keep-alive connection."""
+
+    def __init__(self, index: int, services: list, external: dict[str, str], url,
+                 queue_size: int, retries: int, timeout: float):
+        self.index = index
+        self.services = services
+        self.labels = [lbl for svc in services for lbl in _remote_write_labels(svc, external)]
+        self.url, self.retries, self.timeout = url, retries, timeout
+        self.path = url.path or "/api/v1/write"
+        if url.query:
+            self.path += f"?{url.query}"
+        self.queue: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+        self._conn: http.client.HTTPConnection | None = None
+        self._heads: tuple[int, list[bytes]] = (0, [])
+        self.last_error = ""
+
+    def offer(self, ts_ms: int) -> None:
+        """Snapshot this shard's services and enqueue them; drop the oldest batch if full.
+
+        Dropping is lossless for the pushed values themselves — every sample
+        is a cumulative total, so the next batch carries the same counts.
+        """
+        batch = (ts_ms, [svc.traffic.snapshot() for svc in self.services])
+        while True:
+            try:
+                self.queue.put_nowait(batch)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                    remote_write_batches_total.labels(result="dropped").inc()
+                except queue.Empty:
+                    pass
+
+    def encode(self, ts_ms: int, snaps: list[dict]) -> bytes:
+        """WriteRequest bytes: one TimeSeries with one Sample per label block."""
+        tail = b"\x10" + _pb_varint(ts_ms)           # Sample.timestamp
+        sample_len = 9 + len(tail)                   # tag + double + timestamp
+        if self._heads[0] != sample_len:
+            self._heads = (sample_len, [
+                b"\x0a" + _pb_varint(len(lbl) + 2 + sample_len) + lbl
+                + bytes((0x12, sample_len, 0x09))    # TimeSeries.samples, Sample.value
+                for lbl in self.labels
+            ])
+        heads = self._heads[1]
+        values = array("d")
+        for svc, snap in zip(self.services, snaps, strict=True):
+            values.extend(_remote_write_values(svc, snap))
+        if sys.byteorder != "little":
+            values.byteswap()                        # protobuf doubles are little-endian
+        packed = values.tobytes()
+        return b"".join(
+            head + packed[i * 8:i * 8 + 8] + tail for i, head in enumerate(heads)
+        )
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            cls = (http.client.HTTPSConnection if self.url.scheme == "https"
+                   else http.client.HTTPConnection)
+            self._conn = cls(self.url.hostname, self.url.port, timeout=self.timeout)
+        return self._conn
+
+    def _post(self, body: bytes) -> int:
+        conn = self._connection()
+        try:
+            conn.request("POST", self.path, body=body, headers=REMOTE_WRITE_HEADERS)
+            resp = conn.getresponse()
+            detail = resp.read()
+        except (OSError, http.client.HTTPException) as exc:
+            conn.close()
+            self._conn = None
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            return 0
+        if resp.status >= 300:
+            self.last_error = f"HTTP {resp.status}: {detail[:200].decode(errors='replace')}"
+        return resp.status
+
+    def send(self, ts_ms: int, snaps: list[dict]) -> str:
+        """Deliver one batch with bounded, backed-off retries; returns the outcome."""
+        body = _snappy_compress(self.encode(ts_ms, snaps))
+        for attempt in range(self.retries + 1):
+            if attempt:
+                remote_write_retries_total.inc()
+                time.sleep(min(0.05 * 2 ** (attempt - 1), REMOTE_WRITE_MAX_BACKOFF))
+            status = self._post(body)
+            if 200 <= status < 300:
+                remote_write_samples_total.inc(len(self.labels))
+                return "sent"
+            if 400 <= status < 500 and status != 429:
+                return "rejected"   # the receiver will not accept it on retry either
+        return "failed"
+
+    def run(self) -> None:
+        while True:
+            ts_ms, snaps = self.queue.get()
+            start = time.perf_counter()
+            result = self.send(ts_ms, snaps)
+            remote_write_send_seconds.observe(time.perf_counter() - start)
+            remote_write_batches_total.labels(result=result).inc()
+
+
+class RemoteWriter:
+    """Pushes every hosted service's samples at most once per interval."""
+
+    def __init__(self, url: str, interval: float, shards: int, queue_size: int,
+                 retries: int, timeout: float, external: dict[str, str]):
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"invalid --remote-write URL: {url!r}")
+        self.interval = interval
+        self._last = -math.inf
+        services = list(SERVICES.values())
+        n = max(1, min(shards, len(services)))
+        self.shards = [
+            RemoteWriteShard(k, services[k::n], external, parsed, queue_size, retries, timeout)
+            for k in range(n)
+        ]
+
+    def start(self) -> None:
+        for shard in self.shards:
+            threading.Thread(target=shard.run, name=f"remote-write-{shard.index}",
+                             daemon=True).start()
+
+    def tick(self, now: float) -> None:
+        """Called by the traffic thread after each tick."""
+        if now - self._last < self.interval:
+            return
+        self._last = now
+        ts_ms = round(time.time() * 1000)
+        for shard in self.shards:
+            shard.offer(ts_ms)
+
+    def stats(self) -> dict:
+        return {
+            "shards": len(self.shards),
+            "series": sum(len(shard.labels) for shard in self.shards),
+            "queued": sum(shard.queue.qsize() for shard in self.shards),
+            "last_errors": [shard.last_error for shard in self.shards if shard.last_error],
+            "compression": "snappy" if snappy is not None else "snappy-literal",
+        }
+
+
+def _build_remote_writer() -> RemoteWriter | None:
+    if not args.remote_write:
+        return None
+    external = {"job": "fake-services", "instance": str(PORT)}
+    for item in args.remote_write_label:
+        name, sep, value = item.partition("=")
+        if not sep or not re.fullmatch(r"[a-zA-Z_][a-zA-Z0-9_]*", name):
+            parser.error(f"--remote-write-label expects NAME=VALUE, got {item!r}")
+        external[name] = value
+    try:
+        return RemoteWriter(args.remote_write, args.remote_write_interval,
+                            args.remote_write_shards, args.remote_write_queue,
+                            args.remote_write_retries, args.remote_write_timeout, external)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+
+remote_writer = _build_remote_writer() if args.command is None else None
+
+
+# ---------------------------------------------------------------------------
+# Request-serving mode (--api-port) — real requests, real dependency calls
+# ---------------------------------------------------------------------------
+
+# Instead of drawing synthetic batches, every hosted service answers GET
+# /api/<name> (or /api with a single service) on an asyncio server. A
+# request first spends the service's own injected latency (log-normal at
+# the latency_p99 curve) and fails at the error_rate curve; otherwise it
+# calls every declared dependency concurrently over pooled keep-alive
+# connections, failing with 500 when a critical one errors or times out.
+# The traffic families are recorded from the measured wall time of each
+# request, so a slow fraud-detect shows up in payment-api's latency and
+# errors by itself. An open-loop generator offers each entry service its
+# rps curve as Poisson arrivals, independent of completions, and measures
+# latency from the intended send time (no coordinated omission).
+
+LOADGEN_TIMEOUT = 30.0
+_AI_ACTION_CDF = _cumulative(AI_ACTION_WEIGHTS)
+
+loadgen_latency_seconds = Histogram(
+    "fake_service_loadgen_latency_seconds",
+    "Open-loop client latency from intended send time to response",
+    ["service"],
+)
+loadgen_requests_total = Counter(
+    "fake_service_loadgen_requests_total",
+    "Open-loop load-generator requests by outcome",
+    ["service", "result"],   # ok | error | timeout | dropped
+)
+upstream_calls_total = Counter(
+    "fake_service_upstream_calls_total",
+    "Dependency calls made in --api-port mode, by outcome",
+    ["service", "dependency", "result"],   # ok | error | timeout
+)
+
+
+class UpstreamPool:
+    """Keep-alive HTTP/1.1 connections to one host:port, at most ``size`` in use."""
+
+    def __init__(self, host: str, port: int, size: int):
+        self.host, self.port = host, port
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(max(size, 1))
+        self._request_head = f"Host: {host}:{port}\r\nContent-Length: 0\r\n\r\n".encode()
+
+    async def get(self, path: str) -> int:
+        """GET ``path`` and return the status; raises OSError on transport errors."""
+        async with self._slots:
+            reused = bool(self._idle)
+            conn = self._idle.pop() if reused else await asyncio.open_connection(
+                self.host, self.port)
+            try:
+                status, keep_alive = await self._exchange(conn, path)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                conn[1].close()
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive connection; retry fresh.
+                conn = await asyncio.open_connection(self.host, self.port)
+                status, keep_alive = await self._exchange(conn, path)
+            except BaseException:   # timeouts cancel us mid-exchange
+                conn[1].close()
+                raise
+            if keep_alive:
+                self._idle.append(conn)
             else:
-                action = "escalate"
-            gen_ai_decisions_total.labels(service=SERVICE_NAME, action=action).inc()
+                conn[1].close()
+            return status
+
+    async def _exchange(self, conn, path: str) -> tuple[int, bool]:
+        reader, writer = conn
+        try:
+            writer.write(f"GET {path} HTTP/1.1\r\n".encode() + self._request_head)
+            await writer.drain()
+            status_line, headers = await _read_head(reader)
+            await reader.readexactly(int(headers.get("content-length", 0)))
+        except BaseException:
+            writer.close()
+            raise
+        return int(status_line.split(" ", 2)[1]), headers.get("connection") != "close"
+
+
+async def _read_head(reader: asyncio.StreamReader) -> tuple[str, dict[str, str]]:
+    """First line and lower-cased headers of an HTTP/1.1 message."""
+    lines = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip().lower()
+    return lines[0], headers
+
+
+class ApiServer:
+    """asyncio /api server, dependency pools and the open-loop load generator."""
+
+    def __init__(self, port: int):
+        self.port = port
+        self.rng = random.Random(args.seed)
+        self.inflight = 0
+        self.upstreams: dict[str, tuple[str, int, str]] = {}   # dependency -> host, port, path
+        # One pool per (caller, dependency), like each real service's own client.
+        self._pools: dict[tuple[str, str], UpstreamPool] = {}
+        for item in args.upstream:
+            name, sep, url = item.partition("=")
+            parsed = urllib.parse.urlsplit(url)
+            if not sep or parsed.scheme != "http" or not parsed.hostname:
+                parser.error(f"--upstream expects NAME=http://host:port/path, got {item!r}")
+            self.upstreams[name] = (parsed.hostname, parsed.port or 80, parsed.path or "/api")
+        if not args.services_file:
+            # A --name service has no manifest: its --upstreams are its dependencies.
+            SERVICES[args.name].dependencies = [(name, True) for name in self.upstreams]
+        for name in SERVICES:
+            self.upstreams.setdefault(name, ("127.0.0.1", port, f"/api/{name}"))
+        self.unresolved = sorted({dep for svc in SERVICES.values() for dep, _ in svc.dependencies
+                                  if dep not in self.upstreams})
+        if args.loadgen == "none":
+            self.entry = []
+        elif args.loadgen == "all":
+            self.entry = list(SERVICES.values())
+        else:
+            called = {dep for svc in SERVICES.values() for dep, _ in svc.dependencies}
+            self.entry = [svc for svc in SERVICES.values() if svc.name not in called]
+
+    def _pool(self, caller: str, dep: str, size: int) -> UpstreamPool:
+        pool = self._pools.get((caller, dep))
+        if pool is None:
+            host, port, _ = self.upstreams[dep]
+            pool = self._pools[(caller, dep)] = UpstreamPool(host, port, size)
+        return pool
+
+    # --- server side ---
+
+    async def _connection(self, reader, writer) -> None:
+        try:
+            while True:
+                try:
+                    request_line, headers = await asyncio.wait_for(
+                        _read_head(reader), IDLE_TIMEOUT)
+                    length = int(headers.get("content-length", 0))
+                    if length:
+                        await reader.readexactly(length)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        TimeoutError, ConnectionError, ValueError):
+                    return
+                path = request_line.split(" ", 2)[1] if request_line.count(" ") >= 2 else ""
+                code, body = await self._route(urllib.parse.urlsplit(path).path)
+                payload = json.dumps(body).encode()
+                writer.write(
+                    f"HTTP/1.1 {code} {'OK' if code == 200 else 'Error'}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n"
+                    .encode() + payload)
+                await writer.drain()
+                if headers.get("connection") == "close":
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
 
-            # Overrides driven by reversal_rate
-            if random.random() < reversal_rate:
-                gen_ai_overrides_total.labels(service=SERVICE_NAME).inc()
-                # ~20% of overrides are high-confidence failures
-                if random.random() < 0.20:
-                    gen_ai_overrides_hcf_total.labels(service=SERVICE_NAME).inc()
+    async def _route(self, path: str) -> tuple[int, dict]:
+        route, _, name = path.strip("/").partition("/")
+        if route != "api":
+            return 404, {"error": "not found"}
+        if not name and len(SERVICES) == 1:
+            name = next(iter(SERVICES))
+        svc = SERVICES.get(name)
+        if svc is None:
+            return 404, {"error": f"unknown service: {name}"}
+        return await self._serve(svc)
 
-        time.sleep(sleep_interval)
+    async def _serve(self, svc: VirtualService) -> tuple[int, dict]:
+        start = time.perf_counter()
+        st = svc.values_at(time.monotonic())
+        rng = self.rng
+        mu, sigma = _lognormal_params(st["latency_p99"])
+        await asyncio.sleep(rng.lognormvariate(mu, sigma))
+
+        status = bisect.bisect_right(_status_cdf(st["error_rate"]), rng.random())
+        failed = []
+        if status == 0 and svc.dependencies:
+            results = await asyncio.gather(*(self._call(svc, dep) for dep, _ in svc.dependencies))
+            failed = [dep for (dep, critical), ok in zip(svc.dependencies, results, strict=True)
+                      if critical and not ok]
+            if failed:
+                status = STATUSES.index("500")
+
+        profile = svc.traffic.profile
+        series = 0 if profile is None else bisect.bisect_right(profile.cdf, rng.random())
+        if svc.svc_type == "ai-gate":
+            action = bisect.bisect_right(_AI_ACTION_CDF, rng.random())
+            override = rng.random() < st["reversal_rate"]
+            svc.traffic.record(series, status, time.perf_counter() - start, action, override,
+                               override and rng.random() < HCF_FRACTION)
+        else:
+            svc.traffic.record(series, status, time.perf_counter() - start)
+        code = int(STATUSES[status])
+        body = {"service": svc.name, "status": code}
+        if failed:
+            body["failed_dependencies"] = failed
+        return code, body
+
+    async def _call(self, svc: VirtualService, dep: str) -> bool:
+        target = self.upstreams.get(dep)
+        if target is None:
+            return True   # unresolved (warned at startup); treat as healthy
+        pool = self._pool(svc.name, dep, args.upstream_pool)
+        try:
+            code = await asyncio.wait_for(pool.get(target[2]), args.upstream_timeout)
+        except TimeoutError:
+            upstream_calls_total.labels(service=svc.name, dependency=dep, result="timeout").inc()
+            return False
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            upstream_calls_total.labels(service=svc.name, dependency=dep, result="error").inc()
+            return False
+        ok = 200 <= code < 300
+        upstream_calls_total.labels(service=svc.name, dependency=dep,
+                                    result="ok" if ok else "error").inc()
+        return ok
+
+    # --- open-loop load generator ---
+
+    async def _arrivals(self, svc: VirtualService) -> None:
+        """Poisson arrivals at the service's rps curve, never waiting on responses."""
+        loop = asyncio.get_running_loop()
+        # The client side is bounded by --loadgen-max-inflight, not the pool.
+        pool = self._pool("loadgen", svc.name, args.loadgen_max_inflight)
+        path = f"/api/{svc.name}"
+        dropped = loadgen_requests_total.labels(service=svc.name, result="dropped")
+        next_at = loop.time()
+        launched = 0
+        while True:
+            rps = svc.values_at(time.monotonic())["rps"] * svc.speed
+            if rps <= 0:
+                await asyncio.sleep(TICK_INTERVAL)
+                next_at = loop.time()
+                continue
+            next_at += self.rng.expovariate(rps)
+            delay = next_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif launched % 64 == 0:
+                await asyncio.sleep(0)   # catching up: still let responses run
+            launched += 1
+            if self.inflight >= args.loadgen_max_inflight:
+                dropped.inc()
+                continue
+            self.inflight += 1
+            loop.create_task(self._client_request(svc, pool, path, next_at))
+
+    async def _client_request(self, svc, pool: UpstreamPool, path: str, intended: float) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            code = await asyncio.wait_for(pool.get(path), LOADGEN_TIMEOUT)
+            result = "ok" if 200 <= code < 300 else "error"
+        except TimeoutError:
+            result = "timeout"
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            result = "error"
+        finally:
+            self.inflight -= 1
+        loadgen_latency_seconds.labels(service=svc.name).observe(loop.time() - intended)
+        loadgen_requests_total.labels(service=svc.name, result=result).inc()
+
+    async def run(self) -> None:
+        server = await asyncio.start_server(self._connection, "0.0.0.0", self.port,
+                                            backlog=1024)
+        for svc in self.entry:
+            asyncio.get_running_loop().create_task(self._arrivals(svc))
+        async with server:
+            await server.serve_forever()
+
+    def stats(self) -> dict:
+        return {
+            "port": self.port,
+            "inflight": self.inflight,
+            "loadgen": [svc.name for svc in self.entry],
+            "unresolved_dependencies": self.unresolved,
+        }
+
+
+api_server = ApiServer(args.api_port) if args.command is None and args.api_port else None
+
+
+# ---------------------------------------------------------------------------
+# Historical backfill (offline, simulated clock)
+# ---------------------------------------------------------------------------
+
+# Memory stays bounded: each family is spooled to its own temp file during
+# the simulation and the files are concatenated at the end, so families are
+# never interleaved. Within a family samples are time-major (every series
+# at t, then t+step), which promtool accepts but strict OpenMetrics parsers
+# that demand per-series grouping do not.
+
+def _scenario_events(path: str, start_offset: float) -> list[tuple[float, str, object]]:
+    """Flatten a scenario's phases into (offset_seconds, service, control) events.
+
+    Actions are expanded by _scenario_actions, the parser the scenario
+    runner uses, so at/every/until/count/jitter/stagger, services: lists
+    and control: lists fire exactly as they would live. Jitter draws from
+    --seed. An invalid action is a usage error, not a silent skip.
+    """
+    docs = _load_yaml(path, "--scenario")
+    scenario = (docs[0] or {}).get("scenario", {}) if docs else {}
+    try:
+        plans = plan_phases(scenario, scenario.get("services") or SERVICES)
+    except ValueError as exc:
+        backfill_parser.error(f"--scenario {path}: {exc}")
+    rng = random.Random(args.seed if args.seed is not None else 0)
+    return [(start_offset + offset, name, control)
+            for offset, _, name, control in expand_actions(plans, rng)]
+
+
+def _apply_control(svc: VirtualService, control, t: float) -> None:
+    """Apply a scenario control value ("reset" or a /control body) during backfill."""
+    if control == "reset":
+        svc.reset(t)
+    else:
+        svc.set_curves(parse_control(control), t)
+
+
+def _openmetrics_ts(t: float) -> str:
+    ms = round(t * 1000)
+    return f"{ms // 1000}.{ms % 1000:03d}"
+
+
+def _backfill_chunks(start: float, end: float, step: float,
+                     events: list[tuple[float, str, object]]):
+    """Yield (family, text) per simulated step, advancing the same model as serving.
+
+    Curves are evaluated at simulated time and traffic is drawn with
+    _draw_batch for each ``step`` — exactly what the live tick loop does,
+    minus the sleeping.
+    """
+    n_status, n_buckets = len(STATUSES), len(LATENCY_BUCKETS)
+    pending = collections.deque(sorted(events, key=lambda e: e[0]))
+    k, t = 0, start
+    while t <= end:
+        while pending and start + pending[0][0] <= t:
+            offset, name, control = pending.popleft()
+            if name in SERVICES:
+                _apply_control(SERVICES[name], control, start + offset)
+
+        ts = _openmetrics_ts(t)
+        requests, durations, gates = [], [], []
+        for svc in SERVICES.values():
+            st = svc.values_at(t)
+            expected = max(st["rps"], 0) * step + svc.carry
+            n = int(expected)
+            svc.carry = expected - n
+            if n:
+                svc.traffic.apply(_draw_batch(n, st["error_rate"], st["latency_p99"],
+                                              st["reversal_rate"], svc.svc_type == "ai-gate",
+                                              svc.traffic.cdf))
+            snap = svc.traffic.snapshot()
+            counts = snap["requests"]
+            for i, labels in enumerate(svc.traffic.label_text):
+                for j, status in enumerate(STATUSES):
+                    requests.append(f'http_requests_total{{{labels},status="{status}"}} '
+                                    f"{counts[i * n_status + j]} {ts}\n")
+            counts, sums = snap["bucket_counts"], snap["duration_sums"]
+            for i, labels in enumerate(svc.traffic.label_text):
+                cumulative = 0.0
+                for j, le in enumerate(_BUCKET_LABELS):
+                    cumulative += counts[i * n_buckets + j]
+                    durations.append(f'http_request_duration_seconds_bucket{{{labels},le="{le}"}} '
+                                     f"{cumulative} {ts}\n")
+                durations.append(f"http_request_duration_seconds_count{{{labels}}} "
+                                 f"{cumulative} {ts}\n")
+                durations.append(f"http_request_duration_seconds_sum{{{labels}}} {sums[i]} {ts}\n")
+            if svc.svc_type == "ai-gate":
+                label = f'service="{_escape(svc.name)}"'
+                for action, count in snap["decisions"].items():
+                    gates.append(("gen_ai_decisions",
+                                  f'gen_ai_decisions_total{{{label},action="{action}"}} '
+                                  f"{float(count)} {ts}\n"))
+                gates.append(("gen_ai_overrides", f"gen_ai_overrides_total{{{label}}} "
+                                                  f"{float(snap['overrides'])} {ts}\n"))
+                gates.append(("gen_ai_overrides_hcf", f"gen_ai_overrides_hcf_total{{{label}}} "
+                                                      f"{float(snap['overrides_hcf'])} {ts}\n"))
+        yield "http_requests", "".join(requests)
+        yield "http_request_duration_seconds", "".join(durations)
+        yield from gates
+        k += 1
+        t = start + k * step   # index-based so float error does not accumulate
+
+
+# OpenMetrics family name -> (type, help). Counter families drop "_total".
+_BACKFILL_FAMILIES = {
+    "http_requests": ("counter", "Total HTTP requests"),
+    "http_request_duration_seconds": ("histogram", "HTTP request duration in seconds"),
+    "gen_ai_decisions": ("counter", "Total AI gate decisions"),
+    "gen_ai_overrides": ("counter", "Total AI gate overrides"),
+    "gen_ai_overrides_hcf": ("counter", "Total AI gate high-confidence failure overrides"),
+}
+
+
+def run_backfill() -> None:
+    try:
+        step = parse_duration(args.resolution)
+        offset = parse_duration(args.scenario_at)
+    except ValueError as exc:
+        backfill_parser.error(str(exc))
+    if step <= 0:
+        backfill_parser.error("--resolution must be positive")
+    if args.end == "now":
+        end = time.time()
+    else:
+        try:
+            end = float(args.end)
+        except ValueError:
+            backfill_parser.error(f"--end must be a Unix timestamp or 'now', got {args.end!r}")
+    end -= end % step                      # align samples to the resolution grid
+    start = end - args.days * 86400
+    events = _scenario_events(args.scenario, offset) if args.scenario else []
+
+    _seed_rng(args.seed if args.seed is not None else 0)
+    out = sys.stdout if args.output == "-" else open(args.output, "w")  # noqa: SIM115
+    with tempfile.TemporaryDirectory(prefix="fake-backfill-") as spool_dir:
+        spools = {family: open(f"{spool_dir}/{family}.om", "w")  # noqa: SIM115
+                  for family in _BACKFILL_FAMILIES}
+        try:
+            for family, text in _backfill_chunks(start, end, step, events):
+                spools[family].write(text)
+        finally:
+            for fh in spools.values():
+                fh.close()
+        for family, (kind, help_text) in _BACKFILL_FAMILIES.items():
+            with open(f"{spool_dir}/{family}.om") as fh:
+                if fh.read(1) == "":
+                    continue                    # family unused (e.g. no ai-gate services)
+                fh.seek(0)
+                out.write(f"# TYPE {family} {kind}\n# HELP {family} {help_text}\n")
+                shutil.copyfileobj(fh, out)
+    out.write("# EOF\n")
+    if out is not sys.stdout:
+        out.close()
 
 
 # ---------------------------------------------------------------------------
 # HTTP request handler
 # ---------------------------------------------------------------------------
 
-class Handler(BaseHTTPRequestHandler):
+class Handler(PooledRequestHandler):
     def log_message(self, fmt, *args):  # suppress default access log noise
         pass
 
@@ -220,6 +1813,7 @@ class Handler(BaseHTTPRequestHandler):
     def do_OPTIONS(self):
         self.send_response(204)
         self._cors_headers()
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
     # --- routing ---
@@ -229,63 +1823,97 @@ class Handler(BaseHTTPRequestHandler):
             self._handle_metrics()
         elif self.path == "/health":
             self._handle_health()
+        elif self.path == "/debug/stats":
+            self._send(200, generator_stats.snapshot())
         else:
             self._send(404, {"error": "not found"})
 
     def do_POST(self):
-        if self.path == "/control":
-            self._handle_control()
-        elif self.path == "/reset":
-            self._handle_reset()
-        else:
+        # Always drain the body first: on a keep-alive connection unread
+        # bytes would be parsed as the next request line.
+        length = int(self.headers.get("Content-Length", 0))
+        self._body = self.rfile.read(length) if length else b""
+        route, _, name = self.path.lstrip("/").partition("/")
+        if route not in ("control", "reset"):
             self._send(404, {"error": "not found"})
+            return
+        if name:
+            if name not in SERVICES:
+                self._send(404, {"error": f"unknown service: {name}"})
+                return
+            targets = [SERVICES[name]]
+        else:
+            targets = list(SERVICES.values())
+        if route == "control":
+            self._handle_control(targets)
+        else:
+            self._handle_reset(targets)
 
     # --- handlers ---
 
     def _handle_metrics(self):
-        output = generate_latest()
+        use_gzip = _accepts_gzip(self.headers.get("Accept-Encoding"))
+        output, etag, rendered = metrics_cache.get(use_gzip)
+        if _etag_matches(self.headers.get("If-None-Match"), etag):
+            metrics_scrapes_total.labels(result="not_modified").inc()
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self._cors_headers()
+            self.end_headers()
+            return
+        metrics_scrapes_total.labels(result="rendered" if rendered else "cached").inc()
         self.send_response(200)
         self.send_header("Content-Type", CONTENT_TYPE_LATEST)
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
         self.send_header("Content-Length", str(len(output)))
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept-Encoding")
         self._cors_headers()
         self.end_headers()
         self.wfile.write(output)
 
     def _handle_health(self):
-        self._send(200, {"status": "ok", "service": SERVICE_NAME})
+        payload = {"status": "ok", "service": next(iter(SERVICES))}
+        if len(SERVICES) > 1:
+            payload = {"status": "ok", "services": len(SERVICES)}
+        self._send(200, payload)
 
-    def _handle_control(self):
+    def _handle_control(self, targets: list[VirtualService]):
         body = self._read_json()
         if body is None:
             return
-        with state_lock:
-            for key in ("error_rate", "latency_p99", "reversal_rate", "rps"):
-                if key in body:
-                    val = body[key]
-                    try:
-                        val = float(val) if key != "rps" else int(val)
-                    except (TypeError, ValueError):
-                        self._send(400, {"error": f"invalid value for {key}"})
-                        return
-                    _schedule_ramp(key, val)
-        self._send(200, {"status": "ok", "queued": list(body.keys())})
-
-    def _handle_reset(self):
-        with state_lock:
-            for key, val in baseline.items():
-                _schedule_ramp(key, val)
-        self._send(200, {"status": "ok", "reset": True})
+        try:
+            values = parse_control(body)
+            speed = _parse_speed(body)
+        except ValueError as exc:
+            self._send(400, {"error": str(exc)})
+            return
+        now = time.monotonic()
+        with _timed_lock(state_lock, "state"):
+            for svc in targets:
+                if speed is not None and speed != svc.speed:
+                    svc.set_speed(speed, now)
+                svc.set_curves(values, now)
+        self._send(200, {"status": "ok", "queued": list(body.keys()), "services": len(targets)})
+
+    def _handle_reset(self, targets: list[VirtualService]):
+        now = time.monotonic()
+        with _timed_lock(state_lock, "state"):
+            for svc in targets:
+                svc.reset(now)
+        self._send(200, {"status": "ok", "reset": True, "services": len(targets)})
 
     # --- helpers ---
 
     def _read_json(self):
-        length = int(self.headers.get("Content-Length", 0))
-        if length == 0:
+        if not self._body:
             self._send(400, {"error": "empty body"})
             return None
-        raw = self.rfile.read(length)
         try:
-            return json.loads(raw)
+            return json.loads(self._body)
         except json.JSONDecodeError as exc:
             self._send(400, {"error": f"invalid JSON: {exc}"})
             return None
@@ -305,16 +1933,38 @@ class Handler(BaseHTTPRequestHandler):
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    print(f"[fake-service] name={SERVICE_NAME} type={SERVICE_TYPE} port={PORT} rps={BASELINE_RPS}")
+    if args.command == "backfill":
+        run_backfill()
+        sys.exit(0)
+
+    names = ",".join(SERVICES) if len(SERVICES) <= 4 else f"{len(SERVICES)} services"
+    print(f"[fake-service] name={names} port={PORT} rps={BASELINE_RPS} "
+          f"tick={TICK_INTERVAL}s sampler={'numpy' if np is not None else 'python'}")
 
     # Background threads
+    if remote_writer is not None:
+        remote_writer.start()
+        print(f"[fake-service] remote write → {args.remote_write}  "
+              f"shards={len(remote_writer.shards)} "
+              f"compression={remote_writer.stats()['compression']}")
     threading.Thread(target=_generate_traffic, daemon=True).start()
-    threading.Thread(target=_ramp_thread, daemon=True).start()
+    if api_server is not None:
+        threading.Thread(target=asyncio.run, args=(api_server.run(),), name="api",
+                         daemon=True).start()
+        print(f"[fake-service] /api on port {api_server.port}  "
+              f"loadgen={','.join(svc.name for svc in api_server.entry) or 'none'}")
+        for dep in api_server.unresolved:
+            print(f"[fake-service] warning: dependency {dep!r} is not hosted here and has "
+                  f"no --upstream; calls to it are skipped")
 
     # Single HTTP server for both /metrics and control endpoints
-    server = HTTPServer(("0.0.0.0", PORT), Handler)
-    print(f"[fake-service] Listening on port {PORT}  (/metrics, /control, /reset, /health)")
+    if args.workers > 0:
+        server = PooledHTTPServer(("0.0.0.0", PORT), Handler, args.workers)
+    else:
+        server = ThreadingHTTPServer(("0.0.0.0", PORT), Handler)
+    print(f"[fake-service] Listening on port {PORT}  (/metrics, /control, /reset, /health, /debug/stats)  "
+          f"workers={args.workers or 'per-connection'}")
     try:
         server.serve_forever()
     except KeyboardInterrupt:
-        print(f"\n[fake-service] {SERVICE_NAME} shutting down.")
+        print(f"\n[fake-service] {names} shutting down.")
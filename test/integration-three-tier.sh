@@ -168,66 +168,68 @@ info "control sent: reversal_rate=0.08 rps=100"
 # Wait for the verdict chain
 # ---------------------------------------------------------------------------
 
-# run_assertion <description> <args-to-three_tier_assertions.py...>
-# Captures stdout from the assertions helper into an `output` var; the
-# explicit `|| fail` propagates a non-zero exit even though set -e in
-# combination with `$(...)` does not abort by itself. Then evals the
-# captured KEY=value lines so they become shell variables.
+# The whole chain runs as one `three_tier_assertions.py batch` (one
+# interpreter, one core connection) instead of a `uv run` per wait. Each
+# wait is ordered `after` the previous one, so the per-stage timeouts keep
+# their sequential meaning; the lineage assertion starts as soon as the
+# triage verdict resolves and the bench fetch as soon as the case does.
+# Entries print `KEY=value` lines renamed by their "prefix"; the batch
+# ends with BATCH_FAILED=<ids> (failed entries, plus dependents skipped
+# because of them). run_assertion_batch fails when that line is missing.
+#
 # Using `output=$(...)` followed by `eval "${output}"` (rather than the
 # more compact `eval "$(...)"`) is load-bearing: with the compact form,
 # command substitution that produces empty stdout makes eval return 0
 # regardless of the inner exit code, swallowing assertion failures.
-# Bash dynamic scoping means variables assigned inside `eval "${output}"`
-# leak out to the caller — that's intentional and how downstream lines
-# read VERDICT_ID etc.
-run_assertion() {
-    local description="$1"; shift
-    local output
-    output=$(${RUN_BENCH} python "${ASSERTIONS}" "$@") \
-        || fail "${description}: assertion helper exited non-zero"
-    eval "${output}"
-}
-
-log "Wait for measure → quality_breach (up to 180s for Prometheus 2m window to fill)"
-run_assertion "quality_breach" wait-verdict-type quality_breach \
-    --service fraud-detect --core-url "${CORE_URL}" --timeout 180 --interval 2
-QUALITY_BREACH_ID="${VERDICT_ID}"
-QUALITY_BREACH_AT="${VERDICT_CREATED_AT}"
+#
+# Learn emits a retrospective or a calibration_signal; either proves learn
+# ran. The batch waits for the retrospective (allowed to fail) and the
+# calibration_signal fallback below only runs when it did not land.
+
+log "Wait for the verdict chain (quality_breach → correlation_snapshot → triage → case → learn)"
+info "quality_breach waits up to 180s for the Prometheus 2m window to fill"
+BATCH_FAILED=""
+output=$(run_assertion_batch "${RUN_BENCH}" "${ASSERTIONS}" "${CORE_URL}" <<EOF
+{"id": "quality_breach", "prefix": "QB_", "argv": ["wait-verdict-type", "quality_breach", "--service", "fraud-detect", "--timeout", "180", "--interval", "2"]}
+{"id": "correlation_snapshot", "prefix": "CORR_", "after": ["quality_breach"], "argv": ["wait-assessment-kind", "correlation_snapshot", "--timeout", "30", "--interval", "1"]}
+{"id": "triage", "prefix": "TRIAGE_", "after": ["correlation_snapshot"], "argv": ["wait-verdict-type", "triage", "--timeout", "60", "--interval", "1"]}
+{"id": "case", "after": ["triage"], "argv": ["wait-case", "--service", "fraud-detect", "--timeout", "60", "--interval", "1"]}
+{"id": "lineage", "argv": ["assert-lineage", "\${triage.VERDICT_ID}", "\${quality_breach.VERDICT_ID}"]}
+{"id": "bench_fetch", "after": ["case"], "argv": ["fetch-case-via-bench", "--state", "pending"]}
+{"id": "retrospective", "prefix": "LEARN_", "after": ["case"], "argv": ["wait-assessment-kind", "retrospective", "--timeout", "60", "--interval", "2"]}
+EOF
+) || fail "verdict chain: assertion batch exited without reporting BATCH_FAILED"
+eval "${output}"
+
+# batch_failed <id> — true when the batch reported <id> as failed or skipped.
+batch_failed() { [[ ",${BATCH_FAILED}," == *",$1,"* ]]; }
+
+for stage in quality_breach correlation_snapshot triage case; do
+    if batch_failed "${stage}"; then
+        fail "${stage}: wait failed or was skipped (see stderr above)"
+    fi
+done
+QUALITY_BREACH_ID="${QB_VERDICT_ID}"
+QUALITY_BREACH_AT="${QB_VERDICT_CREATED_AT}"
 pass "quality_breach: ${QUALITY_BREACH_ID} at ${QUALITY_BREACH_AT}"
-
 # Latency budget starts here per design: from quality_breach.created_at to
 # the moment fetch_case_bench can return the case.
-log "Wait for correlate → correlation_snapshot (assessment)"
-run_assertion "correlation_snapshot" wait-assessment-kind correlation_snapshot \
-    --core-url "${CORE_URL}" --timeout 30 --interval 1
-CORR_ID="${ASSESSMENT_ID}"
-pass "correlation_snapshot: ${CORR_ID} at ${ASSESSMENT_CREATED_AT}"
-
-log "Wait for respond → triage verdict"
-run_assertion "triage" wait-verdict-type triage \
-    --core-url "${CORE_URL}" --timeout 60 --interval 1
-TRIAGE_ID="${VERDICT_ID}"
-pass "triage: ${TRIAGE_ID} at ${VERDICT_CREATED_AT}"
-
-log "Wait for respond → case"
-run_assertion "case" wait-case \
-    --service fraud-detect --core-url "${CORE_URL}" --timeout 60 --interval 1
+pass "correlation_snapshot: ${CORR_ASSESSMENT_ID} at ${CORR_ASSESSMENT_CREATED_AT}"
+TRIAGE_ID="${TRIAGE_VERDICT_ID}"
+pass "triage: ${TRIAGE_ID} at ${TRIAGE_VERDICT_CREATED_AT}"
 CASE_ID_HIT="${CASE_ID}"
 CASE_AT="${CASE_CREATED_AT}"
 pass "case: ${CASE_ID_HIT} priority=${CASE_PRIORITY} at ${CASE_AT}"
 
-log "Wait for learn → calibration_signal or retrospective"
-# Learn module emits one of these; either path proves learn ran. The OR
-# fallback isn't run_assertion (because the first leg is allowed to fail).
-if output=$(${RUN_BENCH} python "${ASSERTIONS}" wait-assessment-kind retrospective \
-    --core-url "${CORE_URL}" --timeout 60 --interval 2 2>/dev/null); then
-    eval "${output}"
-else
+if batch_failed retrospective; then
     info "no retrospective yet; trying calibration_signal"
-    run_assertion "learn calibration_signal" wait-assessment-kind calibration_signal \
-        --core-url "${CORE_URL}" --timeout 60 --interval 2
+    output=$(${RUN_BENCH} python "${ASSERTIONS}" wait-assessment-kind calibration_signal \
+        --core-url "${CORE_URL}" --timeout 60 --interval 2) \
+        || fail "learn calibration_signal: assertion helper exited non-zero"
+    eval "${output}"
+    LEARN_ASSESSMENT_ID="${ASSESSMENT_ID}"
 fi
-pass "learn assessment: ${ASSESSMENT_ID}"
+pass "learn assessment: ${LEARN_ASSESSMENT_ID}"
 
 # ---------------------------------------------------------------------------
 # Strong lineage assertions (Rob's design addition #1)
@@ -241,9 +243,11 @@ log "Strong lineage assertions"
 # quality_breach. respond's worker_helpers sets parent_ids on the first
 # incident verdict to trigger_verdict_ids (correlation_snapshot id when
 # correlate ran; quality_breach id on the fallback path). Either way the
-# ancestry chain reaches the quality_breach.
-${RUN_BENCH} python "${ASSERTIONS}" assert-lineage \
-    "${TRIAGE_ID}" "${QUALITY_BREACH_ID}" --core-url "${CORE_URL}"
+# ancestry chain reaches the quality_breach. Asserted by the batch's
+# "lineage" entry.
+if batch_failed lineage; then
+    fail "triage verdict's ancestors do not reach quality_breach"
+fi
 pass "triage verdict's ancestors reach quality_breach"
 
 # ---------------------------------------------------------------------------
@@ -251,8 +255,9 @@ pass "triage verdict's ancestors reach quality_breach"
 # ---------------------------------------------------------------------------
 
 log "Bench reads case via core API (sre.case_bench.fetch_case_bench)"
-${RUN_BENCH} python "${ASSERTIONS}" fetch-case-via-bench \
-    --state pending --core-url "${CORE_URL}"
+if batch_failed bench_fetch; then
+    fail "bench logic layer could not fetch a case via core API"
+fi
 pass "bench logic layer fetched ≥1 case via core API"
 
 # ---------------------------------------------------------------------------
@@ -265,6 +270,22 @@ log "Pipeline latency: quality_breach.created_at → case.created_at"
 # correlate → respond → case insert. Excludes Prometheus window staleness
 # (which is upstream of quality_breach) and bench-fetch overhead (which is
 # trivial and not part of the worker pipeline).
-${RUN_BENCH} python "${ASSERTIONS}" assert-latency \
-    "${QUALITY_BREACH_AT}" "${CASE_AT}" "${LATENCY_BUDGET_SECONDS}"
+# Fail fast with "generator saturated" if fake-service itself fell behind:
+# a starved load generator delays the breach signal and would otherwise
+# be blamed on the workers.
+check_fake_service_saturation "${FAKE_PORT}" "${WORK_DIR}"
+# Per-stage breakdown first, so a blown budget below already shows which
+# hop (correlate, respond, case insert) ate the time. Informational only.
+# Both run in one batch; latency-report's table is printed as-is (it is not
+# KEY=value output) and its failure is tolerated.
+output=$(run_assertion_batch "${RUN_BENCH}" "${ASSERTIONS}" "${CORE_URL}" <<EOF
+{"id": "latency_report", "argv": ["latency-report", "--since", "${QUALITY_BREACH_AT}", "--max-seconds", "${LATENCY_BUDGET_SECONDS}", "--json", "${WORK_DIR}/latency-report.json"]}
+{"id": "latency", "argv": ["assert-latency", "${QUALITY_BREACH_AT}", "${CASE_AT}", "${LATENCY_BUDGET_SECONDS}"]}
+EOF
+) || fail "latency: assertion batch exited without reporting BATCH_FAILED"
+printf '%s\n' "${output}" | grep -v '^BATCH_FAILED=' || true
+BATCH_FAILED="$(sed -n 's/^BATCH_FAILED=//p' <<<"${output}")"
+if batch_failed latency; then
+    fail "pipeline latency over ${LATENCY_BUDGET_SECONDS}s"
+fi
 pass "pipeline latency under ${LATENCY_BUDGET_SECONDS}s"
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+lineage-bench.py — ancestor/descendant query cost on a synthetic verdict DAG.
+
+Builds a SQLite verdict DAG shaped like the pipeline's lineage — fan-in
+quality_breach verdicts under each correlation_snapshot, a triage on top,
+then learn verdicts chained to the requested depth (each may also cite an
+earlier verdict in its chain, so the graph is a DAG, not a tree) — and
+times three ways of answering GET /verdicts/{id}/ancestors and a
+descendants lookup:
+
+    walk     hop-by-hop parent lookups from Python (one query per node)
+    cte      one recursive CTE over an indexed parent-edge table
+    closure  one indexed read of a closure table maintained on insert
+
+It prints p50/p95/max per depth, plus build time and row counts, so the
+schema core's Store adopts can be checked against the millisecond budget
+for bench and the respond worker before it ships.
+
+Usage:
+    python test/lineage-bench.py                          # 10^5 verdicts, depths 2..50
+    python test/lineage-bench.py --verdicts 20000 --depths 2,10 --fan-in 48
+    python test/lineage-bench.py --db /tmp/lineage.db --json lineage.json
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from _bench_util import percentile
+
+SCHEMA = """
+CREATE TABLE verdicts (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE verdict_parent (
+    child_id TEXT NOT NULL,
+    parent_id TEXT NOT NULL,
+    PRIMARY KEY (child_id, parent_id)
+) WITHOUT ROWID;
+CREATE INDEX verdict_parent_by_parent ON verdict_parent (parent_id, child_id);
+CREATE TABLE verdict_closure (
+    ancestor TEXT NOT NULL,
+    descendant TEXT NOT NULL,
+    depth INTEGER NOT NULL,
+    PRIMARY KEY (descendant, ancestor)
+) WITHOUT ROWID;
+CREATE INDEX verdict_closure_by_ancestor ON verdict_closure (ancestor, descendant);
+"""
+
+# UNION (not UNION ALL) on the bare id keeps each node once however many
+# paths reach it, so the walk stays linear in the answer on a DAG.
+ANCESTORS_CTE = """
+WITH RECURSIVE anc(id) AS (
+    SELECT parent_id FROM verdict_parent WHERE child_id = ?
+    UNION
+    SELECT p.parent_id FROM verdict_parent p JOIN anc ON p.child_id = anc.id
+)
+SELECT id FROM anc
+"""
+DESCENDANTS_CTE = """
+WITH RECURSIVE des(id) AS (
+    SELECT child_id FROM verdict_parent WHERE parent_id = ?
+    UNION
+    SELECT p.child_id FROM verdict_parent p JOIN des ON p.parent_id = des.id
+)
+SELECT id FROM des
+"""
+ANCESTORS_CLOSURE = "SELECT ancestor FROM verdict_closure WHERE descendant = ? AND depth > 0"
+DESCENDANTS_CLOSURE = "SELECT descendant FROM verdict_closure WHERE ancestor = ? AND depth > 0"
+
+# Closure maintenance on insert: the new row is its own depth-0 ancestor and
+# inherits every ancestor of each parent one hop further away.
+CLOSURE_SELF = "INSERT INTO verdict_closure (ancestor, descendant, depth) VALUES (?, ?, 0)"
+CLOSURE_INHERIT = """
+INSERT INTO verdict_closure (ancestor, descendant, depth)
+SELECT ancestor, ?, depth + 1 FROM verdict_closure WHERE descendant = ?
+ON CONFLICT (descendant, ancestor) DO UPDATE SET depth = MIN(depth, excluded.depth)
+"""
+
+
+def build(db: sqlite3.Connection, total: int, depths: list[int], fan_in: int,
+          share: float, rng: random.Random) -> tuple[dict[int, list[str]], list[str], float]:
+    """Insert chains until ``total`` verdicts exist.
+
+    Returns the chain tips by depth, the breach ids, and the seconds spent
+    maintaining the closure table (the write-side cost of that schema).
+    """
+    tips: dict[int, list[str]] = {d: [] for d in depths}
+    breaches: list[str] = []
+    closure_seconds = 0.0
+    count = 0
+    clock = 0.0
+
+    def add(kind: str, parents: list[str]) -> str:
+        nonlocal count, clock, closure_seconds
+        count += 1
+        clock += 0.01
+        vid = f"vrd-{count:07d}"
+        db.execute("INSERT INTO verdicts (id, type, created_at) VALUES (?, ?, ?)",
+                   (vid, kind, clock))
+        db.executemany("INSERT OR IGNORE INTO verdict_parent (child_id, parent_id) VALUES (?, ?)",
+                       [(vid, parent) for parent in parents])
+        started = time.perf_counter()
+        db.execute(CLOSURE_SELF, (vid, vid))
+        for parent in parents:
+            db.execute(CLOSURE_INHERIT, (vid, parent))
+        closure_seconds += time.perf_counter() - started
+        return vid
+
+    chain = 0
+    while count < total:
+        depth = depths[chain % len(depths)]
+        chain += 1
+        cited = []
+        for _ in range(fan_in):
+            # Breaches outlive one incident: some snapshots re-cite recent ones.
+            if breaches and rng.random() < share:
+                cited.append(rng.choice(breaches[-fan_in * 20:]))
+            else:
+                breaches.append(add("quality_breach", []))
+                cited.append(breaches[-1])
+        members = [add("correlation_snapshot", sorted(set(cited)))]
+        members.append(add("triage", [members[-1]]))
+        for _ in range(depth - 2):
+            parents = [members[-1]]
+            if len(members) > 2 and rng.random() < 0.5:
+                parents.append(rng.choice(members[:-1]))
+            members.append(add("learn", parents))
+        tips[depth].append(members[-1])
+    db.commit()
+    return tips, breaches, closure_seconds
+
+
+def walk(db: sqlite3.Connection, vid: str, column: str, other: str) -> set[str]:
+    """Hop-by-hop BFS: one indexed lookup per visited node."""
+    query = f"SELECT {other} FROM verdict_parent WHERE {column} = ?"
+    seen: set[str] = set()
+    frontier = [vid]
+    while frontier:
+        current = frontier.pop()
+        for (nxt,) in db.execute(query, (current,)):
+            if nxt not in seen:
+                seen.add(nxt)
+                frontier.append(nxt)
+    return seen
+
+
+def time_queries(db: sqlite3.Connection, ids: list[str], direction: str) -> dict[str, dict]:
+    if direction == "ancestors":
+        methods = {
+            "walk": lambda v: walk(db, v, "child_id", "parent_id"),
+            "cte": lambda v: {r[0] for r in db.execute(ANCESTORS_CTE, (v,))},
+            "closure": lambda v: {r[0] for r in db.execute(ANCESTORS_CLOSURE, (v,))},
+        }
+    else:
+        methods = {
+            "walk": lambda v: walk(db, v, "parent_id", "child_id"),
+            "cte": lambda v: {r[0] for r in db.execute(DESCENDANTS_CTE, (v,))},
+            "closure": lambda v: {r[0] for r in db.execute(DESCENDANTS_CLOSURE, (v,))},
+        }
+    results = {}
+    reference: dict[str, set[str]] = {}
+    for name, fn in methods.items():
+        latencies, sizes = [], []
+        for vid in ids:
+            started = time.perf_counter()
+            answer = fn(vid)
+            latencies.append((time.perf_counter() - started) * 1000)
+            sizes.append(len(answer))
+            # Every method must agree, or the timing comparison is meaningless.
+            if reference.setdefault(vid, answer) != answer:
+                raise AssertionError(f"{name} {direction} of {vid} disagrees with walk")
+        results[name] = {"p50_ms": round(percentile(latencies, 50, default=float("nan")), 3),
+                         "p95_ms": round(percentile(latencies, 95, default=float("nan")), 3),
+                         "max_ms": round(max(latencies), 3) if latencies else None,
+                         "mean_result": round(sum(sizes) / len(sizes), 1) if sizes else 0}
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark verdict lineage query strategies")
+    parser.add_argument("--verdicts", type=int, default=100_000, help="total verdicts to build")
+    parser.add_argument("--depths", default="2,5,10,20,50",
+                        help="comma-separated chain depths (triage = 2)")
+    parser.add_argument("--fan-in", type=int, default=24,
+                        help="quality_breach verdicts cited per correlation_snapshot")
+    parser.add_argument("--share", type=float, default=0.3,
+                        help="chance a snapshot re-cites a recent breach instead of a new one")
+    parser.add_argument("--samples", type=int, default=200, help="lookups per depth")
+    parser.add_argument("--db", default=":memory:",
+                        help="SQLite path (default: in memory); a file shows on-disk sizes")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    args = parser.parse_args()
+    depths = sorted({int(d) for d in args.depths.split(",") if d.strip()})
+    if not depths or depths[0] < 2:
+        parser.error("--depths must be integers >= 2")
+
+    if args.db != ":memory:":
+        Path(args.db).unlink(missing_ok=True)
+    db = sqlite3.connect(args.db)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    rng = random.Random(args.seed)
+
+    started = time.perf_counter()
+    tips, breaches, closure_seconds = build(db, args.verdicts, depths, args.fan_in,
+                                            args.share, rng)
+    build_seconds = time.perf_counter() - started
+    counts = {table: db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+              for table in ("verdicts", "verdict_parent", "verdict_closure")}
+    print(f"built {counts['verdicts']} verdicts, {counts['verdict_parent']} parent edges, "
+          f"{counts['verdict_closure']} closure rows in {build_seconds:.1f}s "
+          f"(closure maintenance {closure_seconds:.1f}s)")
+    if args.db != ":memory:":
+        counts["db_bytes"] = Path(args.db).stat().st_size
+        print(f"database file {counts['db_bytes'] / 1e6:.1f} MB")
+
+    report = {"config": vars(args) | {"depths": depths}, "counts": counts,
+              "build_seconds": round(build_seconds, 2),
+              "closure_maintenance_seconds": round(closure_seconds, 2), "results": []}
+    print(f"\n{'lookup':<22} {'method':<8} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} "
+          f"{'rows':>8}")
+    groups = [(f"ancestors depth={d}", "ancestors", tips[d]) for d in depths]
+    groups.append(("descendants breach", "descendants", breaches))
+    for label, direction, pool in groups:
+        sample = rng.sample(pool, min(args.samples, len(pool)))
+        for method, row in time_queries(db, sample, direction).items():
+            print(f"{label:<22} {method:<8} {row['p50_ms']:>9.3f} {row['p95_ms']:>9.3f} "
+                  f"{row['max_ms']:>9.3f} {row['mean_result']:>8.1f}")
+            report["results"].append({"lookup": label, "method": method, **row})
+    db.close()
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+remote-write-receiver.py — local stand-in for a Prometheus remote-write endpoint.
+
+Accepts snappy-compressed WriteRequest protobufs on POST /api/v1/write and
+keeps the latest sample of every series in memory, so tests can check what
+fake-service --remote-write pushed without running Prometheus.
+
+Usage:
+    python test/remote-write-receiver.py --port 9201
+    python test/fake-service.py --name payment-api --remote-write http://localhost:9201/api/v1/write
+
+Inspect:
+    curl localhost:9201/stats                       # pushes, samples, series, out-of-order
+    curl 'localhost:9201/series?name=http_requests_total&service=payment-api'
+    curl -X POST localhost:9201/reset
+
+--fail-rate makes a share of pushes answer 503, to exercise the sender's
+bounded retries. Decoding is pure Python (python-snappy is used when
+installed); it is meant for test volumes, not a production ingest rate.
+"""
+
+import argparse
+import json
+import random
+import struct
+import sys
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+
+try:
+    import snappy  # python-snappy
+except ImportError:  # _snappy_decompress handles every block the sender emits
+    snappy = None
+
+PORT = 9201
+KEEPALIVE_TIMEOUT = 15.0
+
+
+# ---------------------------------------------------------------------------
+# Wire format
+# ---------------------------------------------------------------------------
+
+def _varint(buf: bytes, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _fields(buf: bytes):
+    """Yield (field, value) for each protobuf field in buf."""
+    pos = 0
+    while pos < len(buf):
+        key, pos = _varint(buf, pos)
+        field, wire = key >> 3, key & 7
+        if wire == 0:
+            value, pos = _varint(buf, pos)
+        elif wire == 1:
+            value, pos = buf[pos:pos + 8], pos + 8
+        elif wire == 2:
+            length, pos = _varint(buf, pos)
+            value, pos = buf[pos:pos + length], pos + length
+        elif wire == 5:
+            value, pos = buf[pos:pos + 4], pos + 4
+        else:
+            raise ValueError(f"unsupported protobuf wire type {wire}")
+        yield field, value
+
+
+def _snappy_decompress(data: bytes) -> bytes:
+    """Decode one snappy block (literals and 1/2/4-byte-offset copies)."""
+    expected, pos = _varint(data, 0)
+    out = bytearray()
+    while pos < len(data):
+        tag = data[pos]
+        pos += 1
+        kind = tag & 3
+        if kind == 0:
+            length = tag >> 2
+            if length >= 60:
+                extra = length - 59
+                length = int.from_bytes(data[pos:pos + extra], "little")
+                pos += extra
+            length += 1
+            out += data[pos:pos + length]
+            pos += length
+            continue
+        if kind == 1:
+            length = 4 + ((tag >> 2) & 7)
+            offset = ((tag >> 5) << 8) | data[pos]
+            pos += 1
+        elif kind == 2:
+            length = 1 + (tag >> 2)
+            offset = int.from_bytes(data[pos:pos + 2], "little")
+            pos += 2
+        else:
+            length = 1 + (tag >> 2)
+            offset = int.from_bytes(data[pos:pos + 4], "little")
+            pos += 4
+        if not 0 < offset <= len(out):
+            raise ValueError("corrupt snappy block: copy offset out of range")
+        start = len(out) - offset
+        if offset >= length:
+            out += out[start:start + length]
+        else:   # overlapping copy repeats the last `offset` bytes
+            for i in range(length):
+                out.append(out[start + i])
+    if len(out) != expected:
+        raise ValueError(f"snappy length mismatch: header {expected}, decoded {len(out)}")
+    return bytes(out)
+
+
+def decode_write_request(body: bytes) -> list[tuple[dict[str, str], list[tuple[int, float]]]]:
+    """[(labels, [(timestamp_ms, value), ...]), ...] from a WriteRequest."""
+    series = []
+    for field, ts_bytes in _fields(body):
+        if field != 1:      # 3 = metadata, ignored
+            continue
+        labels, samples = {}, []
+        for ts_field, value in _fields(ts_bytes):
+            if ts_field == 1:
+                label = dict(_fields(value))
+                labels[label.get(1, b"").decode()] = label.get(2, b"").decode()
+            elif ts_field == 2:
+                sample = dict(_fields(value))
+                ts = sample.get(2, 0)
+                if ts >= 1 << 63:
+                    ts -= 1 << 64
+                samples.append((ts, struct.unpack("<d", sample.get(1, bytes(8)))[0]))
+        series.append((labels, samples))
+    return series
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class Store:
+    """Latest sample per series plus ingest counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.latest: dict[tuple, tuple[int, float]] = {}
+            self.pushes = 0
+            self.samples = 0
+            self.out_of_order = 0
+            self.bytes_in = 0
+            self.rejected = 0
+            self.injected_failures = 0
+            self.last_push = None
+
+    def ingest(self, series, wire_bytes: int) -> int:
+        count = 0
+        with self._lock:
+            for labels, samples in series:
+                key = tuple(sorted(labels.items()))
+                for ts, value in samples:
+                    previous = self.latest.get(key)
+                    if previous is not None and ts <= previous[0]:
+                        self.out_of_order += 1
+                        continue
+                    self.latest[key] = (ts, value)
+                    count += 1
+            self.pushes += 1
+            self.samples += count
+            self.bytes_in += wire_bytes
+            self.last_push = time.time()
+        return count
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pushes": self.pushes,
+                "samples": self.samples,
+                "series": len(self.latest),
+                "out_of_order": self.out_of_order,
+                "rejected": self.rejected,
+                "injected_failures": self.injected_failures,
+                "bytes_in": self.bytes_in,
+                "last_push_age_seconds": (None if self.last_push is None
+                                          else round(time.time() - self.last_push, 3)),
+            }
+
+    def query(self, matchers: dict[str, str]) -> list[dict]:
+        with self._lock:
+            items = list(self.latest.items())
+        return [
+            {"labels": dict(key), "timestamp_ms": ts, "value": value}
+            for key, (ts, value) in items
+            if all(dict(key).get(name) == want for name, want in matchers.items())
+        ]
+
+
+store = Store()
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that hands each accepted connection to a bounded thread pool."""
+
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, workers: int):
+        super().__init__(server_address, handler_class)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http")
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT
+    # Headers and body go out as separate writes; without TCP_NODELAY a
+    # keep-alive client hits the Nagle / delayed-ACK 40 ms stall.
+    disable_nagle_algorithm = True
+    fail_rate = 0.0
+    verbose = False
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path == "/stats":
+            self._send(200, store.stats())
+        elif url.path == "/series":
+            matchers = {k: v[-1] for k, v in urllib.parse.parse_qs(url.query).items()}
+            if "name" in matchers:
+                matchers["__name__"] = matchers.pop("name")
+            self._send(200, store.query(matchers))
+        elif url.path == "/health":
+            self._send(200, {"status": "ok"})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        path = urllib.parse.urlsplit(self.path).path
+        if path == "/reset":
+            store.reset()
+            self._send(200, {"status": "ok"})
+            return
+        if path != "/api/v1/write":
+            self._send(404, {"error": "not found"})
+            return
+        if self.fail_rate and random.random() < self.fail_rate:
+            with store._lock:
+                store.injected_failures += 1
+            self._send(503, {"error": "injected failure (--fail-rate)"})
+            return
+        try:
+            if self.headers.get("Content-Encoding", "snappy") != "snappy":
+                raise ValueError("Content-Encoding must be snappy")
+            raw = snappy.decompress(body) if snappy is not None else _snappy_decompress(body)
+            series = decode_write_request(raw)
+        except (ValueError, IndexError, struct.error) as exc:
+            with store._lock:
+                store.rejected += 1
+            self._send(400, {"error": f"undecodable write request: {exc}"})
+            return
+        count = store.ingest(series, len(body))
+        if self.verbose:
+            print(f"[remote-write] {self.address_string()} series={len(series)} "
+                  f"samples={count} bytes={len(body)}", flush=True)
+        self.send_response(204)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send(self, code: int, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prometheus remote-write stand-in receiver")
+    parser.add_argument("--port", type=int, default=PORT, help=f"listen port (default: {PORT})")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="HTTP worker threads (0 = one thread per connection, default: 8)")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="share of pushes answered with 503 (default: 0)")
+    parser.add_argument("--verbose", action="store_true", help="print one line per push")
+    args = parser.parse_args()
+    if not 0.0 <= args.fail_rate <= 1.0:
+        parser.error("--fail-rate must be between 0 and 1")
+
+    Handler.fail_rate = args.fail_rate
+    Handler.verbose = args.verbose
+    if args.workers > 0:
+        server = PooledHTTPServer(("0.0.0.0", args.port), Handler, args.workers)
+    else:
+        server = ThreadingHTTPServer(("0.0.0.0", args.port), Handler)
+    print(f"Remote-write receiver listening on port {args.port} (/api/v1/write, /stats, /series)",
+          flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nRemote-write receiver shutting down.", file=sys.stderr)
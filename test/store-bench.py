@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+store-bench.py — mixed read/write throughput and tail latency of a SQLite verdict store.
+
+Sizes the storage profile for nthlayer-core's Store before the
+Litestream-backed deploy. Reader threads replay the polling load
+(latest-N by type/service, by-id lookups) while writer threads emit
+verdicts, against two profiles:
+
+    shared   one connection shared by every thread behind a lock — readers
+             and writers serialize, as they do on a single Store today
+    pooled   WAL, a pool of read-only connections (one per reader) and a
+             single writer connection fed by a queue; the writer commits
+             whatever is queued in one transaction (up to --write-batch)
+
+Both use the same schema, seed data and statements; --mmap-size,
+--cache-size, --synchronous and --cached-statements (Python's prepared
+statement cache per connection) apply to every connection. Prints
+reads/s, writes/s and p50/p95/p99/max latency per operation; a write's
+latency runs from submission to its commit.
+
+--write-batch and --synchronous take comma-separated lists to sweep: every
+combination runs in turn (the shared profile commits one row per
+transaction, so it only sweeps --synchronous).
+
+Usage:
+    python test/store-bench.py                                 # both profiles, 10s each
+    python test/store-bench.py --readers 16 --write-rate 500 --duration 30
+    python test/store-bench.py --profile pooled --mmap-size 268435456 --db /var/tmp/core.db
+    python test/store-bench.py --profile pooled --readers 0 --write-rate 0 \
+        --write-batch 1,10,100 --synchronous FULL,NORMAL             # commit batching
+"""
+
+import argparse
+import json
+import queue
+import random
+import sqlite3
+import sys
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from _bench_util import Recorder, percentile
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    service TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS verdicts_by_type ON verdicts (type, created_at DESC);
+CREATE INDEX IF NOT EXISTS verdicts_by_service ON verdicts (service, type, created_at DESC);
+"""
+TYPES = ("quality_breach", "triage", "action_request", "retrospective")
+INSERT = "INSERT INTO verdicts (id, type, service, created_at, body) VALUES (?, ?, ?, ?, ?)"
+READS = {
+    "latest_by_type": "SELECT id, body FROM verdicts WHERE type = ? "
+                      "ORDER BY created_at DESC LIMIT 50",
+    "latest_by_service": "SELECT id, body FROM verdicts WHERE service = ? AND type = ? "
+                         "ORDER BY created_at DESC LIMIT 50",
+    "by_id": "SELECT body FROM verdicts WHERE id = ?",
+}
+
+
+def _csv(kind):
+    """argparse type: a comma-separated list of ``kind``."""
+    def parse(value: str) -> list:
+        try:
+            return [kind(item) for item in value.split(",") if item.strip()]
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(str(exc)) from None
+    return parse
+
+
+def _synchronous(value: str) -> str:
+    value = value.strip().upper()
+    if value not in ("OFF", "NORMAL", "FULL"):
+        raise ValueError(f"invalid synchronous mode: {value!r} (choose OFF, NORMAL, FULL)")
+    return value
+
+
+def _connect(path: str, args: argparse.Namespace, *, readonly: bool = False,
+             shared: bool = False) -> sqlite3.Connection:
+    uri = f"file:{path}?mode=ro" if readonly else f"file:{path}"
+    conn = sqlite3.connect(uri, uri=True, isolation_level=None, timeout=30,
+                           check_same_thread=not shared,
+                           cached_statements=args.cached_statements)
+    conn.execute(f"PRAGMA mmap_size={args.mmap_size}")
+    conn.execute(f"PRAGMA cache_size={args.cache_size}")
+    if not readonly:
+        conn.execute(f"PRAGMA synchronous={args.synchronous}")
+    return conn
+
+
+def _body(rng: random.Random, size: int) -> str:
+    return json.dumps({"judgment": {"action": "approve", "confidence": rng.random()},
+                       "summary": "x" * size})
+
+
+def seed(path: str, args: argparse.Namespace, journal_mode: str) -> list[str]:
+    for suffix in ("", "-wal", "-shm"):
+        Path(path + suffix).unlink(missing_ok=True)
+    conn = _connect(path, args)
+    conn.execute(f"PRAGMA journal_mode={journal_mode}")
+    conn.executescript(SCHEMA)
+    rng = random.Random(args.seed)
+    ids = [f"vrd-seed-{i:07d}" for i in range(args.seed_rows)]
+    conn.execute("BEGIN")
+    conn.executemany(INSERT, ((vid, rng.choice(TYPES), f"svc-{rng.randrange(args.services)}",
+                               float(i), _body(rng, args.body_bytes))
+                              for i, vid in enumerate(ids)))
+    conn.execute("COMMIT")
+    conn.close()
+    return ids
+
+
+def _read_once(conn: sqlite3.Connection, rng: random.Random, ids: list[str],
+               services: int) -> str:
+    op = rng.choice(tuple(READS))
+    if op == "latest_by_type":
+        params: tuple = (rng.choice(TYPES),)
+    elif op == "latest_by_service":
+        params = (f"svc-{rng.randrange(services)}", rng.choice(TYPES))
+    else:
+        params = (rng.choice(ids),)
+    conn.execute(READS[op], params).fetchall()
+    return op
+
+
+def _paced(rate: float, stop: threading.Event, step):
+    """Call ``step`` at ``rate`` per second (0 = flat out) until ``stop``."""
+    interval = 1.0 / rate if rate > 0 else 0.0
+    next_at = time.perf_counter()
+    while not stop.is_set():
+        step()
+        if interval:
+            next_at += interval
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                stop.wait(delay)
+
+
+def run_shared(path: str, args: argparse.Namespace, ids: list[str], rec: Recorder,
+               stop: threading.Event) -> tuple[list[threading.Thread], Callable[[], None]]:
+    conn = _connect(path, args, shared=True)
+    lock = threading.Lock()
+    threads = []
+
+    def reader(n: int) -> None:
+        rng = random.Random(args.seed + n)
+
+        def step() -> None:
+            started = time.perf_counter()
+            with lock:
+                op = _read_once(conn, rng, ids, args.services)
+            rec.record(op, time.perf_counter() - started)
+        _paced(args.read_rate, stop, step)
+
+    def writer(n: int) -> None:
+        rng = random.Random(args.seed + 1000 + n)
+        counter = 0
+
+        def step() -> None:
+            nonlocal counter
+            counter += 1
+            row = (f"vrd-w{n}-{counter}", rng.choice(TYPES),
+                   f"svc-{rng.randrange(args.services)}", time.time(),
+                   _body(rng, args.body_bytes))
+            started = time.perf_counter()
+            try:
+                with lock:
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.execute(INSERT, row)
+                    conn.execute("COMMIT")
+            except sqlite3.Error:
+                rec.record("write", None)
+                return
+            rec.record("write", time.perf_counter() - started)
+        _paced(args.write_rate, stop, step)
+
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+    return threads, conn.close
+
+
+def run_pooled(path: str, args: argparse.Namespace, ids: list[str], rec: Recorder,
+               stop: threading.Event) -> tuple[list[threading.Thread], Callable[[], None]]:
+    writes: queue.Queue = queue.Queue()
+    threads = []
+
+    def write_loop() -> None:
+        conn = _connect(path, args)
+        while not (stop.is_set() and writes.empty()):
+            try:
+                batch = [writes.get(timeout=0.05)]
+            except queue.Empty:
+                continue
+            while len(batch) < args.write_batch:
+                try:
+                    batch.append(writes.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.executemany(INSERT, [row for row, _ in batch])
+                conn.execute("COMMIT")
+                ok = True
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                ok = False
+            done = time.perf_counter()
+            for _, submitted in batch:
+                rec.record("write", done - submitted if ok else None)
+        conn.close()
+
+    def reader(n: int) -> None:
+        conn = _connect(path, args, readonly=True)
+        rng = random.Random(args.seed + n)
+
+        def step() -> None:
+            started = time.perf_counter()
+            op = _read_once(conn, rng, ids, args.services)
+            rec.record(op, time.perf_counter() - started)
+        _paced(args.read_rate, stop, step)
+        conn.close()
+
+    def producer(n: int) -> None:
+        rng = random.Random(args.seed + 1000 + n)
+        counter = 0
+
+        def step() -> None:
+            nonlocal counter
+            counter += 1
+            writes.put(((f"vrd-w{n}-{counter}", rng.choice(TYPES),
+                         f"svc-{rng.randrange(args.services)}", time.time(),
+                         _body(rng, args.body_bytes)), time.perf_counter()))
+            # Flat-out producers would only grow the queue; block on it instead.
+            if args.write_rate <= 0:
+                while writes.qsize() > args.write_batch * 4 and not stop.is_set():
+                    time.sleep(0.0005)
+        _paced(args.write_rate, stop, step)
+
+    threads.append(threading.Thread(target=write_loop))
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    threads += [threading.Thread(target=producer, args=(i,)) for i in range(args.writers)]
+    return threads, lambda: None
+
+
+def bench(profile: str, args: argparse.Namespace) -> dict:
+    path = args.db or f"/tmp/store-bench-{profile}.db"
+    ids = seed(path, args, "wal" if profile == "pooled" else args.shared_journal)
+    rec = Recorder()
+    stop = threading.Event()
+    runner = run_pooled if profile == "pooled" else run_shared
+    threads, close = runner(path, args, ids, rec, stop)
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    close()
+    elapsed = time.perf_counter() - started
+
+    ops = {}
+    for op in (*READS, "write"):
+        lat = sorted(rec.latencies.get(op, []))
+        ops[op] = {"count": len(lat), "errors": rec.errors.get(op, 0),
+                   "per_second": round(len(lat) / elapsed, 1),
+                   **{f"{name}_ms": round(percentile(lat, pct, default=float("nan")) * 1000, 3)
+                      for name, pct in (("p50", 50), ("p95", 95), ("p99", 99))},
+                   "max_ms": round(lat[-1] * 1000, 3) if lat else None}
+    reads = sum(ops[op]["count"] for op in READS)
+    return {"profile": profile, "synchronous": args.synchronous,
+            "write_batch": args.write_batch if profile == "pooled" else 1,
+            "seconds": round(elapsed, 2),
+            "reads_per_second": round(reads / elapsed, 1),
+            "writes_per_second": ops["write"]["per_second"], "ops": ops}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Mixed read/write benchmark for a SQLite "
+                                                 "verdict store")
+    parser.add_argument("--profile", choices=("shared", "pooled", "both"), default="both")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per profile")
+    parser.add_argument("--readers", type=int, default=8, help="reader threads")
+    parser.add_argument("--writers", type=int, default=2, help="writer threads")
+    parser.add_argument("--read-rate", type=float, default=0.0,
+                        help="reads/s per reader (0 = as fast as possible)")
+    parser.add_argument("--write-rate", type=float, default=200.0,
+                        help="verdicts/s per writer (0 = as fast as possible)")
+    parser.add_argument("--write-batch", type=_csv(int), default=[200], metavar="N[,N...]",
+                        help="pooled: most queued writes committed per transaction "
+                             "(a list sweeps)")
+    parser.add_argument("--seed-rows", type=int, default=50_000)
+    parser.add_argument("--services", type=int, default=50)
+    parser.add_argument("--body-bytes", type=int, default=800, help="verdict body padding")
+    parser.add_argument("--mmap-size", type=int, default=0, help="PRAGMA mmap_size in bytes")
+    parser.add_argument("--cache-size", type=int, default=-2000,
+                        help="PRAGMA cache_size (negative = KiB)")
+    parser.add_argument("--synchronous", type=_csv(_synchronous), default=["NORMAL"],
+                        metavar="MODE[,MODE...]",
+                        help="PRAGMA synchronous: OFF, NORMAL or FULL (a list sweeps)")
+    parser.add_argument("--shared-journal", choices=("delete", "wal"), default="wal",
+                        help="journal mode for the shared profile")
+    parser.add_argument("--cached-statements", type=int, default=128,
+                        help="prepared statements cached per connection")
+    parser.add_argument("--db", default=None,
+                        help="database path (default: /tmp/store-bench-<profile>.db)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    args = parser.parse_args()
+
+    if not args.write_batch or min(args.write_batch) < 1 or not args.synchronous:
+        parser.error("--write-batch and --synchronous need at least one value; batches >= 1")
+
+    profiles = ("shared", "pooled") if args.profile == "both" else (args.profile,)
+    runs = [(profile, sync, batch) for profile in profiles for sync in args.synchronous
+            for batch in (args.write_batch if profile == "pooled" else args.write_batch[:1])]
+    sweep = len(args.synchronous) > 1 or len(args.write_batch) > 1
+    labels = [f"{profile} {sync} b{batch if profile == 'pooled' else 1}" if sweep else profile
+              for profile, sync, batch in runs]
+    width = max(len(label) for label in (*labels, "profile"))
+    results = []
+    print(f"{'profile':<{width}} {'op':<18} {'per s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8} {'errors':>6}")
+    for (profile, sync, batch), label in zip(runs, labels, strict=True):
+        result = bench(profile, argparse.Namespace(**{**vars(args), "synchronous": sync,
+                                                      "write_batch": batch}))
+        results.append(result)
+        for op, row in result["ops"].items():
+            print(f"{label:<{width}} {op:<18} {row['per_second']:>9.1f} {row['p50_ms']:>8.3f} "
+                  f"{row['p95_ms']:>8.3f} {row['p99_ms']:>8.3f} "
+                  f"{row['max_ms'] if row['max_ms'] is not None else float('nan'):>8.3f} "
+                  f"{row['errors']:>6}")
+        print(f"{label:<{width}} {'total':<18} reads/s {result['reads_per_second']:.0f}, "
+              f"writes/s {result['writes_per_second']:.0f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({"config": vars(args), "results": results},
+                                              indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""Nearest-rank percentile shared by every latency report (test/_bench_util.py)."""
+from __future__ import annotations
+
+import pytest
+from _bench_util import percentile
+
+
+@pytest.mark.parametrize(("values", "pct", "expected"), [
+    ([1, 2, 3, 4, 5], 50, 3),
+    ([1, 2], 50, 1),
+    ([1, 2, 3, 4], 50, 2),
+    (list(range(1, 21)), 95, 19),
+    (list(range(1, 21)), 99, 20),
+    (list(range(1, 101)), 99, 99),
+    ([5, 1, 4, 2, 3], 50, 3),
+    ([7.0], 0, 7.0),
+    ([1, 2, 3], 100, 3),
+])
+def test_percentile_is_nearest_rank(values, pct, expected):
+    assert percentile(values, pct) == expected
+
+
+def test_percentile_empty_returns_default():
+    assert percentile([], 95) is None
+    assert percentile([], 95, default=0.0) == 0.0
@@ -0,0 +1,50 @@
+"""Action and phase validation in test/_scenario_actions.py."""
+from __future__ import annotations
+
+import random
+
+import pytest
+from _scenario_actions import expand_actions, parse_action, plan_phases
+
+SERVICES = {"fraud-detect": {}, "payment-api": {}}
+CONTROL = {"error_rate": 0.1}
+
+
+@pytest.mark.parametrize("count", [0, -2])
+def test_count_below_one_is_rejected(count):
+    with pytest.raises(ValueError, match="count must be at least 1"):
+        parse_action({"service": "fraud-detect", "control": CONTROL, "every": "1s",
+                      "count": count}, SERVICES, 10)
+
+
+def test_count_limits_firings():
+    spec = parse_action({"service": "fraud-detect", "control": CONTROL, "every": "1s",
+                         "count": 3}, SERVICES, 10)
+    assert len(expand_actions([(10.0, [spec])], random.Random(0))) == 3
+
+
+def test_single_service_string_is_one_item():
+    spec = parse_action({"services": "fraud-detect", "control": CONTROL}, SERVICES, 10)
+    assert spec["services"] == ["fraud-detect"]
+
+
+def test_wildcard_services_expand_to_all():
+    spec = parse_action({"services": "*", "control": CONTROL}, SERVICES, 10)
+    assert spec["services"] == list(SERVICES)
+
+
+def test_services_of_another_type_are_rejected():
+    with pytest.raises(ValueError, match="services must be"):
+        parse_action({"services": 3, "control": CONTROL}, SERVICES, 10)
+
+
+def test_phase_duration_accepts_duration_strings():
+    scenario = {"services": SERVICES,
+                "phases": [{"name": "a", "duration": "15s"}, {"name": "b", "duration": "1m30s"},
+                           {"name": "c"}]}
+    assert [duration for duration, _ in plan_phases(scenario, speed=2)] == [7.5, 45.0, 5.0]
+
+
+def test_invalid_phase_duration_names_the_phase():
+    with pytest.raises(ValueError, match="'warm-up'"):
+        plan_phases({"services": SERVICES, "phases": [{"name": "warm-up", "duration": "soon"}]})
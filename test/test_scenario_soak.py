@@ -0,0 +1,55 @@
+"""soak_cycle in demo/scenario-runner.py keeps every action plannable."""
+from __future__ import annotations
+
+import importlib.util
+import random
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("yaml")
+
+DEMO_DIR = Path(__file__).resolve().parent.parent / "demo"
+
+# scenario-runner.py is a script with a hyphenated name, so it is loaded by
+# path; its own `from _shared import ...` resolves through pytest's pythonpath.
+
+_spec = importlib.util.spec_from_file_location("scenario_runner", DEMO_DIR / "scenario-runner.py")
+scenario_runner = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(scenario_runner)
+
+SCENARIO = {
+    "services": {
+        "fraud-detect": {"port": 8001, "type": "ai-gate"},
+        "payment-api": {"port": 8002, "type": "api"},
+        "ledger-api": {"port": 8003, "type": "api"},
+    },
+    "phases": [
+        {"name": "Outage", "duration": 10,
+         "actions": [{"services": "*", "control": {"error_rate": 0.5}}]},
+        {"name": "Cascade", "duration": 10,
+         "actions": [{"services": ["payment-api"], "control": {"error_rate": 0.05}},
+                     {"service": "fraud-detect", "control": {"latency_p99": 0.8}}]},
+    ],
+}
+
+
+def test_soak_cycle_keeps_wildcard_actions():
+    for seed in range(20):
+        cycle = scenario_runner.soak_cycle(SCENARIO, random.Random(seed))
+        outage = next(p for p in cycle["phases"] if p["name"] == "Outage")
+        assert outage["actions"][0]["services"] == "*"
+
+        errors = []
+        plans = scenario_runner.plan_phases(
+            cycle, on_error=lambda i, phase, exc, errors=errors: errors.append(exc))
+        assert errors == []
+        assert [len(specs) for _, specs in plans] == [
+            len(p["actions"]) for p in cycle["phases"]]
+
+
+def test_soak_cycle_moves_named_services_within_type():
+    cycle = scenario_runner.soak_cycle(SCENARIO, random.Random(1))
+    cascade = next(p for p in cycle["phases"] if p["name"] == "Cascade")
+    assert cascade["actions"][0]["services"][0] in {"payment-api", "ledger-api"}
+    assert cascade["actions"][1]["service"] == "fraud-detect"
@@ -9,16 +9,38 @@ The bench-via-API path uses ``nthlayer_bench.sre.case_bench.fetch_case_bench``
 directly. This proves bench's logic layer reads cases through the API; it
 does NOT exercise the Textual widget rendering (covered by bench unit
 tests).
+
+``batch`` runs many subcommands in one interpreter over one shared
+``CoreAPIClient``, so the harness pays venv resolution, imports and the
+connection handshake once. Input is JSON lines (a file, or stdin), each
+``{"id": ..., "argv": [...]}`` or a bare argv list. Entries run
+concurrently; ``"after": [ids]`` orders them, and an argv item
+``${id.KEY}`` takes the KEY an earlier entry printed (implying ``after``).
+Output is the same ``KEY=value`` lines, in input order, optionally
+renamed with ``"prefix"``, then ``BATCH_FAILED=<ids>``::
+
+    python three_tier_assertions.py batch --core-url "$CORE_URL" <<'EOF'
+    {"id": "triage", "prefix": "TRIAGE_", "argv": ["wait-verdict-type", "triage"]}
+    {"id": "case", "argv": ["wait-case", "--service", "fraud-detect"]}
+    {"id": "lineage", "argv": ["assert-lineage", "${triage.VERDICT_ID}", "vrd-1"]}
+    EOF
 """
 from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
+import contextvars
 import datetime as dt
 import inspect
+import io
+import json
+import re
 import sys
+import time
 from typing import Any, NoReturn
 
+from _bench_util import percentile
 from nthlayer_common.api_client import APIResult, CoreAPIClient
 
 # --- helpers ----------------------------------------------------------------
@@ -32,6 +54,26 @@ def _parse_iso(ts: str) -> dt.datetime:
     return dt.datetime.fromisoformat(ts.replace("Z", "+00:00"))
 
 
+async def _subscribe(client: CoreAPIClient, stream: str | None, filters: dict[str, Any]):
+    """Core's change feed for ``stream`` as an open async iterator, or None.
+
+    Feature-detected: ``CoreAPIClient.subscribe(stream, **filters)`` yields
+    one notification per new row (SSE, or long-poll on a ``since`` cursor).
+    When it is a coroutine, its result is awaited, which returns once the
+    feed is open. Clients and cores without it fall back to adaptive polling.
+    """
+    subscribe = getattr(client, "subscribe", None)
+    if stream is None or subscribe is None:
+        return None
+    try:
+        changes = subscribe(stream, **{k: v for k, v in filters.items() if v is not None})
+        if inspect.isawaitable(changes):
+            changes = await changes
+    except Exception:   # NotImplementedError, or a 404/405 from a core without the feed
+        return None
+    return changes
+
+
 async def _poll(
     client: CoreAPIClient,
     *,
@@ -40,35 +82,158 @@ async def _poll(
     predicate,
     timeout_seconds: float,
     interval_seconds: float,
+    min_interval_seconds: float = 0.1,
+    stream: str | None = None,
+    filters: dict[str, Any] | None = None,
 ):
-    """Poll ``fetch`` until ``predicate(result)`` is truthy or timeout.
+    """Wait until ``predicate(result)`` is truthy or timeout.
 
     Returns the predicate's truthy result, or raises TimeoutError. ``fetch``
     is an async callable taking the client; ``predicate`` takes the
     APIResult-derived value and returns either falsy or the value to return.
+
+    With a core change feed for ``stream`` (see ``_subscribe``), ``fetch``
+    re-runs once per notification, so a wait ends as soon as the row lands.
+    Otherwise ``fetch`` is polled from ``min_interval_seconds``, doubling up
+    to ``interval_seconds`` while the response is unchanged and snapping
+    back to the fast rate when it changes.
     """
-    deadline = _now_utc() + dt.timedelta(seconds=timeout_seconds)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_seconds
     last_status: Any = None
+    last_data: Any = None
     attempts = 0
-    while _now_utc() < deadline:
+
+    async def check():
+        nonlocal attempts, last_status, last_data
         attempts += 1
         result = await fetch(client)
         last_status = getattr(result, "status_code", None)
+        changed = getattr(result, "data", None) != last_data
+        last_data = getattr(result, "data", None)
         if getattr(result, "ok", False):
-            hit = predicate(result)
+            return predicate(result), changed
+        return None, changed
+
+    # The feed only signals rows written after it opens, so it is opened
+    # before the first fetch: a row committed in between is then either
+    # seen by that fetch or signalled by the feed.
+    mode = "poll"
+    changes = await _subscribe(client, stream, filters or {})
+    if changes is not None:
+        mode = "push"
+
+        def arm():
+            """Pull the next notification; None once the feed cannot be read."""
+            nonlocal mode
+            try:
+                return asyncio.ensure_future(anext(changes))
+            except Exception:  # not an async iterator, or __anext__ failed outright
+                mode = "push→poll"
+                return None
+
+        # Start pulling straight away so a lazily-connecting iterator opens
+        # its feed concurrently with the first fetch.
+        pending = arm()
+        try:
+            hit, _ = await check()
+            while not hit and pending is not None and (remaining := deadline - loop.time()) > 0:
+                done, _ = await asyncio.wait({pending}, timeout=remaining)
+                if not done:
+                    break
+                try:
+                    pending.result()
+                except Exception:  # feed unavailable or dropped: poll for the rest
+                    mode = "push→poll"
+                    break
+                pending = arm()
+                hit, _ = await check()
             if hit:
                 return hit
-        await asyncio.sleep(interval_seconds)
+        finally:
+            if pending is not None:
+                pending.cancel()
+                with contextlib.suppress(BaseException):
+                    await pending
+            aclose = getattr(changes, "aclose", None)
+            if aclose is not None:
+                with contextlib.suppress(Exception):
+                    await aclose()
+    else:
+        hit, _ = await check()
+        if hit:
+            return hit
+
+    delay = min(min_interval_seconds, interval_seconds)
+    while (remaining := deadline - loop.time()) > 0:
+        await asyncio.sleep(min(delay, remaining))
+        hit, changed = await check()
+        if hit:
+            return hit
+        delay = (min(min_interval_seconds, interval_seconds) if changed
+                 else min(delay * 2, interval_seconds))
     raise TimeoutError(
         f"{description}: timed out after {timeout_seconds:.0f}s "
-        f"({attempts} attempts; last status={last_status})"
+        f"({attempts} attempts via {mode}; last status={last_status})"
     )
 
 
+class _BatchEntry:
+    """One ``batch`` line: its argv, captured output and printed KEY=values."""
+
+    def __init__(self, index: int, entry_id: str, argv: list[str], prefix: str,
+                 after: set[str]):
+        self.index = index
+        self.id = entry_id
+        self.argv = argv
+        self.prefix = prefix
+        self.after = after
+        self.stdout = io.StringIO()
+        self.stderr = io.StringIO()
+        self.values: dict[str, str] = {}
+        self.ok = False
+
+
+# The batch entry the running task belongs to; None outside ``batch``.
+_BATCH_ENTRY: contextvars.ContextVar[_BatchEntry | None] = contextvars.ContextVar(
+    "batch_entry", default=None
+)
+
+
+class _TaskStream(io.TextIOBase):
+    """sys.stdout / sys.stderr stand-in writing to the current batch entry's buffer."""
+
+    def __init__(self, name: str, real):
+        self._name = name
+        self._real = real
+
+    def write(self, text: str) -> int:
+        entry = _BATCH_ENTRY.get()
+        return (getattr(entry, self._name) if entry is not None else self._real).write(text)
+
+    def flush(self) -> None:
+        self._real.flush()
+
+
+@contextlib.asynccontextmanager
+async def _core_client(args: argparse.Namespace):
+    """The batch's shared client for ``args.core_url``, or a fresh one."""
+    shared = getattr(args, "shared_client", None)
+    if shared is not None:
+        yield shared
+        return
+    async with CoreAPIClient(base_url=args.core_url) as client:
+        yield client
+
+
 def _print_kv(**pairs: Any) -> None:
     """Print KEY=value lines suitable for ``eval`` or ``source`` in bash."""
+    entry = _BATCH_ENTRY.get()
+    if entry is not None:
+        entry.values.update((key, str(value)) for key, value in pairs.items())
+    prefix = entry.prefix if entry is not None else ""
     for key, value in pairs.items():
-        print(f"{key}={value}")
+        print(f"{prefix}{key}={value}")
 
 
 def _fail(message: str) -> NoReturn:
@@ -80,7 +245,7 @@ def _fail(message: str) -> NoReturn:
 
 async def cmd_wait_heartbeat(args: argparse.Namespace) -> None:
     """Poll /heartbeats until at least one entry exists for the named component."""
-    async with CoreAPIClient(base_url=args.core_url) as client:
+    async with _core_client(args) as client:
         async def fetch(c):
             return await c.get_heartbeats()
 
@@ -98,6 +263,9 @@ async def cmd_wait_heartbeat(args: argparse.Namespace) -> None:
             predicate=predicate,
             timeout_seconds=args.timeout,
             interval_seconds=args.interval,
+            min_interval_seconds=args.min_interval,
+            stream="heartbeats",
+            filters={"component": args.component},
         )
     _print_kv(
         HEARTBEAT_COMPONENT=row.get("component", ""),
@@ -107,9 +275,10 @@ async def cmd_wait_heartbeat(args: argparse.Namespace) -> None:
 
 async def cmd_wait_verdict_type(args: argparse.Namespace) -> None:
     """Poll /verdicts?type=X until at least one verdict matches."""
-    async with CoreAPIClient(base_url=args.core_url) as client:
+    async with _core_client(args) as client:
         async def fetch(c):
-            return await c.get_verdicts(verdict_type=args.verdict_type, service=args.service, limit=50)
+            # Only the newest row is inspected, so fetch only that.
+            return await c.get_verdicts(verdict_type=args.verdict_type, service=args.service, limit=1)
 
         def predicate(result: APIResult):
             rows = result.data or []
@@ -122,6 +291,9 @@ async def cmd_wait_verdict_type(args: argparse.Namespace) -> None:
             predicate=predicate,
             timeout_seconds=args.timeout,
             interval_seconds=args.interval,
+            min_interval_seconds=args.min_interval,
+            stream="verdicts",
+            filters={"verdict_type": args.verdict_type, "service": args.service},
         )
     _print_kv(
         VERDICT_ID=verdict.get("id", ""),
@@ -131,9 +303,9 @@ async def cmd_wait_verdict_type(args: argparse.Namespace) -> None:
 
 
 async def cmd_wait_assessment_kind(args: argparse.Namespace) -> None:
-    async with CoreAPIClient(base_url=args.core_url) as client:
+    async with _core_client(args) as client:
         async def fetch(c):
-            return await c.get_assessments(kind=args.kind, service=args.service, limit=50)
+            return await c.get_assessments(kind=args.kind, service=args.service, limit=1)
 
         def predicate(result: APIResult):
             rows = result.data or []
@@ -146,6 +318,9 @@ async def cmd_wait_assessment_kind(args: argparse.Namespace) -> None:
             predicate=predicate,
             timeout_seconds=args.timeout,
             interval_seconds=args.interval,
+            min_interval_seconds=args.min_interval,
+            stream="assessments",
+            filters={"kind": args.kind, "service": args.service},
         )
     _print_kv(
         ASSESSMENT_ID=assessment.get("id", ""),
@@ -155,9 +330,9 @@ async def cmd_wait_assessment_kind(args: argparse.Namespace) -> None:
 
 
 async def cmd_wait_case(args: argparse.Namespace) -> None:
-    async with CoreAPIClient(base_url=args.core_url) as client:
+    async with _core_client(args) as client:
         async def fetch(c):
-            return await c.get_cases(service=args.service, limit=50)
+            return await c.get_cases(service=args.service, limit=1)
 
         def predicate(result: APIResult):
             rows = result.data or []
@@ -170,6 +345,9 @@ async def cmd_wait_case(args: argparse.Namespace) -> None:
             predicate=predicate,
             timeout_seconds=args.timeout,
             interval_seconds=args.interval,
+            min_interval_seconds=args.min_interval,
+            stream="cases",
+            filters={"service": args.service},
         )
     _print_kv(
         CASE_ID=case.get("id", ""),
@@ -186,7 +364,7 @@ async def cmd_assert_lineage(args: argparse.Namespace) -> None:
     and asserts ``parent_id`` is in the returned list. This catches the
     regression class where lineage has the right verdict types but wrong IDs.
     """
-    async with CoreAPIClient(base_url=args.core_url) as client:
+    async with _core_client(args) as client:
         result = await client.get_ancestors(args.child_id, max_hops=args.max_hops)
         if not result.ok:
             _fail(
@@ -212,7 +390,7 @@ async def cmd_fetch_case_via_bench(args: argparse.Namespace) -> None:
     """
     from nthlayer_bench.sre.case_bench import fetch_case_bench
 
-    async with CoreAPIClient(base_url=args.core_url) as client:
+    async with _core_client(args) as client:
         view = await fetch_case_bench(client, state=args.state, limit=args.limit)
     if not view.flat:
         _fail(
@@ -241,12 +419,18 @@ async def cmd_render_portfolio(args: argparse.Namespace) -> None:
     Pattern (b) per opensrm-42y.16 audit: poll worker-emitted assessments
     rather than invoking observe CLI on demand. The renderer is read-only
     against core's HTTP API.
+
+    ``--timings`` writes a latency breakdown to stderr (the table on stdout
+    is unchanged) so render time can be tracked against portfolio size.
     """
+    started = time.perf_counter()
+    slo_seconds: list[float] = []
     try:
-        async with CoreAPIClient(base_url=args.core_url) as client:
+        async with _core_client(args) as client:
             port_result = await client.get_assessments(
                 kind="portfolio_status", limit=1,
             )
+            portfolio_seconds = time.perf_counter() - started
             if not port_result.ok:
                 print(
                     f"  (portfolio_status fetch failed: {port_result.error})",
@@ -263,16 +447,61 @@ async def cmd_render_portfolio(args: argparse.Namespace) -> None:
             # Per-service slo_status fetches. Avoids the truncation risk of
             # a single bulk limit=N query when one noisy service's SLOs
             # could evict another service's latest reading past the page
-            # boundary. For demo-scale portfolios (≤ tens of services), the
-            # extra HTTP calls cost milliseconds.
-            per_svc_worst: dict[str, float] = {}
-            for s in services:
-                svc = s.get("service") or ""
-                if not svc:
+            # boundary. The fetches fan out over the shared client, at most
+            # --concurrency in flight, so portfolios of hundreds of
+            # services render in a few round trips rather than hundreds.
+            gate = asyncio.Semaphore(max(args.concurrency, 1))
+
+            async def fetch_slos(svc: str):
+                async with gate:
+                    t0 = time.perf_counter()
+                    try:
+                        return await asyncio.wait_for(
+                            client.get_assessments(service=svc, kind="slo_status", limit=50),
+                            args.request_timeout,
+                        )
+                    except TimeoutError:
+                        return None
+                    finally:
+                        slo_seconds.append(time.perf_counter() - t0)
+
+            names = [s.get("service") or "" for s in services]
+            names = [svc for svc in dict.fromkeys(names) if svc]
+            fanout_started = time.perf_counter()
+            # Cores with the latest-per-(service, kind, slo_name) index
+            # answer the whole portfolio in one query, however deep each
+            # SLO's history; older cores get the per-service fan-out.
+            rows_by_svc = await _latest_slo_status(client, names, args.request_timeout)
+            mode = "latest-index"
+            if rows_by_svc is None:
+                mode = "fan-out"
+                rows_by_svc = {}
+                # return_exceptions: one service's transport error is
+                # reported against that service, not the whole render.
+                slo_results = await asyncio.gather(*(fetch_slos(svc) for svc in names),
+                                                   return_exceptions=True)
+            else:
+                slo_results = []
+            fanout_seconds = time.perf_counter() - fanout_started
+            if mode == "latest-index":
+                slo_seconds.append(fanout_seconds)
+
+            fanned_out = zip(names, slo_results, strict=True) if mode == "fan-out" else ()
+            for svc, slo_result in fanned_out:
+                if isinstance(slo_result, Exception):
+                    print(
+                        f"  (slo_status fetch failed for {svc}: "
+                        f"{slo_result.__class__.__name__}: {slo_result})",
+                        file=sys.stderr,
+                    )
+                    continue
+                if slo_result is None:
+                    print(
+                        f"  (slo_status fetch timed out for {svc} after "
+                        f"{args.request_timeout:g}s)",
+                        file=sys.stderr,
+                    )
                     continue
-                slo_result = await client.get_assessments(
-                    service=svc, kind="slo_status", limit=50,
-                )
                 if not slo_result.ok:
                     # Partial failure: surface to stderr so the empty row
                     # is distinguishable from "no slo_status yet." The
@@ -283,10 +512,14 @@ async def cmd_render_portfolio(args: argparse.Namespace) -> None:
                         file=sys.stderr,
                     )
                     continue
+                rows_by_svc[svc] = slo_result.data or []
+
+            per_svc_worst: dict[str, float] = {}
+            for svc, rows in rows_by_svc.items():
                 # Assessments are ordered created_at DESC, so the first
                 # occurrence of each slo_name in the response is its latest.
                 seen: set[str] = set()
-                for a in (slo_result.data or []):
+                for a in rows:
                     d = a.get("data", {}) or {}
                     slo_name = d.get("slo_name", "?")
                     if slo_name in seen:
@@ -321,6 +554,16 @@ async def cmd_render_portfolio(args: argparse.Namespace) -> None:
                 f"{data.get('critical_count', 0)} critical / "
                 f"{data.get('exhausted_count', 0)} exhausted)"
             )
+        if args.timings:
+            _print_render_timings(
+                services=len(names),
+                total=time.perf_counter() - started,
+                portfolio=portfolio_seconds,
+                fanout=fanout_seconds,
+                per_request=slo_seconds,
+                concurrency=args.concurrency,
+                mode=mode,
+            )
     except Exception as exc:
         # Demo helper: a connection error or unexpected payload must
         # not bubble a Python traceback into the demo terminal. Single
@@ -331,6 +574,79 @@ async def cmd_render_portfolio(args: argparse.Namespace) -> None:
         )
 
 
+def _accepts_params(method, *names: str) -> bool:
+    """Whether ``method`` takes every keyword in ``names`` (older clients do not)."""
+    try:
+        params = inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return False
+    return all(name in params for name in names)
+
+
+async def _latest_slo_status(client: CoreAPIClient, services: list[str],
+                             timeout: float) -> dict[str, list] | None:
+    """Latest slo_status per (service, slo_name) in one request, or None.
+
+    Feature-detected: ``CoreAPIClient.get_latest_assessments(kind=...,
+    services=[...])`` serves core's latest-per-key index. None (client
+    without it, failed request, timeout) means "use the per-service
+    fan-out"; a failed request (rather than a missing feature) is noted on
+    stderr once per process. A TypeError from inside the client is a bug,
+    not a missing feature, and propagates.
+    """
+    latest = getattr(client, "get_latest_assessments", None)
+    if latest is None or not _accepts_params(latest, "kind", "services"):
+        return None
+    try:
+        result = await asyncio.wait_for(latest(kind="slo_status", services=services), timeout)
+    except TypeError:
+        raise
+    except TimeoutError:
+        _note_latest_fallback(f"timed out after {timeout:g}s")
+        return None
+    except Exception as exc:   # HTTP / transport error from the client
+        _note_latest_fallback(f"{exc.__class__.__name__}: {exc}")
+        return None
+    if not getattr(result, "ok", False):
+        _note_latest_fallback(getattr(result, "error", None) or "request failed")
+        return None
+    rows_by_svc: dict[str, list] = {svc: [] for svc in services}
+    for row in result.data or []:
+        if row.get("service") in rows_by_svc:
+            rows_by_svc[row["service"]].append(row)
+    return rows_by_svc
+
+
+_latest_fallback_noted = False
+
+
+def _note_latest_fallback(reason: str) -> None:
+    """One stderr line the first time the latest-index query fails."""
+    global _latest_fallback_noted
+    if _latest_fallback_noted:
+        return
+    _latest_fallback_noted = True
+    print(f"  (latest slo_status query failed: {reason}; using per-service fan-out)",
+          file=sys.stderr)
+
+
+def _print_render_timings(*, services: int, total: float, portfolio: float, fanout: float,
+                          per_request: list[float], concurrency: int, mode: str) -> None:
+    """render-portfolio --timings: one stderr line per stage, milliseconds."""
+    def pct(q: float) -> float:
+        return percentile(per_request, q, default=0.0) * 1000
+
+    print(
+        f"  timings: services={services} mode={mode} concurrency={concurrency} "
+        f"total={total * 1000:.1f}ms portfolio_status={portfolio * 1000:.1f}ms "
+        f"slo_status={fanout * 1000:.1f}ms "
+        f"(requests={len(per_request)}, serial sum={sum(per_request) * 1000:.1f}ms, "
+        f"per request p50={pct(50):.1f}ms p95={pct(95):.1f}ms max={pct(100):.1f}ms) "
+        f"render={(total - portfolio - fanout) * 1000:.1f}ms",
+        file=sys.stderr,
+    )
+
+
 def cmd_assert_latency(args: argparse.Namespace) -> None:
     """Assert (end - start) ≤ ``max_seconds``.
 
@@ -352,73 +668,429 @@ def cmd_assert_latency(args: argparse.Namespace) -> None:
     _print_kv(LATENCY_SECONDS=f"{delta:.1f}", LATENCY_OK="true")
 
 
+def _parse_since(value: str) -> dt.datetime:
+    """ISO 8601 timestamp, or a look-back like ``90s`` / ``30m`` / ``6h`` / ``2d``."""
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smhd])", value.strip())
+    if match:
+        seconds = float(match.group(1)) * {"s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+        return _now_utc() - dt.timedelta(seconds=seconds)
+    return _parse_iso(value)
+
+
+def _parent_ids(verdict: dict) -> list[str]:
+    """A lineage row's parents: ``parent_ids``, or ``data.parent_ids`` on snapshots."""
+    return list(verdict.get("parent_ids") or (verdict.get("data") or {}).get("parent_ids") or [])
+
+
+def _case_stages(case: dict, ancestors: list[dict], root: str) -> dict | None:
+    """Time per lineage hop from the root quality_breach to ``case``.
+
+    Walks ``parent_ids`` back from the case's underlying verdict, so every
+    hop is a real parent edge on one chain (quality_breach →
+    correlation_snapshot → ... → triage). When the underlying verdict is
+    not among ``ancestors``, the walk starts from the ancestors no other
+    ancestor names as a parent. Each stage is named ``<from>→<to>``; the
+    last one ends at the case itself. Returns None when no quality_breach
+    is reachable.
+    """
+    by_id = {a["id"]: a for a in ancestors if a.get("id")}
+    head = by_id.get(case.get("underlying_verdict"))
+    if head is not None:
+        frontier = [head["id"]]
+    else:
+        named = {pid for a in by_id.values() for pid in _parent_ids(a)}
+        frontier = [vid for vid in by_id if vid not in named]
+    child_of: dict[str, str | None] = dict.fromkeys(frontier)
+    while frontier:   # breadth-first, so each verdict keeps its shortest route to the head
+        nxt = []
+        for vid in frontier:
+            for pid in _parent_ids(by_id[vid]):
+                if pid in by_id and pid not in child_of:
+                    child_of[pid] = vid
+                    nxt.append(pid)
+        frontier = nxt
+
+    breaches = [by_id[vid] for vid in child_of
+                if by_id[vid].get("type") == "quality_breach" and by_id[vid].get("created_at")]
+    same_service = [a for a in breaches if a.get("service") == case.get("service")]
+    breaches = same_service or breaches
+    if not breaches:
+        return None
+    pick = min if root == "earliest" else max
+    start = pick(breaches, key=lambda a: _parse_iso(a["created_at"]))
+    start_at = _parse_iso(start["created_at"])
+    hops: list[tuple[str, dt.datetime]] = []
+    vid: str | None = start["id"]
+    while vid is not None:
+        verdict = by_id[vid]
+        if verdict.get("created_at"):
+            hops.append((verdict.get("type") or "?", _parse_iso(verdict["created_at"])))
+        vid = child_of[vid]
+    hops.append(("case", _parse_iso(case["created_at"])))
+    stages: dict[str, float] = {}
+    for (a, ta), (b, tb) in zip(hops, hops[1:], strict=False):
+        stages[f"{a}→{b}"] = stages.get(f"{a}→{b}", 0.0) + (tb - ta).total_seconds()
+    return {"case_id": case.get("id", ""), "service": case.get("service", "") or "",
+            "root_breach_id": start.get("id", ""),
+            "total_seconds": (hops[-1][1] - start_at).total_seconds(), "stages": stages}
+
+
+CASES_PAGE = 100   # first /cases page when the client cannot filter by time
+
+
+async def _cases_in_window(client: CoreAPIClient, service: str | None,
+                           since: dt.datetime | None, until: dt.datetime | None,
+                           limit: int) -> list[dict]:
+    """Up to ``limit`` cases, newest first, covering [since, until] where possible.
+
+    Feature-detected: the bounds go to ``get_cases(since=..., until=...)``
+    so core filters them. A client without those parameters gets widening
+    pages of the most recent cases instead, until one reaches back before
+    ``since``. Either way, hitting ``limit`` before the window is covered
+    is noted on stderr, since older cases in it are then left out.
+    """
+    bounds = {key: value.isoformat() for key, value in (("since", since), ("until", until))
+              if value is not None}
+    if bounds and _accepts_params(client.get_cases, "since", "until"):
+        rows = _case_rows(await client.get_cases(service=service, limit=limit, **bounds))
+        if len(rows) >= limit:
+            _note_case_limit(limit)
+        return rows
+    page = limit if since is None else min(CASES_PAGE, limit)
+    while True:
+        rows = _case_rows(await client.get_cases(service=service, limit=page))
+        created = [_parse_iso(row["created_at"]) for row in rows if row.get("created_at")]
+        reached = since is not None and bool(created) and min(created) < since
+        if reached or len(rows) < page or page >= limit:
+            break
+        page = min(page * 4, limit)
+    if len(rows) >= limit and not reached:
+        _note_case_limit(limit)
+    return rows
+
+
+def _case_rows(result) -> list[dict]:
+    if not result.ok:
+        _fail(f"GET /cases failed: status={result.status_code} "
+              f"error={getattr(result, 'error', None)!r}")
+    return list(result.data or [])
+
+
+def _note_case_limit(limit: int) -> None:
+    print(f"  (--limit {limit} reached before the start of the window; "
+          f"older cases are not included)", file=sys.stderr)
+
+
+async def cmd_latency_report(args: argparse.Namespace) -> None:
+    """Per-stage pipeline latency across cases, attributed from verdict lineage.
+
+    For every case created in [--since, --until], walks the parent edges of
+    its underlying verdict back to the root quality_breach and splits
+    ``case.created_at - quality_breach.created_at`` (the span
+    ``assert-latency`` budgets) into one duration per lineage hop. Prints
+    p50/p95/p99/max per stage as a table; ``--json`` also writes every
+    case's breakdown. Time upstream of the breach (Prometheus windows,
+    measure's own cycle) has no verdict to anchor it and is not included.
+    """
+    since = _parse_since(args.since) if args.since else None
+    until = _parse_iso(args.until) if args.until else None
+    async with _core_client(args) as client:
+        rows = await _cases_in_window(client, args.service, since, until, args.limit)
+        cases = []
+        for case in rows:
+            if not case.get("created_at") or not case.get("underlying_verdict"):
+                continue
+            at = _parse_iso(case["created_at"])
+            if (since is None or at >= since) and (until is None or at <= until):
+                cases.append(case)
+
+        gate = asyncio.Semaphore(max(args.concurrency, 1))
+
+        # The underlying verdict (triage) is not its own ancestor; with a
+        # client that can fetch one verdict it becomes the last hop before
+        # the case, otherwise its time folds into the final stage.
+        get_verdict = getattr(client, "get_verdict", None)
+
+        async def lineage(case: dict) -> list[dict]:
+            async with gate:
+                anc = await client.get_ancestors(case["underlying_verdict"],
+                                                 max_hops=args.max_hops)
+                rows = list(anc.data or []) if anc.ok else []
+                if get_verdict is not None:
+                    head = await get_verdict(case["underlying_verdict"])
+                    if head.ok and head.data:
+                        rows.append(head.data)
+                return rows
+
+        lineages = await asyncio.gather(*(lineage(case) for case in cases))
+
+    breakdowns, skipped = [], []
+    for case, rows in zip(cases, lineages, strict=True):
+        row = _case_stages(case, rows, args.root)
+        if row is None:
+            skipped.append(case.get("id", ""))
+            continue
+        breakdowns.append(row)
+
+    stage_names: list[str] = []
+    for row in breakdowns:
+        for name in row["stages"]:
+            if name not in stage_names:
+                stage_names.append(name)
+    summary = []
+    for name in [*stage_names, "total"]:
+        samples = [row["total_seconds"] if name == "total" else row["stages"][name]
+                   for row in breakdowns if name == "total" or name in row["stages"]]
+        summary.append({"stage": name, "cases": len(samples),
+                        "p50": percentile(samples, 50), "p95": percentile(samples, 95),
+                        "p99": percentile(samples, 99),
+                        "max": max(samples) if samples else None})
+    over = [row["case_id"] for row in breakdowns
+            if args.max_seconds is not None and row["total_seconds"] > args.max_seconds]
+
+    print(f"  pipeline latency over {len(breakdowns)} case(s) "
+          f"(seconds, from root quality_breach; root={args.root}):")
+    print(f"  {'stage':<42} {'cases':>5} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for entry in summary:
+        cells = " ".join(f"{entry[k]:>8.1f}" if entry[k] is not None else f"{'-':>8}"
+                         for k in ("p50", "p95", "p99", "max"))
+        print(f"  {entry['stage'][:42]:<42} {entry['cases']:>5} {cells}")
+    if skipped:
+        print(f"  ({len(skipped)} case(s) without a quality_breach in lineage skipped)",
+              file=sys.stderr)
+    if args.max_seconds is not None:
+        print(f"  {len(over)} case(s) over the {args.max_seconds:g}s budget")
+    if args.json:
+        report = {"since": since.isoformat() if since else None,
+                  "until": until.isoformat() if until else None, "root": args.root,
+                  "budget_seconds": args.max_seconds, "summary": summary,
+                  "over_budget": over, "skipped": skipped, "cases": breakdowns}
+        with open(args.json, "w") as fh:
+            json.dump(report, fh, indent=2)
+
+
+# --- batch mode -------------------------------------------------------------
+
+_PLACEHOLDER = re.compile(r"\$\{([^.}]+)\.([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def _load_batch(lines) -> list[_BatchEntry]:
+    """Parse JSON-lines batch input; ValueError names the offending line."""
+    entries: list[_BatchEntry] = []
+    seen: set[str] = set()
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"batch line {lineno}: {exc}") from None
+        if isinstance(item, list):
+            item = {"argv": item}
+        argv = item.get("argv") if isinstance(item, dict) else None
+        if not argv or not all(isinstance(a, str) for a in argv):
+            raise ValueError(f"batch line {lineno}: expected an argv list of strings")
+        if argv[0] not in _HANDLERS or argv[0] == "batch":
+            raise ValueError(f"batch line {lineno}: unknown subcommand {argv[0]!r}")
+        entry_id = str(item.get("id", len(entries) + 1))
+        after = {str(a) for a in item.get("after", [])}
+        after |= {m.group(1) for a in argv for m in _PLACEHOLDER.finditer(a)}
+        if entry_id in seen or not after <= seen:
+            raise ValueError(f"batch line {lineno}: duplicate id {entry_id!r} or reference "
+                             f"to an id not defined above it ({sorted(after - seen)})")
+        seen.add(entry_id)
+        entries.append(_BatchEntry(len(entries), entry_id, argv, str(item.get("prefix", "")),
+                                   after))
+    return entries
+
+
+async def cmd_batch(args: argparse.Namespace) -> None:
+    """Run JSON-lines subcommands concurrently over shared CoreAPIClients."""
+    # Entries without their own --core-url (in either form) get the batch's.
+    parser = _build_parser(core_url=args.core_url)
+    if args.file == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(args.file) as fh:
+            lines = fh.read().splitlines()
+    try:
+        entries = _load_batch(lines)
+    except ValueError as exc:
+        _fail(str(exc))
+    by_id = {entry.id: entry for entry in entries}
+
+    clients: dict[str, CoreAPIClient] = {}
+    client_lock = asyncio.Lock()
+    tasks: dict[str, asyncio.Task] = {}
+
+    async def run(entry: _BatchEntry, stack: contextlib.AsyncExitStack) -> bool:
+        for dep in entry.after:
+            await tasks[dep]
+        _BATCH_ENTRY.set(entry)
+        failed = sorted(dep for dep in entry.after if not by_id[dep].ok)
+        if failed:
+            print(f"{entry.id}: skipped, {', '.join(failed)} failed", file=sys.stderr)
+            return False
+        argv = [_PLACEHOLDER.sub(lambda m: by_id[m.group(1)].values.get(m.group(2), ""), a)
+                for a in entry.argv]
+        try:
+            sub = parser.parse_args(argv)
+            if hasattr(sub, "core_url"):
+                async with client_lock:
+                    if sub.core_url not in clients:
+                        clients[sub.core_url] = await stack.enter_async_context(
+                            CoreAPIClient(base_url=sub.core_url))
+                sub.shared_client = clients[sub.core_url]
+            handler = _HANDLERS[sub.cmd]
+            if inspect.iscoroutinefunction(handler):
+                await handler(sub)
+            else:
+                handler(sub)
+            entry.ok = True
+        except SystemExit as exc:
+            entry.ok = exc.code in (0, None)
+        except TimeoutError as exc:
+            print(str(exc), file=sys.stderr)
+        except Exception as exc:
+            print(f"{entry.id}: {exc.__class__.__name__}: {exc}", file=sys.stderr)
+        return entry.ok
+
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    sys.stdout = _TaskStream("stdout", real_stdout)
+    sys.stderr = _TaskStream("stderr", real_stderr)
+    try:
+        async with contextlib.AsyncExitStack() as stack:
+            for entry in entries:
+                tasks[entry.id] = asyncio.create_task(run(entry, stack))
+            # Stream results in input order as soon as each prefix completes.
+            for entry in entries:
+                await tasks[entry.id]
+                real_stdout.write(entry.stdout.getvalue())
+                real_stderr.write(entry.stderr.getvalue())
+                real_stdout.flush()
+    finally:
+        sys.stdout, sys.stderr = real_stdout, real_stderr
+    failed = [entry.id for entry in entries if not entry.ok]
+    _print_kv(BATCH_FAILED=",".join(failed))
+    if failed:
+        sys.exit(1)
+
+
 # --- argparse wiring --------------------------------------------------------
 
-def _add_common(parser: argparse.ArgumentParser, *, with_poll: bool = True) -> None:
-    parser.add_argument("--core-url", default="http://localhost:8000")
+DEFAULT_CORE_URL = "http://localhost:8000"
+
+
+def _add_common(parser: argparse.ArgumentParser, *, core_url: str = DEFAULT_CORE_URL,
+                with_poll: bool = True) -> None:
+    parser.add_argument("--core-url", default=core_url)
     if with_poll:
         parser.add_argument("--timeout", type=float, default=30.0,
                             help="poll timeout in seconds")
         parser.add_argument("--interval", type=float, default=1.0,
-                            help="poll interval in seconds")
+                            help="longest poll interval in seconds (polls back off to it)")
+        parser.add_argument("--min-interval", type=float, default=0.1,
+                            help="first poll interval in seconds, and the rate "
+                                 "after a change")
 
 
-def main(argv: list[str] | None = None) -> int:
+def _build_parser(core_url: str = DEFAULT_CORE_URL) -> argparse.ArgumentParser:
+    """The CLI parser; ``core_url`` is the --core-url default (batch passes its own)."""
     parser = argparse.ArgumentParser(prog="three_tier_assertions")
     sub = parser.add_subparsers(dest="cmd", required=True)
 
     p = sub.add_parser("wait-heartbeat")
-    _add_common(p)
+    _add_common(p, core_url=core_url)
     p.add_argument("--component", default=None,
                    help="filter by component name (e.g. observe.collect, measure)")
 
     p = sub.add_parser("wait-verdict-type")
-    _add_common(p)
+    _add_common(p, core_url=core_url)
     p.add_argument("verdict_type")
     p.add_argument("--service", default=None)
 
     p = sub.add_parser("wait-assessment-kind")
-    _add_common(p)
+    _add_common(p, core_url=core_url)
     p.add_argument("kind")
     p.add_argument("--service", default=None)
 
     p = sub.add_parser("wait-case")
-    _add_common(p)
+    _add_common(p, core_url=core_url)
     p.add_argument("--service", default=None)
 
     p = sub.add_parser("assert-lineage")
-    _add_common(p, with_poll=False)
+    _add_common(p, core_url=core_url, with_poll=False)
     p.add_argument("child_id")
     p.add_argument("parent_id")
     p.add_argument("--max-hops", type=int, default=None)
 
     p = sub.add_parser("fetch-case-via-bench")
-    _add_common(p, with_poll=False)
+    _add_common(p, core_url=core_url, with_poll=False)
     # Default state matches fetch_case_bench's own default — newly-emitted
     # cases land in "pending" before any operator picks them up.
     p.add_argument("--state", default="pending")
     p.add_argument("--limit", type=int, default=50)
 
     p = sub.add_parser("render-portfolio")
-    _add_common(p, with_poll=False)
+    _add_common(p, core_url=core_url, with_poll=False)
+    p.add_argument("--concurrency", type=int, default=16,
+                   help="slo_status fetches in flight at once")
+    p.add_argument("--request-timeout", type=float, default=10.0,
+                   help="per-fetch timeout in seconds; a timed-out service "
+                        "renders with budget N/A")
+    p.add_argument("--timings", action="store_true",
+                   help="print a render latency breakdown to stderr")
 
     p = sub.add_parser("assert-latency")
     p.add_argument("start", help="ISO 8601 timestamp")
     p.add_argument("end", help="ISO 8601 timestamp")
     p.add_argument("max_seconds", type=float)
 
-    args = parser.parse_args(argv)
-
-    handler = {
-        "wait-heartbeat": cmd_wait_heartbeat,
-        "wait-verdict-type": cmd_wait_verdict_type,
-        "wait-assessment-kind": cmd_wait_assessment_kind,
-        "wait-case": cmd_wait_case,
-        "assert-lineage": cmd_assert_lineage,
-        "fetch-case-via-bench": cmd_fetch_case_via_bench,
-        "render-portfolio": cmd_render_portfolio,
-        "assert-latency": cmd_assert_latency,
-    }[args.cmd]
+    p = sub.add_parser("latency-report",
+                       help="per-stage pipeline latency across cases, from verdict lineage")
+    _add_common(p, core_url=core_url, with_poll=False)
+    p.add_argument("--since", default=None,
+                   help="ISO 8601 timestamp or look-back (e.g. 30m, 6h); default: all")
+    p.add_argument("--until", default=None, help="ISO 8601 timestamp; default: now")
+    p.add_argument("--service", default=None)
+    p.add_argument("--limit", type=int, default=500,
+                   help="most cases to fetch, newest first; noted on stderr when it "
+                        "cuts the window short")
+    p.add_argument("--root", choices=("earliest", "latest"), default="earliest",
+                   help="which quality_breach in the lineage starts the clock")
+    p.add_argument("--max-hops", type=int, default=None)
+    p.add_argument("--max-seconds", type=float, default=None,
+                   help="count cases whose total exceeds this budget")
+    p.add_argument("--concurrency", type=int, default=16,
+                   help="ancestor lookups in flight at once")
+    p.add_argument("--json", metavar="PATH", default=None,
+                   help="also write the summary and per-case breakdown as JSON")
+
+    p = sub.add_parser("batch", help="run JSON-lines subcommands over one client")
+    _add_common(p, core_url=core_url, with_poll=False)
+    p.add_argument("file", nargs="?", default="-",
+                   help="JSON-lines file of subcommands (default: stdin)")
+    return parser
+
+
+_HANDLERS = {
+    "wait-heartbeat": cmd_wait_heartbeat,
+    "wait-verdict-type": cmd_wait_verdict_type,
+    "wait-assessment-kind": cmd_wait_assessment_kind,
+    "wait-case": cmd_wait_case,
+    "assert-lineage": cmd_assert_lineage,
+    "fetch-case-via-bench": cmd_fetch_case_via_bench,
+    "render-portfolio": cmd_render_portfolio,
+    "assert-latency": cmd_assert_latency,
+    "latency-report": cmd_latency_report,
+    "batch": cmd_batch,
+}
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    handler = _HANDLERS[args.cmd]
 
     try:
         if inspect.iscoroutinefunction(handler):
@@ -1,30 +1,55 @@
 #!/usr/bin/env python3
-"""Minimal webhook receiver for Alertmanager — logs payloads to stdout."""
+"""Minimal webhook receiver for Alertmanager — logs payloads to stdout.
 
+Requests are served by a bounded worker pool with HTTP/1.1 keep-alive
+(test/_pooled_http.py), so a burst of webhooks is acknowledged concurrently;
+only the stdout write is serialised (to keep pretty-printed payloads from
+interleaving).
+"""
+
+import argparse
 import json
 import sys
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+from http.server import ThreadingHTTPServer
+
+from _pooled_http import PooledHTTPServer, PooledRequestHandler
 
 PORT = 9999
 
+_print_lock = threading.Lock()
 
-class WebhookHandler(BaseHTTPRequestHandler):
+
+class WebhookHandler(PooledRequestHandler):
     def do_POST(self):
         length = int(self.headers.get("Content-Length", 0))
         body = self.rfile.read(length)
-        try:
-            payload = json.loads(body)
-            print(json.dumps(payload, indent=2), flush=True)
-        except json.JSONDecodeError:
-            print(f"[raw] {body.decode(errors='replace')}", flush=True)
+        # Acknowledge before formatting so Alertmanager is not held up by
+        # the indent=2 dump of a large grouped notification.
         self.send_response(200)
+        self.send_header("Content-Length", "0")
         self.end_headers()
+        try:
+            text = json.dumps(json.loads(body), indent=2)
+        except json.JSONDecodeError:
+            text = f"[raw] {body.decode(errors='replace')}"
+        with _print_lock:
+            print(text, flush=True)
 
     def log_message(self, fmt, *args):
         print(f"{self.address_string()} {fmt % args}", file=sys.stderr, flush=True)
 
 
 if __name__ == "__main__":
-    server = HTTPServer(("0.0.0.0", PORT), WebhookHandler)
-    print(f"Webhook receiver listening on port {PORT}", flush=True)
+    parser = argparse.ArgumentParser(description="Alertmanager webhook receiver")
+    parser.add_argument("--port", type=int, default=PORT, help=f"listen port (default: {PORT})")
+    parser.add_argument("--workers", type=int, default=8,
+                        help="HTTP worker threads (0 = one thread per connection, default: 8)")
+    args = parser.parse_args()
+
+    if args.workers > 0:
+        server = PooledHTTPServer(("0.0.0.0", args.port), WebhookHandler, args.workers)
+    else:
+        server = ThreadingHTTPServer(("0.0.0.0", args.port), WebhookHandler)
+    print(f"Webhook receiver listening on port {args.port}", flush=True)
     server.serve_forever()